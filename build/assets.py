@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Generates derived image assets from the source BMPs in images/.
+
+    images/sprites_atlas.bmp  the sprite frames listed in SPRITE_REGIONS (game/sprites.py)
+    images/2x/*.bmp           integer prescaled copies for large displays
+    images/native/**.bmp      copies of the images above with every tile turned
+                              a quarter counterclockwise, for PACMAN_NATIVE
+
+Maze tile images (images/<maze>_tiles.bmp) are generated by maze_compiler.py.
+Every image keeps only the colors it uses (index 0 stays first, for
+make_transparent(0)) and is written at the smallest depth that holds them,
+1, 2, 4 or 8 bits; its size and Bitmap RAM are printed.
+"""
+import argparse
+import ast
+from pathlib import Path
+
+from bmp import min_bits, read_bmp, size_report, used_colors, write_bmp
+from maze_compiler import parse_source, tiles_name
+
+ATLAS_IMAGE = "sprites_atlas.bmp"
+
+SCALED_IMAGES = [
+    ATLAS_IMAGE,
+]
+
+SCALE_FACTORS = [2]
+
+# Prescaled variants each device can draw (see SCALE in game/config.py): the
+# 320x240 display of the Wio Terminal is never twice the layout, a portrait
+# DVI display of the Fruit Jam can be. Both can draw the native variants.
+DEVICE_SCALE_FACTORS = {
+    "fruitjam": [1] + SCALE_FACTORS,
+    "wio": [1],
+}
+
+# Images turned for the native display orientation, with their tile size
+NATIVE_DIR = "native"
+NATIVE_TILE_SIZE = {
+    ATLAS_IMAGE: 16,
+}
+
+def scale_pixels(width:int, height:int, pixels:bytes, factor:int) -> bytes:
+    scaled = bytearray()
+    for y in range(height):
+        row = bytearray()
+        for value in pixels[y * width:(y + 1) * width]:
+            row += bytes((value,)) * factor
+        scaled += row * factor
+    return bytes(scaled)
+
+def module_literal(code_path:Path, name:str):
+    """Read the literal assigned to name in a game module without running it."""
+    for node in ast.parse(code_path.read_text()).body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == name for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"{code_path}: {name} not found")
+
+def sprite_regions(code_path:Path) -> list:
+    """Read the SPRITE_REGIONS literal from game/sprites.py."""
+    return module_literal(code_path, "SPRITE_REGIONS")
+
+def check_asset_priority(root_dir:Path, names:list) -> None:
+    """Fail if ASSET_PRIORITY of game/display.py lists a path that is not one of
+    the images names, which load_asset() would never be asked for."""
+    missing = [path for path in module_literal(root_dir / "game" / "display.py", "ASSET_PRIORITY")
+               if not (path.startswith("images/") and path[len("images/"):] in names and (root_dir / path).is_file())]
+    if missing:
+        raise ValueError(f"game/display.py: ASSET_PRIORITY lists images that are not built: {', '.join(missing)}")
+
+def build_atlas(image_dir:Path, regions:list) -> None:
+    """Pack the used 16x16 frames of sprites.bmp into a single column, in region order."""
+    width, height, pixels, palette = read_bmp(image_dir / "sprites.bmp")
+    atlas = bytearray()
+    for x, y, columns, rows in regions:
+        if x % 16 or y % 16 or x + columns * 16 > width or y + rows * 16 > height:
+            raise ValueError(f"sprite region {x},{y} {columns}x{rows} is not on the 16x16 sprite grid")
+        for frame_y in range(y, y + rows * 16, 16):
+            for frame_x in range(x, x + columns * 16, 16):
+                for row in range(frame_y, frame_y + 16):
+                    atlas += pixels[row * width + frame_x:row * width + frame_x + 16]
+    frames = len(atlas) // 256
+    atlas, used, _ = used_colors(bytes(atlas), palette)
+    size = write_bmp(image_dir / ATLAS_IMAGE, 16, frames * 16, atlas, used, min_bits(len(used)))
+    print(f"Packed {frames} sprite frames -> {ATLAS_IMAGE} "
+          f"({size_report(16, frames * 16, len(used), size, len(palette))})")
+
+def build_scaled(image_dir:Path, names:list) -> None:
+    for name in names:
+        width, height, pixels, palette = read_bmp(image_dir / name)
+        for factor in SCALE_FACTORS:
+            output = image_dir / f"{factor}x" / name
+            size = write_bmp(
+                output,
+                width * factor, height * factor,
+                scale_pixels(width, height, pixels, factor),
+                palette, min_bits(len(palette)),
+            )
+            print(f"Scaled {name} x{factor} -> {output.relative_to(image_dir.parent)} "
+                  f"({size_report(width * factor, height * factor, len(palette), size)})")
+
+def rotate_tiles(width:int, height:int, pixels:bytes, size:int) -> bytes:
+    """Turn each size x size tile of an image a quarter counterclockwise, in place,
+    so tile indices stay the same: pixel (x, y) of a tile moves to (y, size - 1 - x)."""
+    if width % size or height % size:
+        raise ValueError(f"{width}x{height} is not made of {size}x{size} tiles")
+    rotated = bytearray(len(pixels))
+    for y in range(height):
+        tile_y, v = divmod(y, size)
+        for x in range(width):
+            tile_x, u = divmod(x, size)
+            rotated[(tile_y * size + size - 1 - u) * width + tile_x * size + v] = pixels[y * width + x]
+    return bytes(rotated)
+
+def build_native(image_dir:Path, tile_sizes:dict) -> None:
+    """Write the turned copy of every image of tile_sizes and of its prescaled variants."""
+    for name, size in tile_sizes.items():
+        for factor in [1] + SCALE_FACTORS:
+            source = image_dir / name if factor == 1 else image_dir / f"{factor}x" / name
+            width, height, pixels, palette = read_bmp(source)
+            output = image_dir / NATIVE_DIR / source.relative_to(image_dir)
+            bits = min_bits(len(palette))
+            written = write_bmp(output, width, height, rotate_tiles(width, height, pixels, size * factor), palette, bits)
+            print(f"Turned {source.relative_to(image_dir.parent)} -> {output.relative_to(image_dir.parent)} "
+                  f"({size_report(width, height, len(palette), written)})")
+
+def maze_tile_images(maze_dir:Path) -> list:
+    """Tile image names generated for the maze sources."""
+    names = set()
+    for source in maze_dir.glob("*.txt"):
+        fields, _ = parse_source(source)
+        names.add(Path(tiles_name(fields["image"])).name)
+    return sorted(names)
+
+def image_files(root_dir:Path, device:str = None) -> dict:
+    """Images the game loads, {path relative to root_dir: path}, in the variants
+    device can draw. The source images, and screenshots, are not included."""
+    names = SCALED_IMAGES + maze_tile_images(root_dir / "build" / "mazes")
+    factors = [1] + SCALE_FACTORS if device is None else DEVICE_SCALE_FACTORS[device]
+    files = {}
+    for prefix in ("images/", f"images/{NATIVE_DIR}/"):
+        for factor in factors:
+            for name in names:
+                path = prefix + ("" if factor == 1 else f"{factor}x/") + name
+                files[path] = root_dir / path
+    return files
+
+def build_assets(root_dir:Path) -> None:
+    image_dir = root_dir / "images"
+    build_atlas(image_dir, sprite_regions(root_dir / "game" / "sprites.py"))
+    maze_tiles = maze_tile_images(root_dir / "build" / "mazes")
+    build_scaled(image_dir, SCALED_IMAGES + maze_tiles)
+    build_native(image_dir, {**NATIVE_TILE_SIZE, **{name: 8 for name in maze_tiles}})
+    check_asset_priority(root_dir, SCALED_IMAGES + maze_tiles)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--root", type=Path, default=Path(__file__).parent.parent)
+    args = parser.parse_args()
+    build_assets(args.root)
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Indexed BMP helpers shared by the build scripts.
+"""
+from pathlib import Path
+import struct
+
+from PIL import Image
+
+MONO_PALETTE = [(0x00, 0x00, 0x00), (0xFF, 0xFF, 0xFF)]
+
+def read_bmp(path:Path) -> tuple:
+    """Read an indexed BMP as (width, height, pixel bytes, [(r, g, b), ...])."""
+    data = path.read_bytes()
+    if struct.unpack_from("<H", data, 28)[0] == 2:
+        # PIL does not read 2-bit images
+        return read_2bit_bmp(data)
+    with Image.open(path) as image:
+        if image.mode == "1":
+            # PIL opens black and white 1-bit images as mode "1"
+            pixels = bytes(1 if value else 0 for value in image.tobytes("raw", "L"))
+            return image.width, image.height, pixels, MONO_PALETTE
+        if image.mode != "P":
+            raise ValueError(f"{path} is not an indexed bitmap")
+        palette = image.getpalette()
+        colors = len(palette) // 3
+        return (
+            image.width,
+            image.height,
+            image.tobytes(),
+            [tuple(palette[i * 3:i * 3 + 3]) for i in range(colors)],
+        )
+
+def read_2bit_bmp(data:bytes) -> tuple:
+    """Read the contents of an uncompressed 2-bit BMP, as written by write_bmp()."""
+    pixel_offset, info_size, width, height = struct.unpack_from("<IIii", data, 10)
+    colors = struct.unpack_from("<I", data, 46)[0] or 4
+    palette = [tuple(data[14 + info_size + i * 4 + 2::-1][:3]) for i in range(colors)]
+    row_size = (width * 2 + 31) // 32 * 4
+    pixels = bytearray()
+    for y in range(abs(height)):
+        row = pixel_offset + (abs(height) - 1 - y if height > 0 else y) * row_size
+        pixels += bytes(data[row + x // 4] >> (6 - 2 * (x % 4)) & 3 for x in range(width))
+    return width, abs(height), bytes(pixels), palette
+
+def write_bmp(path:Path, width:int, height:int, pixels:bytes, palette:list, bits:int = 8) -> int:
+    """Write an uncompressed indexed BMP (bottom-up rows) and return its size."""
+    if len(palette) > 1 << bits:
+        raise ValueError(f"{len(palette)} colors do not fit in {bits} bits")
+    row_size = (width * bits + 31) // 32 * 4
+    pixel_offset = 14 + 40 + len(palette) * 4
+
+    data = bytearray()
+    for y in range(height - 1, -1, -1):
+        row = pixels[y * width:(y + 1) * width]
+        packed = bytearray(row_size)
+        per_byte = 8 // bits
+        for x, value in enumerate(row):
+            shift = 8 - bits * (x % per_byte + 1)
+            packed[x // per_byte] |= value << shift
+        data += packed
+
+    header = bytearray()
+    header += b"BM"
+    header += (pixel_offset + len(data)).to_bytes(4, "little")
+    header += bytes(4)
+    header += pixel_offset.to_bytes(4, "little")
+    header += (40).to_bytes(4, "little")
+    header += width.to_bytes(4, "little", signed=True)
+    header += height.to_bytes(4, "little", signed=True)
+    header += (1).to_bytes(2, "little")
+    header += bits.to_bytes(2, "little")
+    header += bytes(4)  # BI_RGB
+    header += len(data).to_bytes(4, "little")
+    header += (3780).to_bytes(4, "little") * 2  # 96 DPI
+    header += len(palette).to_bytes(4, "little") * 2
+    for r, g, b in palette:
+        header += bytes((b, g, r, 0))
+
+    contents = bytes(header + data)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists() or path.read_bytes() != contents:
+        with open(path, "wb") as f:
+            f.write(contents)
+    return len(contents)
+
+def min_bits(colors:int) -> int:
+    return 1 if colors <= 2 else 2 if colors <= 4 else 4 if colors <= 16 else 8
+
+def ram_size(width:int, height:int, bits:int) -> int:
+    """Bytes of pixel data of a displayio.Bitmap of this size and depth."""
+    return (width * bits + 31) // 32 * 4 * height
+
+def used_colors(pixels:bytes, palette:list) -> tuple:
+    """Drop the palette entries no pixel uses, returns (remapped pixels, palette, old to new index table).
+
+    The colors keep their order and index 0 is always kept, so the color
+    the game makes transparent with make_transparent(0) stays at 0.
+    """
+    used = sorted(set(pixels) | {0})
+    remap = bytearray(256)
+    for new, old in enumerate(used):
+        remap[old] = new
+    return pixels.translate(remap), [palette[i] for i in used], bytes(remap)
+
+def size_report(width:int, height:int, colors:int, size:int, source_colors:int = None) -> str:
+    """Colors, depth, file size and RAM of an image written with min_bits(colors),
+    compared with the depth of its source when that had more colors."""
+    bits = min_bits(colors)
+    ram = ram_size(width, height, bits)
+    report = f"{colors} colors, {bits} bit, {size} bytes, {ram} bytes RAM"
+    if source_colors is not None and ram_size(width, height, min_bits(source_colors)) > ram:
+        report += f" instead of {ram_size(width, height, min_bits(source_colors))}"
+    return report
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Compares the boot timelines (the "Boot:" lines printed by game/boot.py) of
+several serial console logs, e.g. from each device or from two releases:
+
+    python build/boot_timeline.py wio.log fruitjam.log
+"""
+import argparse
+from pathlib import Path
+import re
+
+BOOT_LINE = re.compile(r'^Boot: (.+?) ([\d.]+)ms(?: ([+-]\d+)B)?')
+
+def read_timeline(log:Path) -> dict:
+    """{phase: (milliseconds, bytes kept)} of the last boot in a log."""
+    timeline = {}
+    for line in log.read_text(errors="replace").splitlines():
+        match = BOOT_LINE.match(line.strip())
+        if match is None:
+            continue
+        name, ms, used = match.groups()
+        if name == "total":
+            continue
+        if name in timeline:
+            # the device rebooted, keep the latest timeline only
+            timeline = {}
+        timeline[name] = (float(ms), int(used) if used is not None else None)
+    return timeline
+
+def compare(logs:list) -> None:
+    timelines = [read_timeline(log) for log in logs]
+    phases = []
+    for timeline in timelines:
+        phases += [name for name in timeline if name not in phases]
+    width = max([len(name) for name in phases] + [5])
+
+    print(" " * width + "".join(f"{log.stem[:22]:>24}" for log in logs))
+    for name in phases + ["total"]:
+        row = f"{name:<{width}}"
+        for timeline in timelines:
+            if name == "total":
+                ms = sum(value[0] for value in timeline.values())
+                used = sum(value[1] or 0 for value in timeline.values())
+            elif name in timeline:
+                ms, used = timeline[name]
+            else:
+                row += f"{'-':>24}"
+                continue
+            row += f"{ms:>10.1f}ms" + (f"{used:>+11d}B" if used is not None else " " * 12)
+        print(row)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("logs", type=Path, nargs="+", help="serial console logs containing a boot timeline")
+    compare(parser.parse_args().logs)
@@ -4,9 +4,9 @@
 #
 # SPDX-License-Identifier: MIT
 import argparse
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import json
-import os
 from pathlib import Path
 import re
 import shutil
@@ -15,19 +15,35 @@ import sys
 import zipfile
 
 import requests
-from circup.commands import main as circup_cli
+from circup.command_utils import WARNING_IGNORE_MODULES, clean_library_name, libraries_from_requirements
+from circup.shared import NOT_MCU_LIBRARIES
+
+from assets import build_assets, image_files
+from maze_compiler import build_mazes
+from specialize import report as report_specialized, source_files, specialize
 
 ASSET_DIRS = [
     "fonts",
-    "images"
+    "mazes",
 ]
 
+# the images are added per device, see assets.image_files
+
+# code.py and the game package are added per device, see specialize.source_files
 SRC_FILES = [
-    "code.py",
     "icon.bmp",
     "metadata.json"
 ]
 
+BUNDLE_REPOSITORY = "adafruit/Adafruit_CircuitPython_Bundle"
+BUNDLE_PATTERN = re.compile(r'^adafruit-circuitpython-bundle-(\d+\.x)-mpy-(\d{8})\.zip$')
+
+# downloaded bundles, named by bundle version and release date
+CACHE_DIR = Path(__file__).parent / ".cache" / "bundles"
+
+# fixed timestamp for every zip entry, so builds are reproducible
+ZIP_DATE_TIME = (2000, 1, 1, 0, 0, 0)
+
 def run(cmd):
     result = subprocess.run(cmd, shell=True, check=True, capture_output=True)
     return result.stdout.decode('utf-8').strip()
@@ -38,15 +54,188 @@ def get_latest_repository_release_assets(name:str|dict) -> list:
     release_data = release_response.json()
     return release_data["assets"]
 
-def replace_tags(file:Path, data:dict) -> None:
+class ReleaseSource:
+    """Where the assets of the latest library bundle release come from."""
+
+    def assets(self) -> list:
+        """Names of the release assets."""
+        raise NotImplementedError()
+
+    def fetch(self, name:str, path:Path) -> None:
+        """Write the contents of a release asset to path."""
+        raise NotImplementedError()
+
+class GitHubReleaseSource(ReleaseSource):
+    """The latest release of a GitHub repository."""
+
+    def __init__(self, repository:str):
+        self._repository = repository
+        self._urls = None
+
+    def assets(self) -> list:
+        if self._urls is None:
+            self._urls = {
+                asset["name"]: asset["browser_download_url"]
+                for asset in get_latest_repository_release_assets(self._repository)
+            }
+        return list(self._urls)
+
+    def fetch(self, name:str, path:Path) -> None:
+        self.assets()
+        with requests.get(self._urls[name], allow_redirects=True, stream=True) as response:
+            response.raise_for_status()
+            with open(path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+
+class LocalReleaseSource(ReleaseSource):
+    """Bundle zips already on disk, for offline builds."""
+
+    def __init__(self, directory:Path):
+        self._directory = directory
+
+    def assets(self) -> list:
+        return sorted(path.name for path in self._directory.glob("*.zip"))
+
+    def fetch(self, name:str, path:Path) -> None:
+        shutil.copyfile(self._directory / name, path)
+
+def get_bundles(source:ReleaseSource, cache_dir:Path) -> dict:
+    """Map each bundle version to a local zip of its newest release, downloading into the cache."""
+    releases = {}
+    for name in source.assets():
+        match = BUNDLE_PATTERN.match(name)
+        if match is None:
+            continue
+        version, date = match.groups()
+        if version not in releases or releases[version][0] < date:
+            releases[version] = (date, name)
+
+    bundles = {}
+    for version, (date, name) in sorted(releases.items()):
+        path = cache_dir / name
+        if path.exists():
+            print(f"Using cached {name}")
+        else:
+            print(f"Fetching {name}")
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(".part")
+            source.fetch(name, partial)
+            partial.replace(path)
+        bundles[version] = path
+    return bundles
+
+def read_requirements(file:Path) -> tuple:
+    if not file.exists():
+        return tuple()
     with open(file, "r") as f:
-        contents = f.read()
+        return libraries_from_requirements(f.read())
+
+def resolve_libraries(bundle:zipfile.ZipFile, requirements:tuple) -> dict:
+    """Find the files of the required libraries and their dependencies in a bundle.
+
+    Uses the same name rules as circup. Returns {path in bundle: path relative to lib/}.
+    """
+    members = set(bundle.namelist())
+    root = bundle.namelist()[0].split("/", 1)[0]
+
+    # library name => files, libraries are a package folder or a single .mpy file
+    modules = {}
+    for member in members:
+        parts = member.split("/")
+        if len(parts) < 3 or parts[1] != "lib" or member.endswith("/"):
+            continue
+        name = parts[2] if len(parts) > 3 else parts[2].rsplit(".", 1)[0]
+        modules.setdefault(name, []).append(member)
+
+    files = {}
+    installed = set()
+    pending = list(requirements)
+    while pending:
+        requirement = pending.pop(0)
+        if requirement in NOT_MCU_LIBRARIES:
+            continue
+        name = clean_library_name(requirement)
+        if name in installed:
+            continue
+        if name not in modules:
+            if name not in WARNING_IGNORE_MODULES:
+                print(f"Warning: {name} is not in {root}")
+            continue
+        installed.add(name)
+        for member in modules[name]:
+            files[member] = member.split("/", 2)[2]
+        dependencies = f"{root}/requirements/{name}/requirements.txt"
+        if dependencies in members:
+            pending.extend(libraries_from_requirements(bundle.read(dependencies).decode("utf-8")))
+    return files
+
+def bundle_libraries(bundle_zip:Path, requirements:tuple) -> list:
+    """List the required library files of a bundle as (path in bundle, path relative to lib/, digest)."""
+    with zipfile.ZipFile(bundle_zip) as bundle:
+        return [
+            (member, path, "crc32:{:08x}".format(bundle.getinfo(member).CRC))
+            for member, path in resolve_libraries(bundle, requirements).items()
+        ]
+
+def project_files(root_dir:Path) -> dict:
+    """Files copied into every bundle version, {path in the bundle: source path}."""
+    files = {}
+    for asset_dir in ASSET_DIRS:
+        for path in (root_dir / asset_dir).rglob("*"):
+            if path.is_file():
+                files[path.relative_to(root_dir).as_posix()] = path
+    for src_file in SRC_FILES:
+        files[src_file] = root_dir / src_file
+    return files
+
+def content_digest(contents:bytes) -> str:
+    return "sha256:" + hashlib.sha256(contents).hexdigest()
+
+def read_manifest(file:Path) -> dict:
+    try:
+        with open(file, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def write_zip(output_zip:Path, entries:dict) -> None:
+    """Stream entries into a zip in sorted order.
+
+    Each entry is {name: source path | contents | (bundle zip, path in bundle)}.
+    """
+    partial = output_zip.with_suffix(".part")
+    bundles = {}
+    try:
+        with zipfile.ZipFile(partial, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name in sorted(entries):
+                source = entries[name]
+                info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                if isinstance(source, bytes):
+                    zf.writestr(info, source)
+                    continue
+                if isinstance(source, tuple):
+                    bundle_zip, member = source
+                    if bundle_zip not in bundles:
+                        bundles[bundle_zip] = zipfile.ZipFile(bundle_zip)
+                    src = bundles[bundle_zip].open(member)
+                else:
+                    src = open(source, "rb")
+                with src, zf.open(info, "w") as dst:
+                    shutil.copyfileobj(src, dst)
+    finally:
+        for bundle in bundles.values():
+            bundle.close()
+    partial.replace(output_zip)
+
+def replace_tags(contents:str, data:dict) -> str:
     for key, value in data.items():
         contents = contents.replace("{{{}}}".format(key), value)
-    with open(file, "w") as f:
-        f.write(contents)
+    return contents
 
-def main(device:str = "fruitjam"):
+def main(device:str = "fruitjam", offline:Path = None, jobs:int = None, specialized:bool = True):
 
     # get github repository details
     git_remote = run("git config --get remote.origin.url")
@@ -64,105 +253,146 @@ def main(device:str = "fruitjam"):
     build_dir = Path(__file__).parent
     root_dir = build_dir.parent
 
+    # "all" builds every supported board in one run, one zip per device
+    if device == "all":
+        devices = sorted(path.stem[len("boot_out_"):] for path in build_dir.glob("boot_out_*.txt"))
+        output_names = {name: f"{git_name}_{name}.zip" for name in devices}
+    else:
+        devices = [device]
+        output_names = {device: f"{git_name}.zip"}
+
     # check if supported board exists
-    if not (build_dir / f"boot_out_{device}.txt").exists():
-        print(f"Device configuration for \"{device}\" not found!")
-        sys.exit(1)
+    for name in devices:
+        if not (build_dir / f"boot_out_{name}.txt").exists():
+            print(f"Device configuration for \"{name}\" not found!")
+            sys.exit(1)
 
     # read metadata
     with open(build_dir / "metadata.json", "r") as f:
         metadata = json.load(f)
 
+    # compile maze descriptions and generate derived images
+    build_mazes(build_dir / "mazes", root_dir / "mazes", root_dir)
+    build_assets(root_dir)
+
+    # find the library bundles, from the cache where possible
+    if offline is not None:
+        source = LocalReleaseSource(offline)
+    else:
+        source = GitHubReleaseSource(BUNDLE_REPOSITORY)
+    bundles = get_bundles(source, CACHE_DIR)
+    if not bundles:
+        print("No library bundles found!")
+        sys.exit(1)
+
+    # compile requirements, shared by every device plus a per-device overlay
+    requirements = read_requirements(root_dir / "requirements.txt")
+    device_requirements = {
+        name: read_requirements(build_dir / f"requirements_{name}.txt") for name in devices
+    }
+
     # set up paths
     output_dir = root_dir / "dist"
-    asset_dirs = tuple([root_dir / x for x in ASSET_DIRS])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_file = output_dir / f"{git_name}.manifest.json"
 
-    # delete output dir if it exists
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
+    # format bundle readme
+    with open(build_dir / "README.txt", "r") as f:
+        readme = replace_tags(f.read(), {
+            "name": git_name,
+            "guide_url": metadata.get("guide_url", ""),
+            "git_remote": git_remote,
+            "git_commit": git_commit,
+        }).encode("utf-8")
 
-    # create output directory
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # project files are the same in every bundle version
+    project = {
+        name: (path, content_digest(path.read_bytes()))
+        for name, path in project_files(root_dir).items()
+    }
 
-    # create output zip filename
-    output_zip = str(output_dir / git_name) + ".zip"
-    
-    # create a clean temporary directory for building the zip
-    temp_dir = output_dir / "temp"
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
-    temp_dir.mkdir(parents=True)
-
-    temp_root_dir = temp_dir / git_name
-    temp_root_dir.mkdir(parents=True)
-
-    # copy and format bundle readme
-    shutil.copyfile(build_dir / "README.txt", temp_root_dir / "README.txt")
-    replace_tags(temp_root_dir / "README.txt", {
-        "name": git_name,
-        "guide_url": metadata.get("guide_url", ""),
-        "git_remote": git_remote,
-        "git_commit": git_commit,
-    })
+    # strip the source down to what each device runs
+    sources = {path: source_path.read_text() for path, source_path in source_files(root_dir).items()}
+    device_code = {}
+    device_images = {}
+    for name in devices:
+        device_images[name] = {
+            path: (image_path, content_digest(image_path.read_bytes()))
+            for path, image_path in image_files(root_dir, name).items()
+        }
+        if specialized:
+            code = {path: specialize(sources[path], name) for path in source_files(root_dir, name)}
+            report_specialized(f"source for {name}", list(sources.values()), list(code.values()))
+        else:
+            code = sources
+        device_code[name] = {path: source.encode("utf-8") for path, source in code.items()}
 
-    try:
-        for asset in get_latest_repository_release_assets("adafruit/Adafruit_CircuitPython_Bundle"):
-            bundle_version = re.findall(r'^adafruit-circuitpython-bundle-(\d+.x)-mpy-\d{8}.zip$', asset["name"])
-            if not len(bundle_version):
+    manifest = read_manifest(manifest_file).get("outputs", {})
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # resolve the shared libraries once per bundle version, and only the
+        # overlay libraries per device
+        shared_libraries = {
+            version: executor.submit(bundle_libraries, bundle_zip, requirements)
+            for version, bundle_zip in bundles.items()
+        }
+        overlay_libraries = {
+            (name, version): executor.submit(bundle_libraries, bundle_zip, device_requirements[name])
+            for name in devices if device_requirements[name]
+            for version, bundle_zip in bundles.items()
+        }
+
+        # zip entries and their content digests for each device
+        writes = {}
+        for name in devices:
+            entries = {f"{git_name}/README.txt": readme}
+            digests = {f"{git_name}/README.txt": content_digest(readme)}
+            for version, bundle_zip in bundles.items():
+                bundle_dir = f"{git_name}/CircuitPython {version}"
+                for path, (source_path, digest) in (project | device_images[name]).items():
+                    entries[f"{bundle_dir}/{path}"] = source_path
+                    digests[f"{bundle_dir}/{path}"] = digest
+                for path, code in device_code[name].items():
+                    entries[f"{bundle_dir}/{path}"] = code
+                    digests[f"{bundle_dir}/{path}"] = content_digest(code)
+                libraries = shared_libraries[version].result()
+                if (name, version) in overlay_libraries:
+                    libraries = libraries + overlay_libraries[(name, version)].result()
+                for member, path, digest in libraries:
+                    entries[f"{bundle_dir}/lib/{path}"] = (bundle_zip, member)
+                    digests[f"{bundle_dir}/lib/{path}"] = digest
+
+            # only rewrite a zip when its contents changed
+            output_zip = output_dir / output_names[name]
+            previous = manifest.get(output_zip.name, {})
+            changed = [path for path, digest in digests.items() if previous.get(path) != digest]
+            manifest[output_zip.name] = dict(sorted(digests.items()))
+            if output_zip.exists() and not changed and previous.keys() == digests.keys():
+                print(f"{output_zip} is up to date")
                 continue
-            bundle_version = bundle_version[0]
-
-            # create output directory
-            bundle_dir = temp_root_dir / f"CircuitPython {bundle_version}"
-            bundle_dir.mkdir(parents=True, exist_ok=True)
-
-            # copy asset contents
-            for asset_dir in asset_dirs:
-                shutil.copytree(asset_dir, bundle_dir / asset_dir.name, dirs_exist_ok=True)
-
-            # copy src files
-            for src_file in SRC_FILES:
-                shutil.copyfile(root_dir / src_file, bundle_dir / src_file, follow_symlinks=False)
-
-            # compile requirements
-            shutil.copyfile(root_dir / "requirements.txt", bundle_dir / "requirements.txt", follow_symlinks=False)
-            if (build_dir / f"requirements_{device}.txt").exists():
-                with open(bundle_dir / "requirements.txt", "a") as outfile:
-                    with open(build_dir / f"requirements_{device}.txt", "r") as infile:
-                        outfile.write(infile.read())
-
-            # install required libs
-            shutil.copyfile(build_dir / f"boot_out_{device}.txt", bundle_dir / "boot_out.txt")
-            replace_tags(bundle_dir / "boot_out.txt", {
-                "version": bundle_version.replace('.x', '.0.0'),
-                "date": datetime.today().strftime('%Y-%m-%d'),
-            })
-            circup_cli(
-                ["--path", bundle_dir, "install", "--requirement", "requirements.txt"],
-                standalone_mode=False,
-            )
-            os.remove(bundle_dir / "boot_out.txt")
-            os.remove(bundle_dir / "requirements.txt")
-
-        # create the final zip file
-        with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file_path in temp_dir.rglob("*"):
-                if file_path.is_file():
-                    modification_time = datetime(2000, 1, 1, 0, 0, 0)
-                    modification_timestamp = modification_time.timestamp()
-                    os.utime(file_path, (modification_timestamp, modification_timestamp))
-                    arcname = file_path.relative_to(temp_dir)
-                    zf.write(file_path, arcname)
-
-        print(f"Created {output_zip}")
 
-    finally:
-        # clean up temporary directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+            # write the changed zips in parallel
+            writes[output_zip] = (executor.submit(write_zip, output_zip, entries), len(changed), len(digests))
+
+        for output_zip, (future, changed, total) in writes.items():
+            future.result()
+            print(f"Created {output_zip} ({changed} of {total} files changed)")
+
+    # one manifest for every zip built into dist/
+    with open(manifest_file, "w") as f:
+        json.dump({"outputs": dict(sorted(manifest.items()))}, f, indent=1)
+        f.write("\n")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("-d", "--device", type=str, required=False, default="fruitjam")
+    parser.add_argument("-d", "--device", type=str, required=False, default="fruitjam",
+                        help="board to build for (a build/boot_out_<device>.txt), or \"all\"")
+    parser.add_argument("--offline", type=Path, nargs="?", const=CACHE_DIR, default=None,
+                        help="use bundle zips from this directory (default: the download cache) instead of GitHub")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes")
+    parser.add_argument("--no-specialize", action="store_true",
+                        help="ship the source unchanged, with debug output and the code of every device")
     args = parser.parse_args()
-    main(args.device)
+    main(args.device, args.offline, args.jobs, not args.no_specialize)
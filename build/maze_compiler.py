@@ -0,0 +1,254 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Compiles a text maze description (build/mazes/*.txt) into the binary maze
+format loaded by game/maze.py (mazes/*.bin).
+
+Binary layout (little-endian):
+
+    header  MAZE_HEADER (see below)
+    attrs   cols * rows bytes, one attribute bit field per tile (row-major)
+    tiles   cols * rows bytes, the background tile shown at each tile (row-major)
+
+The background image is split into its unique 8x8 tiles, which are written
+to images/<image>_tiles.bmp with only the colors the maze uses. displayio pads
+every Bitmap row to 32 bits, so the tiles are laid out side by side to fill
+them: one tile per row at 4 bits per pixel, two at 2 bits and four at 1 bit.
+
+The attribute bits are mirrored by the A_* constants in game/config.py.
+"""
+import argparse
+from collections import Counter, deque
+from pathlib import Path
+import struct
+import sys
+
+from bmp import min_bits, read_bmp, size_report, used_colors, write_bmp
+
+MAGIC = b"PMZ2"
+
+TILE_SIZE = 8
+
+# magic, cols, rows, dot count,
+# pac-man tile x/y and pixel x/y,
+# 4 ghost spawns (tile x, tile y, x offset), 4 ghost scatter targets (tile x, tile y),
+# door tile x/y, home row, house area (left, top, right, bottom), fruit tile x/y,
+# wall palette index, background tile image path
+MAZE_HEADER = struct.Struct("<4sBBH BBhh 12b 8b BBB 4B BB B 32s")
+
+A_WALL = 0x01
+A_DOT = 0x02
+A_POWER = 0x04
+A_DOOR = 0x08
+A_HOUSE = 0x10
+A_TUNNEL = 0x20
+A_REACH = 0x40
+
+TILE_ATTRS = {
+    "#": A_WALL,
+    ".": A_DOT,
+    "o": A_POWER,
+    "_": 0,
+    "-": A_DOOR,
+    "=": A_TUNNEL,
+}
+
+GHOSTS = ("blinky", "pinky", "inky", "clyde")
+
+FIELDS = {
+    "image": 1,
+    "pacman": 4,
+    "blinky": 5,
+    "pinky": 5,
+    "inky": 5,
+    "clyde": 5,
+    "door": 2,
+    "home": 1,
+    "house": 4,
+    "fruit": 2,
+}
+
+def parse_source(path:Path) -> tuple:
+    fields = {}
+    rows = []
+    in_map = False
+    with open(path, "r") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.rstrip("\r\n")
+            if in_map:
+                if line:
+                    rows.append(line)
+                continue
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            if line == "map:":
+                in_map = True
+                continue
+            if "=" not in line:
+                raise ValueError(f"{path}:{line_no}: expected 'key = value'")
+            key, value = (x.strip() for x in line.split("=", 1))
+            if key not in FIELDS:
+                raise ValueError(f"{path}:{line_no}: unknown field \"{key}\"")
+            if key == "image":
+                fields[key] = value
+            else:
+                values = [int(x) for x in value.split()]
+                if len(values) != FIELDS[key]:
+                    raise ValueError(f"{path}:{line_no}: \"{key}\" expects {FIELDS[key]} values")
+                fields[key] = values
+
+    missing = [key for key in FIELDS if key not in fields]
+    if missing:
+        raise ValueError(f"{path}: missing field(s) {', '.join(missing)}")
+    if not rows:
+        raise ValueError(f"{path}: missing map")
+    if any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError(f"{path}: map rows must all be the same width")
+    return fields, rows
+
+def tiles_name(image:str) -> str:
+    return image[:-len(".bmp")] + "_tiles.bmp"
+
+def build_tiles(root_dir:Path, image:str, cols:int, rows:int) -> tuple:
+    """Split a maze background into unique tiles, returns (tile map, tile count, wall palette index, size report).
+
+    The tile image keeps only the colors the maze uses, so it usually fits in 2 bits.
+    """
+    width, height, pixels, source_palette = read_bmp(root_dir / image)
+    if (width, height) != (cols * TILE_SIZE, rows * TILE_SIZE):
+        raise ValueError(f"{image} is {width}x{height}, expected {cols * TILE_SIZE}x{rows * TILE_SIZE}")
+    pixels, palette, _ = used_colors(pixels, source_palette)
+
+    tiles = {}
+    tile_map = bytearray()
+    for ty in range(rows):
+        for tx in range(cols):
+            offset = ty * TILE_SIZE * width + tx * TILE_SIZE
+            tile = b"".join(
+                pixels[offset + y * width:offset + y * width + TILE_SIZE] for y in range(TILE_SIZE)
+            )
+            tile_map.append(tiles.setdefault(tile, len(tiles)))
+    if len(tiles) > 256:
+        raise ValueError(f"{image} has {len(tiles)} unique tiles, the limit is 256")
+
+    bits = min_bits(len(palette))
+    per_row = max(1, 32 // (TILE_SIZE * bits))
+    tile_list = list(tiles)
+    tile_list += [bytes(TILE_SIZE * TILE_SIZE)] * (-len(tile_list) % per_row)
+    tile_pixels = bytearray()
+    for first in range(0, len(tile_list), per_row):
+        for y in range(TILE_SIZE):
+            for tile in tile_list[first:first + per_row]:
+                tile_pixels += tile[y * TILE_SIZE:(y + 1) * TILE_SIZE]
+    image_width = per_row * TILE_SIZE
+    image_height = len(tile_list) // per_row * TILE_SIZE
+    size = write_bmp(root_dir / tiles_name(image), image_width, image_height, tile_pixels, palette, bits)
+
+    # walls are the most common color other than the background
+    wall = Counter(value for value in pixels if value).most_common(1)[0][0]
+    return bytes(tile_map), len(tiles), wall, size_report(image_width, image_height, len(palette), size, len(source_palette))
+
+def compile_maze(fields:dict, rows:list, tile_map:bytes, wall:int) -> bytes:
+    cols = len(rows[0])
+    height = len(rows)
+
+    attrs = bytearray(cols * height)
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char not in TILE_ATTRS:
+                raise ValueError(f"unknown map tile \"{char}\" at {x},{y}")
+            attrs[y * cols + x] = TILE_ATTRS[char]
+
+    left, top, right, bottom = fields["house"]
+    for y in range(top, bottom + 1):
+        for x in range(left, right + 1):
+            attrs[y * cols + x] |= A_HOUSE
+
+    # Flood fill from Pac-Man's start to find reachable tiles.
+    # Doors are closed to Pac-Man, tunnel rows wrap around the edges.
+    start_x, start_y = fields["pacman"][:2]
+    if attrs[start_y * cols + start_x] & (A_WALL | A_DOOR):
+        raise ValueError("Pac-Man must start on an open tile")
+    attrs[start_y * cols + start_x] |= A_REACH
+    queue = deque([(start_x, start_y)])
+    while queue:
+        cx, cy = queue.popleft()
+        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            nx, ny = cx + dx, cy + dy
+            if not 0 <= ny < height:
+                continue
+            if not 0 <= nx < cols:
+                if not attrs[cy * cols + cx] & A_TUNNEL:
+                    continue
+                nx %= cols
+            i = ny * cols + nx
+            if not attrs[i] & (A_WALL | A_DOOR | A_REACH):
+                attrs[i] |= A_REACH
+                queue.append((nx, ny))
+
+    # Dots that can never be eaten would make the level impossible to finish
+    dot_count = 0
+    for i, attr in enumerate(attrs):
+        if attr & (A_DOT | A_POWER):
+            if not attr & A_REACH:
+                print(f"Warning: dropping unreachable dot at {i % cols},{i // cols}")
+                attrs[i] &= ~(A_DOT | A_POWER)
+            else:
+                dot_count += 1
+
+    spawns = []
+    scatter = []
+    for name in GHOSTS:
+        tile_x, tile_y, x_offset, target_x, target_y = fields[name]
+        spawns += [tile_x, tile_y, x_offset]
+        scatter += [target_x, target_y]
+
+    image = tiles_name(fields["image"]).encode("utf-8")
+    if len(image) > 32:
+        raise ValueError("image path must be 32 bytes or less")
+
+    header = MAZE_HEADER.pack(
+        MAGIC, cols, height, dot_count,
+        *fields["pacman"],
+        *spawns,
+        *scatter,
+        *fields["door"], *fields["home"],
+        *fields["house"],
+        *fields["fruit"],
+        wall,
+        image,
+    )
+    return header + bytes(attrs) + tile_map
+
+def build_maze(source:Path, output:Path, root_dir:Path) -> tuple:
+    """Compile one maze and its tile image, returns (dot count, tile count, tile image size report)."""
+    fields, rows = parse_source(source)
+    tile_map, tile_count, wall, tiles_size = build_tiles(root_dir, fields["image"], len(rows[0]), len(rows))
+    data = compile_maze(fields, rows, tile_map, wall)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if not output.exists() or output.read_bytes() != data:
+        with open(output, "wb") as f:
+            f.write(data)
+    return MAZE_HEADER.unpack_from(data)[3], tile_count, tiles_size
+
+def build_mazes(source_dir:Path, output_dir:Path, root_dir:Path) -> None:
+    for source in sorted(source_dir.glob("*.txt")):
+        output = output_dir / (source.stem + ".bin")
+        dot_count, tile_count, tiles_size = build_maze(source, output, root_dir)
+        print(f"Compiled {source.name} -> {output.name} ({dot_count} dots, {tile_count} tiles: {tiles_size})")
+
+if __name__ == "__main__":
+    build_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-s", "--source", type=Path, default=build_dir / "mazes")
+    parser.add_argument("-o", "--output", type=Path, default=build_dir.parent / "mazes")
+    parser.add_argument("-r", "--root", type=Path, default=build_dir.parent,
+                        help="directory the maze image paths are relative to")
+    args = parser.parse_args()
+    try:
+        build_mazes(args.source, args.output, args.root)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
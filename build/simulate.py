@@ -0,0 +1,1104 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Many-worlds simulator for balance and performance studies, host only (NumPy).
+
+Thousands of independent games are stepped in lockstep, one array element per
+game, with the movement and ghost targeting rules of game/actors.py and
+game/ai.py and the frame rules of code.py (dots, power pellets, eating ghosts,
+the bonus fruit, deaths and levels). Pac-Man is steered by the autopilot of
+game/autopilot.py, here following a distance field to the nearest dot that is
+relaxed one step per frame, or by random inputs. Game time runs at 60 frames a
+second and the mode timers count frames, so the pauses code.py sleeps through
+are left out.
+
+    python build/simulate.py --worlds 2000 --minutes 5
+    python build/simulate.py --frightened 420 --release 240 480
+    python build/simulate.py --check 20
+
+With -n 200 it steps about 15k world-frames a second on a desktop computer,
+more per world in bigger batches. tests/test_simulate.py runs a short --check.
+
+--check plays whole games of single worlds next to the game's own PacMan and
+Ghost classes, imported with stand-ins for the CircuitPython modules and fed
+the same inputs and random numbers, and fails on the first frame where the
+state, score, positions, directions or ghost modes differ. The defaults come
+from game/config.py and the ghost house release timers from game/actors.py.
+"""
+import argparse
+import ast
+import contextlib
+import gc
+import io
+import os
+from pathlib import Path
+import sys
+import time
+import types
+
+import numpy as np
+
+from maze_compiler import MAGIC, MAZE_HEADER, A_WALL, A_DOT, A_POWER, A_DOOR, A_HOUSE, A_TUNNEL, A_REACH
+
+CONFIG_NAMES = (
+    "GAME_WIDTH", "MAZE_COLS", "MAZE_ROWS", "PACMAN_SPEED", "GHOST_SPEED",
+    "DIR_NONE", "DIR_UP", "DIR_DOWN", "DIR_LEFT", "DIR_RIGHT",
+    "MODE_SCATTER", "MODE_CHASE", "MODE_FRIGHTENED", "MODE_EATEN",
+    "FRUIT_POINTS", "MODE_TIMES", "FRIGHTENED_DURATION",
+)
+
+# Frames a ghost waits in the house (game/actors.py): Blinky after being eaten,
+# Pinky, Inky and Clyde. Pinky leaves at once.
+RELEASE_FRAMES = [60, -1, 300, 600]
+
+# Game states (code.py), FREEZE covers eating a ghost or the fruit
+PLAY = 0
+FREEZE = 1
+DYING = 2
+LEVEL_COMPLETE = 3
+GAME_OVER = 4
+
+FREEZE_FRAMES = 60
+DEATH_FRAMES = 8 * 11 # 11 animation frames, 8 frames each
+LEVEL_COMPLETE_FRAMES = 180
+FRUIT_FRAMES = 500
+FRUIT_DOTS = (70, 170)
+
+# Autopilot (game/autopilot.py)
+DANGER_DISTANCE = 2
+FAR = 9999
+
+def read_config(path:Path) -> dict:
+    """The literal constants of game/config.py, without running it."""
+    values = {}
+    for node in ast.parse(path.read_text()).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                pass
+    missing = [name for name in CONFIG_NAMES if name not in values]
+    if missing:
+        raise ValueError(f"{path}: {', '.join(missing)} not found")
+    return values
+
+class Maze:
+    """A compiled maze file (see build/maze_compiler.py)."""
+
+    def __init__(self, path:Path):
+        with open(path, "rb") as f:
+            (magic, self.cols, self.rows, self.total_dots,
+             self.start_tile_x, self.start_tile_y, self.start_x, self.start_y,
+             *spawns, self.door_x, self.door_y, self.home_y,
+             _, _, _, _, self.fruit_x, self.fruit_y, _, _) = MAZE_HEADER.unpack(f.read(MAZE_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a compiled maze")
+            self.attrs = np.frombuffer(f.read(self.cols * self.rows), dtype=np.uint8).astype(np.int32)
+        self.spawns = [tuple(spawns[i:i + 3]) for i in range(0, 12, 3)]
+        self.scatter = [tuple(spawns[i:i + 2]) for i in range(12, 20, 2)]
+        self.tunnel_rows = (self.attrs[::self.cols] & A_TUNNEL) != 0
+
+        # Per world maps have a border of one tile, so that every tile of the
+        # maze has four neighbors in a flat array: tile (tx, ty) is at
+        # (ty + 1) * stride + tx + 1
+        self.stride = self.cols + 2
+        self.size = (self.rows + 2) * self.stride
+        grid = np.zeros((self.rows + 2, self.stride), dtype=np.int32)
+        grid[1:-1, 1:-1] = self.attrs.reshape(self.rows, self.cols)
+        grid = grid.ravel()
+        self.items = np.where(grid & A_POWER, 2, np.where(grid & A_DOT, 1, 0)).astype(np.uint8)
+        self.blocked = (grid & A_REACH) == 0
+        self.wrap_left = np.flatnonzero(self.tunnel_rows) * self.stride + self.stride # border tiles of the tunnel rows
+        self.wrap_right = self.wrap_left + self.cols + 1
+
+    def cell(self, tx, ty):
+        """Index of tile (tx, ty) in a bordered map."""
+        return (ty + 1) * self.stride + tx + 1
+
+class Rules:
+    """The tunable numbers, game/config.py defaults unless overridden."""
+
+    def __init__(self, config:dict, args=None):
+        for name in CONFIG_NAMES:
+            setattr(self, name.lower(), config[name])
+        self.release = list(RELEASE_FRAMES)
+        if args is not None:
+            if args.mode_times:
+                self.mode_times = args.mode_times
+            if args.frightened is not None:
+                self.frightened_duration = args.frightened
+            if args.pacman_speed is not None:
+                self.pacman_speed = args.pacman_speed
+            if args.ghost_speed is not None:
+                self.ghost_speed = args.ghost_speed
+            if args.release:
+                self.release[2:] = args.release
+
+class Worlds:
+    """count games stepped together, every attribute is an array over the games
+    (ghost attributes are count x 4, in Blinky, Pinky, Inky, Clyde order)."""
+
+    def __init__(self, maze:Maze, rules:Rules, count:int, policy:str="autopilot", seed:int=0):
+        self.maze = maze
+        self.rules = rules
+        self.count = count
+        self.policy = policy
+        self.rng = np.random.default_rng(seed)
+        self.index = np.arange(count)
+        r = rules
+
+        # direction tables, indexed by direction
+        self.dx = np.zeros(5, dtype=np.int32)
+        self.dy = np.zeros(5, dtype=np.int32)
+        self.dx[r.dir_left], self.dx[r.dir_right] = -1, 1
+        self.dy[r.dir_up], self.dy[r.dir_down] = -1, 1
+        self.opposite = np.zeros(5, dtype=np.int32)
+        for a, b in ((r.dir_up, r.dir_down), (r.dir_left, r.dir_right)):
+            self.opposite[a], self.opposite[b] = b, a
+        self.turn_order = (r.dir_up, r.dir_left, r.dir_down, r.dir_right) # game/ai.py
+        self.stuck_order = (r.dir_up, r.dir_down, r.dir_left, r.dir_right) # game/actors.py
+        self.mode_frames = np.array([t * 60 for t in r.mode_times], dtype=np.float64)
+
+        zeros = lambda *shape, dtype=np.int32: np.zeros((count,) + shape, dtype=dtype)
+        self.state = zeros()
+        self.timer = zeros()
+        self.score = zeros()
+        self.lives = zeros() + 3
+        self.level = zeros() + 1
+        self.dots_eaten = zeros()
+        self.ghosts_eaten_count = zeros()
+        self.mode_index = zeros()
+        self.current_mode = zeros() + r.mode_scatter
+        self.mode_clock = zeros()
+        self.fruit_active = zeros(dtype=bool)
+        self.fruit_timer = zeros()
+        self.items = np.tile(maze.items, (count, 1))
+
+        self.px = zeros(dtype=np.float64)
+        self.py = zeros(dtype=np.float64)
+        self.pdir = zeros()
+        self.pnext = zeros()
+        self.ptx = zeros()
+        self.pty = zeros()
+        self.saved_x = zeros(dtype=np.float64)
+        self.saved_y = zeros(dtype=np.float64)
+
+        self.gx = zeros(4, dtype=np.float64)
+        self.gy = zeros(4, dtype=np.float64)
+        self.gdir = zeros(4)
+        self.gtx = zeros(4)
+        self.gty = zeros(4)
+        self.mode = zeros(4)
+        self.in_house = zeros(4, dtype=bool)
+        self.house_timer = zeros(4)
+        self.frightened_timer = zeros(4)
+        self.reverse = zeros(4, dtype=bool)
+        self.last_x = np.full((count, 4), np.nan)
+        self.last_y = zeros(4, dtype=np.float64)
+        self.stuck_frames = zeros(4)
+
+        # random numbers for each ghost update, used in the order game/actors.py draws them
+        self.draws = np.zeros((count, 4, 3))
+        self.input = zeros()
+        self.collided = zeros(dtype=bool)
+
+        # autopilot
+        # distance to the nearest dot, a bordered map
+        self.field = np.full((count, maze.size), FAR, dtype=np.int16)
+        self.last_tile = zeros() - 1
+
+        # statistics, counted in frames spent playing
+        self.play_frames = zeros()
+        self.mode_play_frames = zeros(3) # scatter, chase, any ghost frightened
+        self.deaths = zeros(2) # in scatter, in chase
+        self.ghosts_eaten = zeros()
+        self.pellets = zeros()
+        self.dots = zeros()
+        self.levels_cleared = zeros()
+        self.first_clear = zeros() - 1
+
+        self.reset_actors(np.ones(count, dtype=bool))
+
+    # -------------------------------------------------------------------------
+    # Maze queries
+    # -------------------------------------------------------------------------
+
+    def attr(self, tx, ty):
+        """Attributes of tiles (tx, ty), clipped to the maze; check the bounds separately."""
+        m = self.maze
+        return m.attrs[np.clip(ty, 0, m.rows - 1) * m.cols + np.clip(tx, 0, m.cols - 1)]
+
+    def tunnel_row(self, ty):
+        return self.maze.tunnel_rows[np.clip(ty, 0, self.maze.rows - 1)]
+
+    def can_move(self, x, y, d, speed, mode=None, in_house=None):
+        """PacMan.can_move(), or Ghost.can_move() when mode and in_house are given."""
+        r = self.rules
+        m = self.maze
+        dx = self.dx[d]
+        dy = self.dy[d]
+        cx = x + dx * speed + 8
+        cy = y + dy * speed + 8
+        nx = cx - 8
+        vertical = (d == r.dir_up) | (d == r.dir_down)
+        tunnel_block = ((cx < 8) | (cx > 216)) & vertical
+        wrap = (nx < -8) | (nx >= r.game_width - 8)
+        tx = np.floor((cx + dx * 3) / 8).astype(np.int32)
+        ty = np.floor((cy + dy * 3) / 8).astype(np.int32)
+        attr = self.attr(tx, ty)
+        if mode is None:
+            open_tile = (attr & (A_WALL | A_DOOR)) == 0
+        else:
+            eaten = mode == r.mode_eaten
+            open_tile = ((attr & A_WALL) == 0) & ~(
+                (d == r.dir_down) & ((attr & A_DOOR) != 0) & ~in_house & ~eaten)
+            open_tile |= eaten & ((attr & A_HOUSE) != 0)
+        result = np.where((tx >= 0) & (tx < m.cols), open_tile, self.tunnel_row(ty))
+        result &= (ty >= 0) & (ty < m.rows)
+        result |= wrap
+        return result & ~tunnel_block & (d != r.dir_none)
+
+    def can_turn(self, d):
+        """PacMan.can_turn()."""
+        m = self.maze
+        tx = self.ptx + self.dx[d]
+        ty = self.pty + self.dy[d]
+        open_tile = (self.attr(tx, ty) & (A_WALL | A_DOOR)) == 0
+        result = np.where((tx >= 0) & (tx < m.cols), open_tile, self.tunnel_row(ty))
+        return result & (ty >= 0) & (ty < m.rows)
+
+    @staticmethod
+    def at_tile_center(x, y, threshold):
+        dist_x = np.abs(np.mod(x + 8 - 4, 8))
+        dist_y = np.abs(np.mod(y + 8 - 4, 8))
+        dist_x = np.minimum(dist_x, 8 - dist_x)
+        dist_y = np.minimum(dist_y, 8 - dist_y)
+        return (dist_x <= threshold) & (dist_y <= threshold)
+
+    @staticmethod
+    def snap(v):
+        """Snap a sprite coordinate to the tile center."""
+        return np.floor((v + 8) / 8) * 8 + 4 - 8
+
+    # -------------------------------------------------------------------------
+    # Resets
+    # -------------------------------------------------------------------------
+
+    def reset_actors(self, w):
+        """PacMan.reset() and Ghost.reset() in worlds w, and the mode timer."""
+        r = self.rules
+        m = self.maze
+        self.px[w] = m.start_x
+        self.py[w] = m.start_y
+        self.ptx[w] = m.start_tile_x
+        self.pty[w] = m.start_tile_y
+        self.pdir[w] = r.dir_none
+        self.pnext[w] = r.dir_none
+        for g, (tx, ty, offset) in enumerate(m.spawns):
+            self.gx[w, g] = tx * 8 - 4 + offset
+            self.gy[w, g] = ty * 8 - 4
+            self.gtx[w, g] = tx
+            self.gty[w, g] = ty
+            self.in_house[w, g] = g != 0
+            self.gdir[w, g] = r.dir_left if g == 0 else r.dir_down if g == 1 else r.dir_up
+        self.house_timer[w] = 0
+        self.mode[w] = r.mode_scatter
+        self.reverse[w] = False
+        self.mode_index[w] = 0
+        self.current_mode[w] = r.mode_scatter
+        self.mode_clock[w] = 0
+
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+
+    def steer(self, p):
+        """Directions to queue for Pac-Man in worlds p, DIR_NONE to keep the queued one."""
+        r = self.rules
+        if self.policy == "random":
+            change = p & (self.rng.random(self.count) < 1 / 30)
+            return np.where(change, self.rng.integers(1, 5, self.count), r.dir_none)
+
+        m = self.maze
+        danger = self.danger()
+        self.relax_field(danger)
+
+        tx, ty = self.ptx, self.pty
+        inside = p & (tx >= 0) & (tx < m.cols) & (ty >= 0) & (ty < m.rows)
+        tile = ty * m.cols + tx
+        decide = inside & ((tile != self.last_tile) | (self.pdir == r.dir_none))
+        self.last_tile = np.where(inside, tile, self.last_tile)
+
+        best = np.full(self.count, FAR)
+        best_dir = np.full(self.count, r.dir_none)
+        for d in self.turn_order:
+            nx, ny, ok = self.step_tile(tx, ty, d)
+            cell = m.cell(nx, np.clip(ny, -1, m.rows))
+            ok &= ~m.blocked[cell] & ~danger[self.index, cell]
+            cost = np.where(ok, self.field[self.index, cell], FAR)
+            better = cost < best
+            best = np.where(better, cost, best)
+            best_dir = np.where(better, d, best_dir)
+        flee = decide & (best >= FAR)
+        return np.where(decide, np.where(flee, self.flee(tx, ty), best_dir), r.dir_none)
+
+    def step_tile(self, tx, ty, d):
+        """The tile next to (tx, ty) in direction d the autopilot search visits, and if it is in the maze."""
+        m = self.maze
+        nx = tx + self.dx[d]
+        ny = ty + self.dy[d]
+        ok = (ny >= 0) & (ny < m.rows)
+        outside = (nx < 0) | (nx >= m.cols)
+        ok &= ~outside | self.tunnel_row(ty)
+        return nx % m.cols, ny, ok
+
+    def danger(self):
+        """Tiles within DANGER_DISTANCE of a ghost that can kill Pac-Man, a bordered map per world."""
+        r = self.rules
+        m = self.maze
+        pad = DANGER_DISTANCE + 2
+        danger = np.zeros((self.count, m.rows + 2 * pad, m.cols + 2 * pad), dtype=bool)
+        for g in range(4):
+            deadly = (self.mode[:, g] != r.mode_frightened) & (self.mode[:, g] != r.mode_eaten) & ~self.in_house[:, g]
+            w = self.index[deadly]
+            for ox in range(-DANGER_DISTANCE, DANGER_DISTANCE + 1):
+                for oy in range(abs(ox) - DANGER_DISTANCE, DANGER_DISTANCE - abs(ox) + 1):
+                    danger[w, self.gty[w, g] + oy + pad, self.gtx[w, g] + ox + pad] = True
+        return danger[:, pad - 1:pad + m.rows + 1, pad - 1:pad + m.cols + 1].reshape(self.count, m.size)
+
+    def relax_field(self, danger):
+        """One step of the distance field from every tile to the nearest dot, avoiding danger."""
+        m = self.maze
+        f = self.field
+        s = m.stride
+        # the tunnel rows wrap around through their border tiles
+        f[:, m.wrap_left] = f[:, m.wrap_right - 1]
+        f[:, m.wrap_right] = f[:, m.wrap_left + 1]
+        # rows 1 to rows of the map, neighbors are a row or a tile away in the flat map
+        near = np.minimum(f[:, :-2 * s], f[:, 2 * s:])
+        np.minimum(near, f[:, s - 1:-s - 1], out=near)
+        np.minimum(near, f[:, s + 1:-s + 1], out=near)
+        near += 1
+        np.minimum(near, FAR, out=near)
+        # blocked tiles are FAR and dots 0, by arithmetic (much faster than masked stores)
+        inner = slice(s, -s)
+        np.maximum(near, (danger[:, inner] | m.blocked[inner]) * np.int16(FAR), out=near)
+        near *= (self.items[:, inner] == 0) | danger[:, inner]
+        f[:, inner] = near
+
+    def flee(self, tx, ty):
+        """autopilot.flee(): the open direction furthest from the closest ghost that is not frightened or eaten."""
+        r = self.rules
+        m = self.maze
+        best = np.full(self.count, -1)
+        best_dir = np.full(self.count, r.dir_none)
+        for d in self.turn_order:
+            nx = (tx + self.dx[d]) % m.cols
+            ny = ty + self.dy[d]
+            ok = (ny >= 0) & (ny < m.rows) & ((self.attr(nx, ny) & A_REACH) != 0)
+            dist = np.full(self.count, 999)
+            for g in range(4):
+                deadly = (self.mode[:, g] != r.mode_frightened) & (self.mode[:, g] != r.mode_eaten)
+                ghost_dist = np.abs(self.gtx[:, g] - nx) + np.abs(self.gty[:, g] - ny)
+                dist = np.where(deadly, np.minimum(dist, ghost_dist), dist)
+            better = ok & (dist > best)
+            best = np.where(better, dist, best)
+            best_dir = np.where(better, d, best_dir)
+        return best_dir
+
+    # -------------------------------------------------------------------------
+    # Pac-Man
+    # -------------------------------------------------------------------------
+
+    def update_pacman(self, p):
+        """PacMan.update() in worlds p, returns the item eaten in each world."""
+        r = self.rules
+        m = self.maze
+        speed = r.pacman_speed
+        d0 = self.pdir
+        n0 = self.pnext
+        d = d0.copy()
+        n = n0.copy()
+        x = self.px
+        y = self.py
+
+        reversing = p & (n0 != r.dir_none) & (self.opposite[d0] == n0)
+        turn = reversing & self.can_move(x, y, n0, speed)
+        starting = p & ~reversing & (d0 == r.dir_none) & (n0 != r.dir_none)
+        turn |= starting & self.can_move(x, y, n0, speed)
+        d = np.where(turn, n0, d)
+        n = np.where(turn, r.dir_none, n)
+
+        center = p & ~reversing & ~starting & self.at_tile_center(x, y, speed)
+        turn = center & (n0 != r.dir_none) & (n0 != d0) & self.can_turn(n0)
+        x = np.where(turn, self.snap(x), x)
+        y = np.where(turn, self.snap(y), y)
+        d = np.where(turn, n0, d)
+        n = np.where(turn, r.dir_none, n)
+        stop = center & (d != r.dir_none) & ~self.can_move(x, y, d, speed)
+        x = np.where(stop, self.snap(x), x)
+        y = np.where(stop, self.snap(y), y)
+        d = np.where(stop, r.dir_none, d)
+
+        move = p & self.can_move(x, y, d, speed)
+        x = np.where(move, x + self.dx[d] * speed, x)
+        y = np.where(move, y + self.dy[d] * speed, y)
+        x = np.where(move & (x < -16), r.game_width, np.where(move & (x >= r.game_width), -16, x))
+
+        self.px = np.where(p, x, self.px)
+        self.py = np.where(p, y, self.py)
+        self.pdir = np.where(p, d, self.pdir)
+        self.pnext = np.where(p, n, self.pnext)
+        self.ptx = np.where(p, np.floor((self.px + 8) / 8).astype(np.int32), self.ptx)
+        self.pty = np.where(p, np.floor((self.py + 8) / 8).astype(np.int32), self.pty)
+
+        tx, ty = self.ptx, self.pty
+        eat = p & self.at_tile_center(self.px, self.py, speed) & (tx >= 0) & (tx < m.cols) & (ty >= 0) & (ty < m.rows)
+        cell = m.cell(np.clip(tx, 0, m.cols - 1), np.clip(ty, 0, m.rows - 1))
+        item = np.where(eat, self.items[self.index, cell], 0)
+        self.items[self.index[item > 0], cell[item > 0]] = 0
+        return np.minimum(item, 2)
+
+    # -------------------------------------------------------------------------
+    # Ghosts
+    # -------------------------------------------------------------------------
+
+    def draw(self, g, calls, w):
+        """The next random number of ghost g in worlds w (random.randrange() and random.choice())."""
+        u = self.draws[self.index, g, np.minimum(calls, 2)]
+        calls += w
+        return u
+
+    def chase_target(self, g):
+        """ai.chase_target() of ghost g."""
+        r = self.rules
+        px, py, pd = self.ptx, self.pty, self.pdir
+        if g == 0:
+            return px, py
+        if g == 1 or g == 2:
+            ahead = 4 if g == 1 else 2
+            up = pd == r.dir_up
+            tx = px + np.where(up, -ahead, self.dx[pd] * ahead)
+            ty = py + self.dy[pd] * ahead
+            if g == 1:
+                return tx, ty
+            bx, by = self.gtx[:, 0], self.gty[:, 0]
+            return bx + (tx - bx) * 2, by + (ty - by) * 2
+        far = (self.gtx[:, g] - px) ** 2 + (self.gty[:, g] - py) ** 2 > 64
+        sx, sy = self.maze.scatter[g]
+        return np.where(far, px, sx), np.where(far, py, sy)
+
+    def best_direction(self, g, tx, ty):
+        """ai.best_direction() of ghost g, returns (best direction, open directions, their number)."""
+        r = self.rules
+        m = self.maze
+        d0 = self.gdir[:, g]
+        gx, gy = self.gtx[:, g], self.gty[:, g]
+        mode = self.mode[:, g]
+        best = np.full(self.count, 999999)
+        best_dir = d0.copy()
+        valid = np.zeros((self.count, 4), dtype=np.int32)
+        count = np.zeros(self.count, dtype=np.int32)
+        for d in self.turn_order:
+            nx = gx + self.dx[d]
+            ny = gy + self.dy[d]
+            attr = self.attr(nx, ny)
+            inside = (nx >= 0) & (nx < m.cols) & (ny >= 0) & (ny < m.rows)
+            ok = inside & ((attr & A_WALL) == 0)
+            ok &= ~((d == r.dir_down) & ((attr & A_DOOR) != 0) & ~self.in_house[:, g] & (mode != r.mode_eaten))
+            ok |= ~inside & (ny >= 0) & (ny < m.rows) & self.tunnel_row(ny)
+            ok &= self.opposite[d0] != d
+            valid[self.index[ok], count[ok]] = d
+            count += ok
+            dist = (nx - tx) ** 2 + (ny - ty) ** 2
+            better = ok & (mode != r.mode_frightened) & (dist < best)
+            best = np.where(better, dist, best)
+            best_dir = np.where(better, d, best_dir)
+        return best_dir, valid, count
+
+    def update_ghost(self, g, a):
+        """Ghost.update() of ghost g in worlds a."""
+        r = self.rules
+        m = self.maze
+        speed = r.ghost_speed
+        calls = np.zeros(self.count, dtype=np.int32)
+        x = self.gx[:, g].copy()
+        y = self.gy[:, g].copy()
+        d = self.gdir[:, g].copy()
+        mode = self.mode[:, g].copy()
+        in_house = self.in_house[:, g].copy()
+
+        # ghost house: leave when released, bounce until then
+        h = a & in_house
+        self.house_timer[h, g] += 1
+        leave = h & (self.house_timer[:, g] > self.rules.release[g])
+        door_x = m.door_x * 8
+        door_y = (m.door_y - 1) * 8 - 4
+        align = leave & (np.abs(x - door_x) >= speed)
+        right = x < door_x
+        x = np.where(align, np.where(right, x + speed, x - speed), x)
+        d = np.where(align, np.where(right, r.dir_right, r.dir_left), d)
+        rise = leave & ~align
+        x = np.where(rise, door_x, x)
+        y = np.where(rise, y - speed, y)
+        d = np.where(rise, r.dir_up, d)
+        out = rise & (y <= door_y)
+        y = np.where(out, door_y, y)
+        in_house = np.where(out, False, in_house)
+        d = np.where(out, r.dir_left, d)
+        bounce = h & ~leave
+        home_y = m.home_y * 8 - 4
+        up = d == r.dir_up
+        y = np.where(bounce, np.where(up, y - speed / 2, y + speed / 2), y)
+        d = np.where(bounce & up & (y < home_y - 3), r.dir_down, d)
+        d = np.where(bounce & ~up & (y > home_y + 3), r.dir_up, d)
+        a = a & ~h
+
+        # reverse after a mode change
+        rev = self.opposite[d]
+        pending = a & self.reverse[:, g]
+        self.reverse[pending, g] = False
+        turn = pending & self.can_move(x, y, rev, speed, mode, in_house)
+        d = np.where(turn, rev, d)
+        x = np.where(turn, self.snap(x), x)
+        y = np.where(turn, self.snap(y), y)
+        a = a & ~turn
+
+        # choose a direction at tile centers
+        eaten = mode == r.mode_eaten
+        center = a & self.at_tile_center(x, y, np.where(eaten, 1.5, 0.7))
+        tx = np.zeros(self.count, dtype=np.int32)
+        ty = np.zeros(self.count, dtype=np.int32)
+        chase_x, chase_y = self.chase_target(g)
+        chase = mode == r.mode_chase
+        tx = np.where(chase, chase_x, tx)
+        ty = np.where(chase, chase_y, ty)
+        scatter = mode == r.mode_scatter
+        tx = np.where(scatter, m.scatter[g][0], tx)
+        ty = np.where(scatter, m.scatter[g][1], ty)
+        gtx, gty = self.gtx[:, g], self.gty[:, g]
+        at_door_x = (gtx == m.door_x) | (gtx == m.door_x + 1)
+        tx = np.where(eaten, m.door_x, tx)
+        ty = np.where(eaten, np.where((gty == m.door_y - 1) & at_door_x, m.home_y, m.door_y - 1), ty)
+        revive = center & eaten & (gty >= m.home_y) & at_door_x
+        mode = np.where(revive, self.current_mode, mode)
+        in_house = np.where(revive, True, in_house)
+        self.house_timer[revive, g] = 0
+        d = np.where(revive, r.dir_up, d)
+        x = np.where(revive, door_x, x)
+        y = np.where(revive, home_y, y)
+        self.gtx[revive, g] = m.door_x
+        self.gty[revive, g] = m.home_y
+        center &= ~revive
+        a = a & ~revive
+
+        self.gdir[:, g] = d
+        self.mode[:, g] = mode
+        self.in_house[:, g] = in_house
+        best_dir, valid, count = self.best_direction(g, tx, ty)
+        frightened = center & (mode == r.mode_frightened)
+        pick = frightened & (count > 0)
+        u = self.draw(g, calls, pick)
+        d = np.where(pick, valid[self.index, np.floor(u * count).astype(np.int32) % 4], d)
+        door = center & eaten & at_door_x
+        into_door = door & ((gty == m.door_y - 1) | (gty == m.door_y))
+        d = np.where(into_door, r.dir_down, d)
+        door_center = gtx * 8 - 4
+        x = np.where(into_door & (np.abs(x - door_center) > 1.0), door_center, x)
+        through_door = door & ~into_door & (gty == m.door_y + 1)
+        d = np.where(through_door, r.dir_down, d)
+        d = np.where(center & ~frightened & ~into_door & ~through_door, best_dir, d)
+        x = np.where(center, self.snap(x), x)
+        y = np.where(center, self.snap(y), y)
+
+        # move, or recover when the way is blocked
+        moving = a & (d != r.dir_none)
+        step = np.where(mode == r.mode_frightened, speed * 0.6, np.where(mode == r.mode_eaten, 2.0, speed))
+        move = moving & self.can_move(x, y, d, speed, mode, in_house)
+        x = np.where(move, x + self.dx[d] * step, x)
+        y = np.where(move, y + self.dy[d] * step, y)
+        x = np.where(move & (x < -16), r.game_width, np.where(move & (x >= r.game_width), -16, x))
+        stuck = moving & ~move
+        rev = self.opposite[d]
+        can_reverse = np.zeros(self.count, dtype=bool)
+        turns = np.zeros((self.count, 4), dtype=np.int32)
+        turn_count = np.zeros(self.count, dtype=np.int32)
+        for t in self.stuck_order:
+            ok = stuck & self.can_move(x, y, np.full(self.count, t), speed, mode, in_house)
+            can_reverse |= ok & (rev == t)
+            ok &= rev != t
+            turns[self.index[ok], turn_count[ok]] = t
+            turn_count += ok
+        pick = stuck & (turn_count > 0)
+        u = self.draw(g, calls, pick)
+        d = np.where(pick, turns[self.index, np.floor(u * turn_count).astype(np.int32) % 4], d)
+        x = np.where(pick, self.snap(x), x)
+        y = np.where(pick, self.snap(y), y)
+        d = np.where(stuck & ~pick & can_reverse, rev, d)
+
+        self.gtx[a, g] = np.floor((x[a] + 8) / 8).astype(np.int32)
+        self.gty[a, g] = np.floor((y[a] + 8) / 8).astype(np.int32)
+
+        # hovering check
+        first = a & np.isnan(self.last_x[:, g])
+        self.last_x[first, g] = x[first]
+        self.last_y[first, g] = y[first]
+        self.stuck_frames[first, g] = 0
+        still = a & (np.abs(x - self.last_x[:, g]) < 0.1) & (np.abs(y - self.last_y[:, g]) < 0.1)
+        self.stuck_frames[still, g] += 1
+        hover = still & (self.stuck_frames[:, g] > 60)
+        self.stuck_frames[hover, g] = 0
+        u = self.draw(g, calls, hover)
+        d = np.where(hover, np.array(self.stuck_order)[np.floor(u * 4).astype(np.int32) % 4], d)
+        moved = a & ~still
+        self.stuck_frames[moved, g] = 0
+        self.last_x[moved, g] = x[moved]
+        self.last_y[moved, g] = y[moved]
+
+        self.gx[:, g] = x
+        self.gy[:, g] = y
+        self.gdir[:, g] = d
+
+    # -------------------------------------------------------------------------
+    # Frames
+    # -------------------------------------------------------------------------
+
+    def frighten(self, w):
+        """A power pellet was eaten in worlds w."""
+        r = self.rules
+        hit = w[:, None] & (self.mode != r.mode_eaten)
+        self.mode[hit] = r.mode_frightened
+        self.frightened_timer[hit] = 0
+        self.reverse |= hit & ~self.in_house
+
+    def play(self, p):
+        """One frame of code.py in STATE_PLAY, in worlds p."""
+        r = self.rules
+        m = self.maze
+
+        # mode timer
+        index = np.minimum(self.mode_index, len(self.mode_frames) - 1)
+        switch = p & (self.mode_index < len(self.mode_frames)) & (self.mode_clock > self.mode_frames[index])
+        self.mode_index += switch
+        self.mode_clock[switch] = 0
+        scatter = self.current_mode == r.mode_scatter
+        self.current_mode = np.where(switch, np.where(scatter, r.mode_chase, r.mode_scatter), self.current_mode)
+        hit = switch[:, None] & (self.mode != r.mode_frightened) & (self.mode != r.mode_eaten)
+        self.mode = np.where(hit, self.current_mode[:, None], self.mode)
+        self.reverse |= hit & ~self.in_house
+
+        self.input = self.steer(p)
+        self.pnext = np.where(p & (self.input != r.dir_none), self.input, self.pnext)
+
+        item = self.update_pacman(p)
+        dot = item == 1
+        pellet = item == 2
+        self.score += 10 * dot + 50 * pellet
+        self.dots_eaten += dot | pellet
+        self.dots += dot | pellet
+        self.pellets += pellet
+        spawn = dot & np.isin(self.dots_eaten, FRUIT_DOTS)
+        self.fruit_active |= spawn
+        self.fruit_timer[spawn] = 0
+        self.ghosts_eaten_count[pellet] = 0
+        self.frighten(pellet)
+
+        self.play_frames += p
+        self.mode_play_frames[:, 0] += p & (self.current_mode == r.mode_scatter)
+        self.mode_play_frames[:, 1] += p & (self.current_mode == r.mode_chase)
+        self.mode_play_frames[:, 2] += p & (self.mode == r.mode_frightened).any(axis=1)
+
+        self.collided = np.zeros(self.count, dtype=bool)
+        active = p.copy()
+        for g in range(4):
+            frightened = active & (self.mode[:, g] == r.mode_frightened)
+            self.frightened_timer[frightened, g] += 1
+            expired = frightened & (self.frightened_timer[:, g] > r.frightened_duration)
+            self.mode[expired, g] = self.current_mode[expired]
+
+            self.update_ghost(g, active)
+
+            hit = active & (np.abs((self.px + 8) - (self.gx[:, g] + 8)) < 6) & (np.abs((self.py + 8) - (self.gy[:, g] + 8)) < 6)
+            self.collided |= hit & (self.mode[:, g] != r.mode_eaten)
+            eat = hit & (self.mode[:, g] == r.mode_frightened)
+            self.score += eat * 200 * 2 ** self.ghosts_eaten_count
+            self.ghosts_eaten_count += eat
+            self.ghosts_eaten += eat
+            self.state[eat] = FREEZE
+            self.timer[eat] = 0
+            self.saved_x = np.where(eat, self.px, self.saved_x)
+            self.saved_y = np.where(eat, self.py, self.saved_y)
+            self.px = np.where(eat, self.gx[:, g], self.px)
+            self.py = np.where(eat, self.gy[:, g], self.py)
+            self.mode[eat, g] = r.mode_eaten
+            die = hit & ~eat & (self.mode[:, g] != r.mode_eaten)
+            self.deaths[self.index[die], np.where(self.current_mode[die] == r.mode_chase, 1, 0)] += 1
+            self.state[die] = DYING
+            self.timer[die] = 0
+            active &= ~die
+
+        # bonus fruit
+        fruit = p & self.fruit_active
+        self.fruit_timer += fruit
+        expired = fruit & (self.fruit_timer > FRUIT_FRAMES)
+        self.fruit_active &= ~expired
+        fruit &= ~expired
+        eat = fruit & (np.abs((self.px + 8) - (m.fruit_x * 8 + 8)) < 8) & (np.abs((self.py + 8) - (m.fruit_y * 8 + 8)) < 8)
+        points = np.array(r.fruit_points)[np.minimum(self.level - 1, len(r.fruit_points) - 1)]
+        self.score += eat * points
+        self.fruit_active &= ~eat
+        self.state[eat] = FREEZE
+        self.timer[eat] = 0
+        self.saved_x = np.where(eat, self.px, self.saved_x)
+        self.saved_y = np.where(eat, self.py, self.saved_y)
+
+        # level complete
+        done = p & (self.dots_eaten >= m.total_dots)
+        self.state[done] = LEVEL_COMPLETE
+        self.timer[done] = 0
+
+    def step(self):
+        """Advance every world by one frame."""
+        self.draws = self.rng.random((self.count, 4, 3))
+        state = self.state.copy()
+        self.timer += 1
+
+        freeze = (state == FREEZE) & (self.timer >= FREEZE_FRAMES)
+        self.state[freeze] = PLAY
+        # the ghost score was shown with Pac-Man's sprite, eating the fruit moved nothing
+        self.px = np.where(freeze, self.saved_x, self.px)
+        self.py = np.where(freeze, self.saved_y, self.py)
+
+        died = (state == DYING) & (self.timer >= DEATH_FRAMES)
+        self.lives -= died
+        over = died & (self.lives <= 0)
+        self.state[over] = GAME_OVER
+        again = died & ~over
+        self.reset_actors(again)
+        self.state[again] = PLAY
+
+        cleared = (state == LEVEL_COMPLETE) & (self.timer >= LEVEL_COMPLETE_FRAMES)
+        self.levels_cleared += cleared
+        self.first_clear = np.where(cleared & (self.first_clear < 0), self.play_frames, self.first_clear)
+        self.level += cleared
+        self.dots_eaten[cleared] = 0
+        self.items[cleared] = self.maze.items
+        self.fruit_active &= ~cleared
+        self.reset_actors(cleared)
+        self.state[cleared] = PLAY
+
+        self.play(state == PLAY)
+        self.mode_clock += self.state != GAME_OVER
+
+    def report(self, frames:int, seconds:float) -> None:
+        playing = np.maximum(self.play_frames, 1) / 3600 # minutes
+        over = self.state == GAME_OVER
+        survival = self.play_frames / 60
+        print(f"Simulated {self.count} worlds x {frames} frames ({frames / 60:.0f}s of game time) "
+              f"in {seconds:.1f}s, {self.count * frames / seconds:,.0f} world-frames/s")
+        print(f"Game over: {over.sum()} of {self.count} worlds ({over.mean():.1%}), "
+              f"{self.deaths.sum() / self.count:.2f} deaths per world")
+        if over.any():
+            p10, p50, p90 = np.percentile(survival[over], (10, 50, 90))
+            print(f"Survival (game over worlds): mean {survival[over].mean():.1f}s, "
+                  f"p10 {p10:.1f}s, median {p50:.1f}s, p90 {p90:.1f}s of play")
+        print(f"Dots: {self.dots.mean():.0f} per world, {(self.dots / playing).mean():.0f} per minute of play")
+        cleared = self.first_clear >= 0
+        print(f"Level 1 cleared: {cleared.mean():.1%} of worlds"
+              + (f", after {self.first_clear[cleared].mean() / 60:.1f}s of play on average" if cleared.any() else ""))
+        print(f"Levels cleared: mean {self.levels_cleared.mean():.2f}, max {self.levels_cleared.max()}; "
+              f"score: mean {self.score.mean():.0f}, max {self.score.max()}")
+        total = max(self.play_frames.sum(), 1)
+        for i, name in enumerate(("scatter", "chase")):
+            minutes = max(self.mode_play_frames[:, i].sum() / 3600, 1 / 3600)
+            print(f"  {name:<10} {self.mode_play_frames[:, i].sum() / total:6.1%} of play, "
+                  f"{self.deaths[:, i].sum() / minutes:.2f} deaths per minute")
+        pellets = max(self.pellets.sum(), 1)
+        print(f"  {'frightened':<10} {self.mode_play_frames[:, 2].sum() / total:6.1%} of play with a frightened ghost, "
+              f"{self.ghosts_eaten.sum() / pellets:.2f} ghosts eaten per power pellet")
+
+def run(maze:Maze, rules:Rules, worlds:int, frames:int, policy:str, seed:int) -> None:
+    sim = Worlds(maze, rules, worlds, policy, seed)
+    start = time.perf_counter()
+    for _ in range(frames):
+        sim.step()
+        if (sim.state == GAME_OVER).all():
+            break
+    sim.report(_ + 1, time.perf_counter() - start)
+
+# =============================================================================
+# CONSISTENCY CHECK
+# =============================================================================
+
+class Stand:
+    """Takes any arguments, attributes and calls: the hardware the game logic never reads."""
+    value = True # buttons read as released
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return Stand()
+
+    def __call__(self, *args, **kwargs):
+        return Stand()
+
+class Grid:
+    """displayio.Bitmap, Palette and TileGrid: a size and the cells written to it."""
+
+    def __init__(self, *args, width=1, height=1, **kwargs):
+        if args and isinstance(args[0], int):
+            width, height = args[0], args[1] if len(args) > 1 else 1
+        self.width = width
+        self.height = height
+        self.cells = {}
+
+    def key(self, key):
+        return key[1] * self.width + key[0] if isinstance(key, tuple) else key
+
+    def __setitem__(self, key, value):
+        self.cells[self.key(key)] = value
+
+    def __getitem__(self, key):
+        return self.cells.get(self.key(key), 0)
+
+    def __len__(self):
+        return self.width
+
+    def make_transparent(self, index):
+        pass
+
+class Group(list):
+    def __init__(self, **kwargs):
+        super().__init__()
+
+class Draws:
+    """random for game/actors.py, handing out the simulator's numbers in order."""
+
+    def __init__(self):
+        self.queue = []
+
+    def randrange(self, n):
+        return int(self.queue.pop(0) * n)
+
+    def choice(self, seq):
+        return seq[int(self.queue.pop(0) * len(seq))]
+
+def load_reference(root:Path, maze_path:Path):
+    """Import game.actors and game.maze on the host, with stand-ins for the CircuitPython modules."""
+    def module(name, **attrs):
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+    module("board", __getattr__=lambda name: Stand())
+    module("digitalio", DigitalInOut=Stand, Pull=Stand())
+    module("pwmio", PWMOut=Stand)
+    module("micropython", const=lambda value: value)
+    module("bitmaptools", readinto=Stand())
+    module("displayio", Bitmap=Grid, Palette=Grid, TileGrid=Grid, Group=Group)
+    if not hasattr(gc, "mem_free"):
+        # room for load_asset() to load every image into a Grid
+        gc.mem_free = lambda: 1 << 20
+    os.environ["PACMAN_MAZE"] = str(maze_path.resolve().relative_to(root.resolve()))
+    os.environ.pop("PACMAN_DEBUG", None)
+    os.chdir(root)
+    sys.path.insert(0, str(root))
+    with contextlib.redirect_stdout(io.StringIO()):
+        from game import actors, maze
+    return actors, maze
+
+class Reference:
+    """One game played with the game's PacMan and Ghost classes, following the frame rules of code.py."""
+
+    def __init__(self, actors, game_maze, maze:Maze, rules:Rules, draws:Draws):
+        self.maze = maze
+        self.rules = rules
+        self.draws = draws
+        self.reset_dots = game_maze.reset_dots
+        self.reset_dots()
+        types = (actors.Ghost.TYPE_BLINKY, actors.Ghost.TYPE_PINKY, actors.Ghost.TYPE_INKY, actors.Ghost.TYPE_CLYDE)
+        self.pacman = actors.PacMan()
+        self.ghosts = [actors.Ghost(t, *spawn) for t, spawn in zip(types, maze.spawns)]
+        self.state = PLAY
+        self.timer = 0
+        self.score = 0
+        self.lives = 3
+        self.level = 1
+        self.dots_eaten = 0
+        self.ghosts_eaten_count = 0
+        self.fruit_active = False
+        self.fruit_timer = 0
+        self.reset_mode()
+
+    def reset_mode(self):
+        self.mode_index = 0
+        self.current_mode = self.rules.mode_scatter
+        self.mode_clock = 0
+
+    def reset_actors(self):
+        self.pacman.reset()
+        for g in self.ghosts:
+            g.reset()
+        self.reset_mode()
+
+    def step(self, direction, draws):
+        """One frame, direction is the input and draws the random numbers of each ghost."""
+        pacman = self.pacman
+        self.timer += 1
+        if self.state == FREEZE:
+            if self.timer >= FREEZE_FRAMES:
+                self.state = PLAY
+                pacman.x = pacman.saved_x
+                pacman.y = pacman.saved_y
+        elif self.state == DYING:
+            if self.timer >= DEATH_FRAMES:
+                self.lives -= 1
+                if self.lives <= 0:
+                    self.state = GAME_OVER
+                else:
+                    self.reset_actors()
+                    self.state = PLAY
+        elif self.state == LEVEL_COMPLETE:
+            if self.timer >= LEVEL_COMPLETE_FRAMES:
+                self.level += 1
+                self.dots_eaten = 0
+                self.reset_dots()
+                self.fruit_active = False
+                self.reset_actors()
+                self.state = PLAY
+        elif self.state == PLAY:
+            self.play(direction, draws)
+        if self.state != GAME_OVER:
+            self.mode_clock += 1
+
+    def play(self, direction, draws):
+        r = self.rules
+        m = self.maze
+        pacman = self.pacman
+        ghosts = self.ghosts
+        if self.mode_index < len(r.mode_times) and self.mode_clock > r.mode_times[self.mode_index] * 60:
+            self.mode_index += 1
+            self.mode_clock = 0
+            self.current_mode = r.mode_chase if self.current_mode == r.mode_scatter else r.mode_scatter
+            for g in ghosts:
+                if g.mode != r.mode_frightened and g.mode != r.mode_eaten:
+                    g.mode = self.current_mode
+                    if not g.in_house:
+                        g.reverse_pending = True
+        if direction != r.dir_none:
+            pacman.next_direction = direction
+
+        item = pacman.update()
+        if item == 1:
+            self.score += 10
+            self.dots_eaten += 1
+            if self.dots_eaten in FRUIT_DOTS:
+                self.fruit_active = True
+                self.fruit_timer = 0
+        elif item == 2:
+            self.score += 50
+            self.dots_eaten += 1
+            self.ghosts_eaten_count = 0
+            for g in ghosts:
+                if g.mode != r.mode_eaten:
+                    g.mode = r.mode_frightened
+                    g.frightened_timer = 0
+                    if not g.in_house:
+                        g.reverse_pending = True
+
+        for i, g in enumerate(ghosts):
+            if g.mode == r.mode_frightened:
+                g.frightened_timer += 1
+                if g.frightened_timer > r.frightened_duration:
+                    g.mode = self.current_mode
+            self.draws.queue = list(draws[i])
+            g.update(pacman, ghosts, self.current_mode)
+            if abs((pacman.x + 8) - (g.x + 8)) < 6 and abs((pacman.y + 8) - (g.y + 8)) < 6:
+                if g.mode == r.mode_frightened:
+                    self.score += 200 * 2 ** self.ghosts_eaten_count
+                    self.ghosts_eaten_count += 1
+                    self.state = FREEZE
+                    self.timer = 0
+                    pacman.saved_x = pacman.x
+                    pacman.saved_y = pacman.y
+                    pacman.x = g.x
+                    pacman.y = g.y
+                    g.mode = r.mode_eaten
+                elif g.mode != r.mode_eaten:
+                    self.state = DYING
+                    self.timer = 0
+                    break
+
+        if self.fruit_active:
+            self.fruit_timer += 1
+            if self.fruit_timer > FRUIT_FRAMES:
+                self.fruit_active = False
+            elif abs((pacman.x + 8) - (m.fruit_x * 8 + 8)) < 8 and abs((pacman.y + 8) - (m.fruit_y * 8 + 8)) < 8:
+                self.score += r.fruit_points[min(self.level - 1, len(r.fruit_points) - 1)]
+                self.fruit_active = False
+                self.state = FREEZE
+                self.timer = 0
+                pacman.saved_x = pacman.x
+                pacman.saved_y = pacman.y
+
+        if self.dots_eaten >= m.total_dots:
+            self.state = LEVEL_COMPLETE
+            self.timer = 0
+
+def check(root:Path, maze_path:Path, maze:Maze, rules:Rules, seeds:int, frames:int, policy:str) -> bool:
+    """Play each seed with the simulator and with game/actors.py, comparing every frame."""
+    actors, game_maze = load_reference(root, maze_path)
+    draws = Draws()
+    actors.random = draws
+    compared = 0
+    for seed in range(seeds):
+        sim = Worlds(maze, rules, 1, policy, seed)
+        game = Reference(actors, game_maze, maze, rules, draws)
+        for frame in range(frames):
+            sim.step()
+            game.step(int(sim.input[0]), sim.draws[0])
+
+            expected = [(game.state, game.score, game.lives, game.level, game.dots_eaten),
+                        (game.pacman.x, game.pacman.y, game.pacman.direction)] + [
+                        (g.x, g.y, g.direction, g.mode, g.in_house) for g in game.ghosts]
+            actual = [(sim.state[0], sim.score[0], sim.lives[0], sim.level[0], sim.dots_eaten[0]),
+                      (sim.px[0], sim.py[0], sim.pdir[0])] + [
+                      (sim.gx[0, i], sim.gy[0, i], sim.gdir[0, i], sim.mode[0, i], sim.in_house[0, i]) for i in range(4)]
+            for name, want, got in zip(("game", "pacman", "blinky", "pinky", "inky", "clyde"), expected, actual):
+                if any(abs(float(a) - float(b)) > 1e-9 for a, b in zip(want, got)):
+                    print(f"seed {seed} frame {frame}: {name} is {tuple(got)} in the simulator, {want} in the game")
+                    return False
+            compared += 1
+            if game.state == GAME_OVER:
+                break
+        print(f"seed {seed}: {frame + 1} frames match, score {game.score}, level {game.level}")
+    print(f"Consistent with game/actors.py over {compared} frames")
+    return True
+
+if __name__ == "__main__":
+    root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--root", type=Path, default=root)
+    parser.add_argument("--maze", type=Path, default=None, help="compiled maze (default mazes/pacman.bin)")
+    parser.add_argument("-n", "--worlds", type=int, default=1000)
+    parser.add_argument("--minutes", type=float, default=5, help="game time to simulate")
+    parser.add_argument("--policy", choices=("autopilot", "random"), default="autopilot")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode-times", type=float, nargs="+", help="scatter and chase durations in seconds")
+    parser.add_argument("--frightened", type=int, help="frightened duration in frames")
+    parser.add_argument("--pacman-speed", type=float)
+    parser.add_argument("--ghost-speed", type=float)
+    parser.add_argument("--release", type=int, nargs=2, metavar=("INKY", "CLYDE"),
+                        help="frames Inky and Clyde wait in the ghost house")
+    parser.add_argument("--check", type=int, metavar="SEEDS",
+                        help="compare this many seeds with game/actors.py instead (default rules only)")
+    args = parser.parse_args()
+
+    maze_path = args.maze or args.root / "mazes" / "pacman.bin"
+    maze = Maze(maze_path)
+    config = read_config(args.root / "game" / "config.py")
+    if args.check:
+        ok = check(args.root, maze_path, maze, Rules(config), args.check, int(args.minutes * 3600), args.policy)
+        sys.exit(0 if ok else 1)
+    run(maze, Rules(config, args), args.worlds, int(args.minutes * 3600), args.policy, args.seed)
@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Specializes the game source (code.py and the game package) for one device
+when building a release:
+
+    - DEVICE is set to the target device and every DEVICE comparison is folded,
+      dropping the branches of other devices
+    - DEBUG is set to False, dropping gated debug output
+    - statements after a return, raise, break or continue in the same block,
+      which folding leaves behind, and imports of DEVICE, DEBUG and the device
+      constants that nothing uses any more are dropped
+    - docstrings are removed, and comments do not survive the AST round trip
+
+CircuitPython compiles the source on the device at every boot, so less source
+means less parsing and less bytecode in RAM. The backends of other devices
+(game/<device>.py) are left out of a release entirely.
+"""
+import argparse
+import ast
+from pathlib import Path
+import shutil
+import subprocess
+import tempfile
+
+# build device name => DEVICE constant in game/config.py
+DEVICE_CONSTANTS = {
+    "fruitjam": "FRUIT_JAM",
+    "wio": "WIO",
+}
+
+# Names imported from game/config.py for the tests that are folded
+FOLDED_NAMES = {"DEVICE", "DEBUG", *DEVICE_CONSTANTS.values()}
+
+class Specializer(ast.NodeTransformer):
+
+    def __init__(self, device:str):
+        self.device = device
+
+    def known(self, node:ast.expr):
+        """The constant value of a DEVICE or DEBUG test, or None if it depends on runtime state."""
+        if isinstance(node, ast.Constant) and isinstance(node.value, bool):
+            return node.value
+        if isinstance(node, ast.Name) and node.id == "DEBUG":
+            return False
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            value = self.known(node.operand)
+            return None if value is None else not value
+        if isinstance(node, ast.Compare) and len(node.ops) == 1:
+            names = {
+                operand.id for operand in (node.left, node.comparators[0])
+                if isinstance(operand, ast.Name)
+            }
+            if "DEVICE" in names and len(names & set(DEVICE_CONSTANTS.values())) == 1:
+                same = self.device in names
+                if isinstance(node.ops[0], (ast.Is, ast.Eq)):
+                    return same
+                if isinstance(node.ops[0], (ast.IsNot, ast.NotEq)):
+                    return not same
+        return None
+
+    def fold_test(self, node:ast.expr) -> ast.expr:
+        """Simplify a condition, only valid where the result is used for its truth value."""
+        if isinstance(node, ast.BoolOp):
+            stop = isinstance(node.op, ast.Or) # the value that decides the result
+            values = []
+            for value in node.values:
+                value = self.fold_test(value)
+                known = self.known(value)
+                if known is stop:
+                    return ast.Constant(stop)
+                if known is None:
+                    values.append(value)
+            if not values:
+                return ast.Constant(not stop)
+            if len(values) == 1:
+                return values[0]
+            return ast.BoolOp(op=node.op, values=values)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self.fold_test(node.operand)
+            known = self.known(operand)
+            if known is not None:
+                return ast.Constant(not known)
+            return ast.UnaryOp(op=node.op, operand=operand)
+        known = self.known(node)
+        return node if known is None else ast.Constant(known)
+
+    def visit_If(self, node:ast.If):
+        self.generic_visit(node)
+        node.test = self.fold_test(node.test)
+        known = self.known(node.test)
+        if known is None:
+            return node
+        return node.body if known else node.orelse
+
+    def visit_IfExp(self, node:ast.IfExp):
+        self.generic_visit(node)
+        node.test = self.fold_test(node.test)
+        known = self.known(node.test)
+        if known is None:
+            return node
+        return node.body if known else node.orelse
+
+    def visit_Assign(self, node:ast.Assign):
+        self.generic_visit(node)
+        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            if node.targets[0].id == "DEVICE":
+                node.value = ast.Name(id=self.device, ctx=ast.Load())
+            elif node.targets[0].id == "DEBUG":
+                node.value = ast.Constant(False)
+        return node
+
+def statement_lists(tree:ast.Module):
+    """Every block of statements in the tree."""
+    for node in ast.walk(tree):
+        for field in ("body", "orelse", "finalbody"):
+            body = getattr(node, field, None)
+            if isinstance(body, list) and body and isinstance(body[0], ast.stmt):
+                yield body
+
+def drop_unreachable(tree:ast.Module) -> None:
+    """A folded branch can end in a return followed by the code of other devices."""
+    for body in statement_lists(tree):
+        for i, statement in enumerate(body):
+            if isinstance(statement, (ast.Return, ast.Raise, ast.Break, ast.Continue)):
+                del body[i + 1:]
+                break
+
+def drop_unused_imports(tree:ast.Module) -> None:
+    """Remove the FOLDED_NAMES that are not used any more from imports."""
+    used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    for body in statement_lists(tree):
+        for statement in body[:]:
+            if isinstance(statement, ast.ImportFrom):
+                statement.names = [
+                    alias for alias in statement.names
+                    if (alias.asname or alias.name) not in FOLDED_NAMES or (alias.asname or alias.name) in used
+                ]
+                if not statement.names:
+                    body.remove(statement)
+
+def strip_docstrings(tree:ast.Module) -> None:
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) \
+                and node.body and isinstance(node.body[0], ast.Expr) \
+                and isinstance(node.body[0].value, ast.Constant) and isinstance(node.body[0].value.value, str):
+            node.body.pop(0)
+
+def fill_empty_bodies(tree:ast.Module) -> None:
+    """Folding can empty a block, which has to hold at least a pass statement."""
+    for node in ast.walk(tree):
+        for field in ("body", "finalbody"):
+            if isinstance(getattr(node, field, None), list) and not getattr(node, field) \
+                    and not (field == "finalbody" or isinstance(node, ast.Module)):
+                setattr(node, field, [ast.Pass()])
+        if isinstance(node, ast.Try) and not node.handlers and not node.finalbody:
+            node.finalbody = [ast.Pass()]
+
+def source_files(root_dir:Path, device:str = None) -> dict:
+    """Python files of the game, {path relative to root_dir: path}, without the backends of other devices."""
+    files = {"code.py": root_dir / "code.py"}
+    for path in sorted((root_dir / "game").rglob("*.py")):
+        name = path.relative_to(root_dir).as_posix()
+        if device is not None and name in (f"game/{other}.py" for other in DEVICE_CONSTANTS if other != device):
+            continue
+        files[name] = path
+    return files
+
+def specialize(source:str, device:str) -> str:
+    """Return the source of a module specialized for a build device ("fruitjam" or "wio")."""
+    tree = ast.parse(source)
+    tree = Specializer(DEVICE_CONSTANTS[device]).visit(tree)
+    drop_unreachable(tree)
+    drop_unused_imports(tree)
+    strip_docstrings(tree)
+    fill_empty_bodies(tree)
+    return ast.unparse(ast.fix_missing_locations(tree)) + "\n"
+
+def bytecode_size(source:str) -> int|None:
+    """Size of the compiled .mpy, if mpy-cross is installed."""
+    mpy_cross = shutil.which("mpy-cross")
+    if mpy_cross is None:
+        return None
+    with tempfile.TemporaryDirectory() as temp_dir:
+        py_file = Path(temp_dir) / "code.py"
+        py_file.write_text(source)
+        subprocess.run([mpy_cross, str(py_file)], check=True, capture_output=True)
+        return py_file.with_suffix(".mpy").stat().st_size
+
+def report(name:str, sources:list, specialized:list) -> None:
+    """Print the total source and bytecode size of some files before and after specializing."""
+    message = "Specialized {}: source {} -> {} bytes".format(
+        name, sum(len(source.encode()) for source in sources), sum(len(source.encode()) for source in specialized),
+    )
+    before = [bytecode_size(source) for source in sources]
+    if None not in before:
+        after = [bytecode_size(source) for source in specialized]
+        message += f", bytecode {sum(before)} -> {sum(after)} bytes"
+    print(message)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("device", choices=sorted(DEVICE_CONSTANTS))
+    parser.add_argument("-r", "--root", type=Path, default=Path(__file__).parent.parent)
+    parser.add_argument("-o", "--output", type=Path, default=None,
+                        help="write the specialized sources to this directory instead of only reporting their size")
+    args = parser.parse_args()
+    all_sources = [path.read_text() for path in source_files(args.root).values()]
+    files = source_files(args.root, args.device)
+    specialized = {name: specialize(path.read_text(), args.device) for name, path in files.items()}
+    report(f"{len(files)} files for {args.device}", all_sources, list(specialized.values()))
+    if args.output is not None:
+        for name, source in specialized.items():
+            (args.output / name).parent.mkdir(parents=True, exist_ok=True)
+            (args.output / name).write_text(source)
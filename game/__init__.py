@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Pac-Man game modules, imported by code.py:
+
+    boot      boot timeline of the startup phases
+    config    device detection and constants
+    wio       Wio Terminal backend (display, switches, buzzer)
+    fruitjam  Fruit Jam backend (DVI display, serial keyboard, I2S audio)
+    display   display setup and BMP loading
+    maze      maze data, background, dots and power pellets
+    sprites   sprite atlas
+    audio     sound effects
+    controls  player input
+    ai        ghost targeting
+    actors    Pac-Man and the ghosts
+    hud       scoreboard, lives and level fruit
+    log       buffered serial console log
+    scores    persistent high score table
+    players   two-player alternating mode
+    pacing    frame pacing of the static states
+    suspend   suspend to sleep memory and deep sleep
+    wake      alarm that wakes a suspended game
+    autopilot self-playing soak runs and level frame statistics
+    audit     allocation audit of the frame phases
+    latency   input to display latency
+    benchmark display refresh benchmark
+
+Only the backend of the detected device is ever imported.
+"""
@@ -0,0 +1,869 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""Pac-Man and the ghosts: movement, animation and the ghost house."""
+import random
+
+from game.config import (
+    DEBUG, SCALE, OFFSET_X, OFFSET_Y, GAME_WIDTH, TILE_SIZE, MAZE_COLS, MAZE_ROWS,
+    PACMAN_SPEED, GHOST_SPEED, DIR_NONE, DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT,
+    A_WALL, A_DOOR, A_HOUSE, A_TUNNEL,
+    MODE_SCATTER, MODE_CHASE, MODE_FRIGHTENED, MODE_EATEN, FRIGHTENED_DURATION,
+)
+from game.maze import (
+    maze_attrs, items_grid, maze_cell, SCATTER_TARGETS, DOOR_X, DOOR_Y, HOME_Y,
+    PACMAN_START_TILE_X, PACMAN_START_TILE_Y, PACMAN_START_X, PACMAN_START_Y,
+)
+from game import log
+from game.display import place
+from game.sprites import new_sprite_grid, set_sprite_frame
+from game.audio import stop_sound
+from game.ai import chase_target, best_direction
+
+# =============================================================================
+# PAC-MAN CLASS
+# =============================================================================
+
+class PacMan:
+    """Pac-Man player character."""
+    
+    # Sprite positions in sprites.bmp (16x16 sprites)
+    # Based on actual sprite sheet analysis:
+    # Row 0: RIGHT animations, then UP animations
+    # Row 1: LEFT animations  
+    # Row 2: DOWN animations
+    # Format: (x, y) pixel position in sprite sheet
+    # Order: open mouth, half open, closed (full circle at 32,0)
+    FRAMES = {
+        DIR_RIGHT: [(0, 0), (16, 0), (32, 0)],      # Right: Row 0
+        DIR_LEFT: [(0, 16), (16, 16), (32, 0)],     # Left: Row 1
+        DIR_UP: [(0, 32), (16, 32), (32, 0)],       # Up: Row 2
+        DIR_DOWN: [(0, 48), (16, 48), (32, 0)],     # Down: Row 3
+    }
+    
+    # Death Animation Frames (Top Row, Tiles 3-13)
+    # x = 3*16 = 48, y = 0
+    # 11 frames fitting exactly to the end of the row (Tile 13)
+    DEATH_FRAMES = []
+    for i in range(11): # 11 frames
+        DEATH_FRAMES.append((48 + i * 16, 0))
+        
+    # Score Sprites (Row 8, Tiles 0-3)
+    # 200, 400, 800, 1600
+    SCORE_FRAMES = [
+        (0, 128),   # 200
+        (16, 128),  # 400
+        (32, 128),  # 800
+        (48, 128)   # 1600
+    ]
+    
+    def __init__(self):
+        # Create sprite using TileGrid (1x2 tiles of 16x8 = 16x16 sprite)
+        self.sprite = new_sprite_grid()
+        
+        # Starting position
+        # Arcade maze: (106, 181) looks perfect visually
+        # Center is at (114, 189), which is in tile (14, 23)
+        self.tile_x = PACMAN_START_TILE_X
+        self.tile_y = PACMAN_START_TILE_Y
+        self.x = PACMAN_START_X
+        self.y = PACMAN_START_Y
+        
+        # Saved position for score display
+        self.saved_x = 0
+        self.saved_y = 0
+        
+        # Movement
+        self.direction = DIR_NONE
+        self.next_direction = DIR_NONE
+        
+        # Animation
+        self.anim_frame = 0
+        self.anim_timer = 0
+        
+        # Set initial frame and position
+        self.set_frame(DIR_RIGHT, 0)
+        self.update_sprite_pos()
+    
+    def set_frame(self, direction, frame_idx):
+        """Set sprite tiles based on direction and animation frame."""
+        if direction == DIR_NONE:
+            direction = DIR_RIGHT
+        
+        frames = self.FRAMES.get(direction, self.FRAMES[DIR_RIGHT])
+        fx, fy = frames[frame_idx % 3]
+        
+        set_sprite_frame(self.sprite, fx, fy)
+    
+    def set_death_frame(self, frame_idx):
+        """Set sprite tiles for death animation."""
+        if frame_idx >= len(self.DEATH_FRAMES):
+            frame_idx = len(self.DEATH_FRAMES) - 1
+            
+        fx, fy = self.DEATH_FRAMES[frame_idx]
+        set_sprite_frame(self.sprite, fx, fy)
+
+    def set_score_frame(self, score_idx):
+        """Set sprite tiles for score display."""
+        if score_idx >= len(self.SCORE_FRAMES):
+            score_idx = len(self.SCORE_FRAMES) - 1
+            
+        fx, fy = self.SCORE_FRAMES[score_idx]
+        set_sprite_frame(self.sprite, fx, fy)
+
+    def reset(self):
+        """Reset Pac-Man to starting position."""
+        self.tile_x = PACMAN_START_TILE_X
+        self.tile_y = PACMAN_START_TILE_Y
+        self.x = PACMAN_START_X
+        self.y = PACMAN_START_Y
+        self.direction = DIR_NONE
+        self.next_direction = DIR_NONE
+        self.anim_frame = 0
+        self.anim_timer = 0
+        self.set_frame(DIR_RIGHT, 0)
+        self.update_sprite_pos()
+    
+    def update_sprite_pos(self):
+        """Update sprite screen position."""
+        place(self.sprite, int(OFFSET_X + self.x * SCALE), int(OFFSET_Y + self.y * SCALE), 16 * SCALE)
+    
+    def can_move(self, direction):
+        """Check if movement in direction is possible."""
+        next_x = self.x
+        next_y = self.y
+        
+        if direction == DIR_UP:
+            next_y -= PACMAN_SPEED
+        elif direction == DIR_DOWN:
+            next_y += PACMAN_SPEED
+        elif direction == DIR_LEFT:
+            next_x -= PACMAN_SPEED
+        elif direction == DIR_RIGHT:
+            next_x += PACMAN_SPEED
+        else:
+            return False
+        
+        # Calculate center of sprite for next position
+        center_x = next_x + 8
+        center_y = next_y + 8
+        
+        # STRICT TUNNEL CHECK
+        # If we are in the tunnel (horizontally outside or near edge), disallow vertical movement
+        # Tunnel is row 14.
+        # Maze width is 224 (28 tiles * 8).
+        # Left entrance: x < 8 (Tile 0)
+        # Right entrance: x > 216 (Tile 27)
+        if center_x < 8 or center_x > 216:
+            if direction == DIR_UP or direction == DIR_DOWN:
+                return False
+
+        # Tunnel wrap check (allow moving horizontally out of bounds)
+        if next_x < -8 or next_x >= GAME_WIDTH - 8:
+            return True
+            
+        # Standard Wall Collision
+        # Offset sensor in direction of movement
+        SENSOR_OFFSET = 3
+        
+        if direction == DIR_UP:
+            check_x = center_x
+            check_y = center_y - SENSOR_OFFSET
+        elif direction == DIR_DOWN:
+            check_x = center_x
+            check_y = center_y + SENSOR_OFFSET
+        elif direction == DIR_LEFT:
+            check_x = center_x - SENSOR_OFFSET
+            check_y = center_y
+        elif direction == DIR_RIGHT:
+            check_x = center_x + SENSOR_OFFSET
+            check_y = center_y
+            
+        tx = int(check_x // TILE_SIZE)
+        ty = int(check_y // TILE_SIZE)
+        
+        if ty < 0 or ty >= MAZE_ROWS:
+            return False
+
+        # Bounds check
+        if tx < 0 or tx >= MAZE_COLS:
+            # We are in the tunnel columns
+            return bool(maze_attrs[ty * MAZE_COLS] & A_TUNNEL)
+            
+        # Walls and the Ghost House Door are closed to Pac-Man
+        return not maze_attrs[ty * MAZE_COLS + tx] & (A_WALL | A_DOOR)
+
+    def can_turn(self, direction):
+        """Check if we can turn into the NEXT tile.
+        Unlike can_move, this checks the tile grid directly to prevent
+        turning into a wall even if we have pixel overlap space.
+        """
+        target_tx = int(self.tile_x)
+        target_ty = int(self.tile_y)
+        
+        if direction == DIR_UP:
+            target_ty -= 1
+        elif direction == DIR_DOWN:
+            target_ty += 1
+        elif direction == DIR_LEFT:
+            target_tx -= 1
+        elif direction == DIR_RIGHT:
+            target_tx += 1
+        
+        if target_ty < 0 or target_ty >= MAZE_ROWS:
+            return False
+
+        # Bounds/Tunnel check for turning
+        if target_tx < 0 or target_tx >= MAZE_COLS:
+            # Only allow turning into tunnel row
+            return bool(maze_attrs[target_ty * MAZE_COLS] & A_TUNNEL)
+            
+        # Walls and the Ghost House Door are closed to Pac-Man
+        return not maze_attrs[target_ty * MAZE_COLS + target_tx] & (A_WALL | A_DOOR)
+    
+    def at_tile_center(self):
+        """Check if we are close enough to a tile center to turn."""
+        center_x = self.x + 8
+        center_y = self.y + 8
+        
+        # Get distance to nearest tile center (which are at 4, 12, 20...)
+        # (val - 4) % 8 should be close to 0
+        dist_x = abs((center_x - 4) % 8)
+        dist_y = abs((center_y - 4) % 8)
+        
+        # Handle wrap-around for modulo (e.g. 7 is close to 0 mod 8)
+        dist_x = min(dist_x, 8 - dist_x)
+        dist_y = min(dist_y, 8 - dist_y)
+        
+        # Use <= to allow snapping even if we are 1 frame away
+        return dist_x <= PACMAN_SPEED and dist_y <= PACMAN_SPEED
+
+    def is_opposite(self, dir1, dir2):
+        """Check if two directions are opposite."""
+        return ((dir1 == DIR_UP and dir2 == DIR_DOWN) or
+                (dir1 == DIR_DOWN and dir2 == DIR_UP) or
+                (dir1 == DIR_LEFT and dir2 == DIR_RIGHT) or
+                (dir1 == DIR_RIGHT and dir2 == DIR_LEFT))
+
+    def update(self):
+        """Update position and animation, returns the item eaten (1 = dot, 2 = power pellet, 0 = none)."""
+        # 1. Handle Reversals (Immediate)
+        if self.next_direction != DIR_NONE and self.is_opposite(self.direction, self.next_direction):
+             if self.can_move(self.next_direction):
+                 # print(f"REVERSING to {self.next_direction}")
+                 self.direction = self.next_direction
+                 self.next_direction = DIR_NONE
+
+        # 2. Handle Starting from Stop
+        elif self.direction == DIR_NONE and self.next_direction != DIR_NONE:
+             if self.can_move(self.next_direction):
+                 # print(f"STARTING to {self.next_direction}")
+                 self.direction = self.next_direction
+                 self.next_direction = DIR_NONE
+
+                # 3. Handle Turns at Intersections
+        elif self.at_tile_center():
+            # Snap to grid if we are turning or stopping
+            # This prevents drift and ensures clean turns
+            
+            # Only turn if the new direction is different from current
+            # This prevents "snapping loop" when holding the button
+            if self.next_direction != DIR_NONE and self.next_direction != self.direction:
+                # Try to turn
+                # Use can_turn() instead of can_move() to ensure the target tile is actually open
+                if self.can_turn(self.next_direction):
+                    # print(f"TURNING at ({self.x},{self.y}) to {self.next_direction}")
+                    # SNAP to exact center
+                    center_x = self.x + 8
+                    center_y = self.y + 8
+                    tile_x = int(center_x // 8)
+                    tile_y = int(center_y // 8)
+                    self.x = tile_x * 8 + 4 - 8
+                    self.y = tile_y * 8 + 4 - 8
+                    
+                    self.direction = self.next_direction
+                    self.next_direction = DIR_NONE
+                else:
+                    # Debug why we can't turn
+                    # print(f"BLOCKED turning {self.next_direction} at ({self.x},{self.y})")
+                    pass
+            
+            # If we hit a wall, stop and snap
+            # Note: We only stop if the CURRENT direction is blocked.
+            # Trying to turn into a wall (next_direction) will just fail the turn
+            # and we will continue moving in the current direction.
+            if self.direction != DIR_NONE and not self.can_move(self.direction):
+                # print(f"HIT WALL at ({self.x},{self.y}) dir={self.direction}")
+                center_x = self.x + 8
+                center_y = self.y + 8
+                tile_x = int(center_x // 8)
+                tile_y = int(center_y // 8)
+                self.x = tile_x * 8 + 4 - 8
+                self.y = tile_y * 8 + 4 - 8
+                self.direction = DIR_NONE
+
+        # 4. Move
+        if self.direction != DIR_NONE:
+            if self.can_move(self.direction):
+                if self.direction == DIR_UP:
+                    self.y -= PACMAN_SPEED
+                elif self.direction == DIR_DOWN:
+                    self.y += PACMAN_SPEED
+                elif self.direction == DIR_LEFT:
+                    self.x -= PACMAN_SPEED
+                elif self.direction == DIR_RIGHT:
+                    self.x += PACMAN_SPEED
+                
+                # Tunnel wrap
+                if self.x < -16:
+                    self.x = GAME_WIDTH
+                elif self.x >= GAME_WIDTH:
+                    self.x = -16
+                
+                # Animate
+                self.anim_timer += 1
+                if self.anim_timer >= 3:
+                    self.anim_timer = 0
+                    self.anim_frame = (self.anim_frame + 1) % 3
+                    self.set_frame(self.direction, self.anim_frame)
+        
+        # Update positions
+        self.tile_x = int((self.x + 8) // TILE_SIZE)
+        self.tile_y = int((self.y + 8) // TILE_SIZE)
+        self.update_sprite_pos()
+        
+        # Eat items
+        # We use the center point to determine which tile we are on
+        # Only eat if we are close to the center to avoid accidental eating
+        if self.at_tile_center():
+            # Stop the waka sound briefly to create the alternating effect
+            stop_sound()
+            # Bounds check for tunnel
+            tx = int(self.tile_x)
+            ty = int(self.tile_y)
+            if 0 <= tx < MAZE_COLS and 0 <= ty < MAZE_ROWS:
+                # a flat index, items_grid[tx, ty] would allocate a tuple
+                i = maze_cell(ty * MAZE_COLS + tx)
+                item = items_grid[i]
+                if item: # Small Dot or Power Pellet (3 while blinked off)
+                    items_grid[i] = 0
+                    return min(item, 2)
+        return 0
+
+# =============================================================================
+# GHOST CLASS
+# =============================================================================
+
+# All directions, in the order stuck ghosts try them
+DIRECTIONS = (DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT)
+
+# Scratch buffers for the direction choice, shared by all ghosts so that
+# updating them allocates nothing
+valid_dirs = bytearray(4)
+possible_turns = bytearray(4)
+
+class Ghost:
+    """Ghost enemy character."""
+    
+    # Y-offsets in sprite sheet (assuming 1 row per ghost)
+    TYPE_BLINKY = 64
+    TYPE_PINKY = 80
+    TYPE_INKY = 96
+    TYPE_CLYDE = 112
+    
+    def __init__(self, ghost_type, start_tile_x, start_tile_y, x_offset=0):
+        self.ghost_type = ghost_type
+        self.start_params = (start_tile_x, start_tile_y, x_offset)
+        
+        self.sprite = new_sprite_grid()
+        
+        self.tile_x = start_tile_x
+        self.tile_y = start_tile_y
+        # Align to pixel grid (Center of 16x16 sprite on 8x8 tile)
+        # Tile Center = tile_x * 8 + 4
+        # Sprite Center = x + 8
+        # x + 8 = tile_x * 8 + 4  =>  x = tile_x * 8 - 4
+        self.x = self.tile_x * 8 - 4 + x_offset
+        self.y = self.tile_y * 8 - 4
+        
+        self.direction = DIR_LEFT
+        self.next_direction = DIR_NONE
+        
+        # Ghost House State
+        self.in_house = False
+        self.house_timer = 0
+        if self.ghost_type != Ghost.TYPE_BLINKY:
+            self.in_house = True
+            # Initial bounce direction
+            if self.ghost_type == Ghost.TYPE_PINKY:
+                self.direction = DIR_DOWN # Start moving down to bounce
+            else:
+                self.direction = DIR_UP
+        
+        self.anim_frame = 0
+        self.anim_timer = 0
+        
+        self.mode = MODE_SCATTER
+        self.reverse_pending = False
+        self.frightened_timer = 0
+        
+        # Chase target and number of open directions, set by game.ai
+        self.target_x = 0
+        self.target_y = 0
+        self.valid_count = 0
+        
+        # Position seen by the stuck check (None until the first update)
+        self.last_x = None
+        self.last_y = 0
+        self.stuck_frames = 0
+        
+        # Scatter Targets (Fixed Corners, from the maze file)
+        # Arcade maze:
+        # Blinky: Top-Right (25, -3) - Outside maze to force Up/Right bias
+        # Pinky: Top-Left (2, -3)
+        # Inky: Bottom-Right (27, 31)
+        # Clyde: Bottom-Left (0, 31)
+        self.scatter_target = SCATTER_TARGETS[(self.ghost_type - Ghost.TYPE_BLINKY) // 16]
+        
+        self.set_frame(self.direction, 0)
+        self.update_sprite_pos()
+        
+    def set_frame(self, direction, frame_idx):
+        base_y = self.ghost_type
+        base_x = 0
+        
+        # Override for Frightened / Eaten modes
+        if self.mode == MODE_FRIGHTENED:
+            base_y = 64 # Row 4
+            # Flash white if timer is nearing end (last ~2 seconds)
+            # Timer counts UP from 0 to FRIGHTENED_DURATION
+            if self.frightened_timer > (FRIGHTENED_DURATION - 200) and (self.frightened_timer // 10) % 2 == 0:
+                base_x = 160 # White Ghosts (Tiles 10-11)
+            else:
+                base_x = 128 # Blue Ghosts (Tiles 8-9)
+            
+            base_x += (frame_idx % 2) * 16
+            
+        elif self.mode == MODE_EATEN:
+            base_y = 80 # Row 5 (Eyes)
+            # Eyes Direction: Right, Left, Up, Down
+            if direction == DIR_RIGHT:
+                base_x = 128
+            elif direction == DIR_LEFT:
+                base_x = 144
+            elif direction == DIR_UP:
+                base_x = 160
+            elif direction == DIR_DOWN:
+                base_x = 176
+            else:
+                base_x = 128
+            
+        else:
+            # Normal Ghost
+            # Layout assumption: Right, Left, Up, Down (2 frames each)
+            if direction == DIR_RIGHT:
+                base_x = 0
+            elif direction == DIR_LEFT:
+                base_x = 32
+            elif direction == DIR_UP:
+                base_x = 64
+            elif direction == DIR_DOWN:
+                base_x = 96
+            else:
+                base_x = 0 # Default
+                
+            base_x += (frame_idx % 2) * 16
+        
+        set_sprite_frame(self.sprite, base_x, base_y)
+
+    def update_sprite_pos(self):
+        place(self.sprite, int(OFFSET_X + self.x * SCALE), int(OFFSET_Y + self.y * SCALE), 16 * SCALE)
+
+    def can_move(self, direction):
+        """Check if movement in direction is possible."""
+        next_x = self.x
+        next_y = self.y
+        
+        if direction == DIR_UP:
+            next_y -= GHOST_SPEED
+        elif direction == DIR_DOWN:
+            next_y += GHOST_SPEED
+        elif direction == DIR_LEFT:
+            next_x -= GHOST_SPEED
+        elif direction == DIR_RIGHT:
+            next_x += GHOST_SPEED
+        else:
+            return False
+        
+        center_x = next_x + 8
+        center_y = next_y + 8
+        
+        # STRICT TUNNEL CHECK
+        if center_x < 8 or center_x > 216:
+            if direction == DIR_UP or direction == DIR_DOWN:
+                return False
+
+        if next_x < -8 or next_x >= GAME_WIDTH - 8:
+            return True
+            
+        SENSOR_OFFSET = 3
+        
+        if direction == DIR_UP:
+            check_x = center_x
+            check_y = center_y - SENSOR_OFFSET
+        elif direction == DIR_DOWN:
+            check_x = center_x
+            check_y = center_y + SENSOR_OFFSET
+        elif direction == DIR_LEFT:
+            check_x = center_x - SENSOR_OFFSET
+            check_y = center_y
+        elif direction == DIR_RIGHT:
+            check_x = center_x + SENSOR_OFFSET
+            check_y = center_y
+            
+        tx = int(check_x // TILE_SIZE)
+        ty = int(check_y // TILE_SIZE)
+        
+        if ty < 0 or ty >= MAZE_ROWS:
+            return False
+
+        if tx < 0 or tx >= MAZE_COLS:
+            return bool(maze_attrs[ty * MAZE_COLS] & A_TUNNEL)
+            
+        attr = maze_attrs[ty * MAZE_COLS + tx]
+
+        # SUPER OVERRIDE for Eaten Ghosts near House
+        # If we are eyes and near the door/house, ignore walls
+        if self.mode == MODE_EATEN:
+            # House area (arcade maze: Rows 11-15, Cols 10-17)
+            if attr & A_HOUSE:
+                return True
+            
+        # Ghosts CAN pass through Ghost House Door
+        # So we remove that check here
+        
+        # Prevent re-entry into Ghost House
+        # Door is at Row 12 (above wall) -> Row 13 (wall gap)
+        # If we are at Row 11 and trying to go DOWN into 12, forbid it
+        # unless we are dead (eyes)
+        if direction == DIR_DOWN and attr & A_DOOR:
+             if not self.in_house and self.mode != MODE_EATEN: # If we are outside, don't go back in (unless Eaten)
+                 return False
+                 
+        result = not attr & A_WALL
+        if DEBUG and not result and self.mode == MODE_EATEN:
+             log.write(f"Eyes BLOCKED at {self.tile_x},{self.tile_y} trying {direction} into {tx},{ty}")
+             
+        return result
+
+    def at_tile_center(self):
+        center_x = self.x + 8
+        center_y = self.y + 8
+        dist_x = abs((center_x - 4) % 8)
+        dist_y = abs((center_y - 4) % 8)
+        dist_x = min(dist_x, 8 - dist_x)
+        dist_y = min(dist_y, 8 - dist_y)
+        
+        # Threshold depends on speed to ensure we don't skip the window
+        # Normal Speed (1.17) -> 0.7
+        # Eaten Speed (2.34) -> 1.5
+        threshold = 0.7
+        if self.mode == MODE_EATEN:
+            threshold = 1.5
+            
+        return dist_x <= threshold and dist_y <= threshold
+
+    def update(self, pacman, ghosts, current_mode):
+        """Move one frame, chasing pacman or reviving into current_mode after being eaten."""
+        # Handle Ghost House Behavior
+        if self.in_house:
+            self.house_timer += 1
+            should_exit = False
+            
+            # Exit Conditions
+            if self.ghost_type == Ghost.TYPE_BLINKY:
+                if self.house_timer > 60: # Wait 1s after revival
+                    should_exit = True
+            elif self.ghost_type == Ghost.TYPE_PINKY:
+                should_exit = True # Pinky leaves immediately
+            elif self.ghost_type == Ghost.TYPE_INKY and self.house_timer > 300: # ~5s
+                should_exit = True
+            elif self.ghost_type == Ghost.TYPE_CLYDE and self.house_timer > 600: # ~10s
+                should_exit = True
+                
+            if should_exit:
+                # Target: Center X (104), Outside Y (Row 11 Center)
+                # Row 11 is the corridor above the door. Center Y = 11*8 - 4 = 84.
+                target_x = DOOR_X * 8 # 104 (Between Tile 13 and 14)
+                target_y = (DOOR_Y - 1) * 8 - 4 # 84 (Centered in Row 11)
+                
+                # 1. Align X
+                if abs(self.x - target_x) >= GHOST_SPEED:
+                    if self.x < target_x:
+                        self.x += GHOST_SPEED
+                        self.direction = DIR_RIGHT
+                    else:
+                        self.x -= GHOST_SPEED
+                        self.direction = DIR_LEFT
+                # 2. Move UP
+                else:
+                    self.x = target_x # Snap X
+                    self.y -= GHOST_SPEED
+                    self.direction = DIR_UP
+                    
+                    # Check if out
+                    if self.y <= target_y:
+                        self.y = target_y # Snap Y to center of Row 11
+                        self.in_house = False
+                        self.direction = DIR_LEFT # Default exit direction
+                        # print(f"Ghost {self.ghost_type} exited to {self.x}, {self.y}")
+            else:
+                # Bounce Up/Down
+                # Center Y for Row 14 is 108 (14*8 - 4)
+                center_y = HOME_Y * 8 - 4
+                limit = 3 # Bounce amplitude
+                
+                if self.direction == DIR_UP:
+                    self.y -= GHOST_SPEED / 2 # Move slower in house
+                    if self.y < (center_y - limit):
+                        self.direction = DIR_DOWN
+                else:
+                    self.y += GHOST_SPEED / 2
+                    if self.y > (center_y + limit):
+                        self.direction = DIR_UP
+            
+            # Update sprite and return (skip normal movement)
+            self.anim_timer += 1
+            if self.anim_timer >= 10:
+                self.anim_timer = 0
+                self.anim_frame = (self.anim_frame + 1) % 2
+                self.set_frame(self.direction, self.anim_frame)
+            self.update_sprite_pos()
+            return
+
+        # Basic AI: Move forward. At intersection, pick best direction based on target.
+        
+        # 0. Handle Reverse Pending (Mode Switch)
+        if self.reverse_pending:
+            self.reverse_pending = False
+            rev = DIR_NONE
+            if self.direction == DIR_UP:
+                rev = DIR_DOWN
+            elif self.direction == DIR_DOWN:
+                rev = DIR_UP
+            elif self.direction == DIR_LEFT:
+                rev = DIR_RIGHT
+            elif self.direction == DIR_RIGHT:
+                rev = DIR_LEFT
+            
+            if self.can_move(rev):
+                self.direction = rev
+                # Snap to center to ensure clean turn
+                center_x = self.x + 8
+                center_y = self.y + 8
+                tile_x = int(center_x // 8)
+                tile_y = int(center_y // 8)
+                self.x = tile_x * 8 + 4 - 8
+                self.y = tile_y * 8 + 4 - 8
+                return # Skip rest of update for this frame
+
+        # 1. Handle Turns at Intersections
+        if self.at_tile_center():
+            # Determine Target
+            tx, ty = 0, 0
+            
+            if self.mode == MODE_CHASE:
+                chase_target(self, pacman, ghosts)
+                tx, ty = self.target_x, self.target_y
+            elif self.mode == MODE_SCATTER:
+                tx, ty = self.scatter_target
+            elif self.mode == MODE_EATEN:
+                # Target Ghost House (Above Door)
+                tx, ty = DOOR_X, DOOR_Y - 1
+                at_door_x = self.tile_x == DOOR_X or self.tile_x == DOOR_X + 1
+                # If we are at the door entrance (Row 11), target inside (Row 14)
+                # We need to force DOWN if we are at (13, 11) or (14, 11)
+                if self.tile_y == DOOR_Y - 1 and at_door_x:
+                    tx, ty = DOOR_X, HOME_Y
+                
+                # If we are inside (Row 14), we are done
+                if self.tile_y >= HOME_Y and at_door_x:
+                    self.mode = current_mode # Revive!
+                    self.in_house = True
+                    self.house_timer = 0 # Restart house logic
+                    self.direction = DIR_UP # Reset direction
+                    
+                    # Snap to exact center of pen (Pinky's start: x=104)
+                    # This aligns with the exit target X
+                    self.x = DOOR_X * 8 # 104
+                    self.y = HOME_Y * 8 - 4 # 108
+                    self.tile_x = DOOR_X # Technically between 13 and 14
+                    self.tile_y = HOME_Y
+                    self.update_sprite_pos()
+                    return
+            elif self.mode == MODE_FRIGHTENED:
+                # Random Target (Pseudo-Random Walk)
+                # We don't use a target tile, we just pick a random valid direction
+                pass
+            
+            # Find best direction
+            best_dir = best_direction(self, tx, ty, valid_dirs)
+            
+            if self.mode == MODE_FRIGHTENED:
+                if self.valid_count:
+                    self.direction = valid_dirs[random.randrange(self.valid_count)]
+            elif self.mode == MODE_EATEN and (self.tile_y == DOOR_Y - 1 or self.tile_y == DOOR_Y) and (self.tile_x == DOOR_X or self.tile_x == DOOR_X + 1):
+                 # Force DOWN if at door entrance OR inside door
+                 # print(f"Eyes forcing DOWN at {self.tile_x},{self.tile_y}")
+                 self.direction = DIR_DOWN
+                 # Force snap to X center to avoid hitting side walls of door
+                 target_x = self.tile_x * 8 - 4
+                 if abs(self.x - target_x) > 1.0:
+                     self.x = target_x
+            elif self.mode == MODE_EATEN and self.tile_y == DOOR_Y + 1 and (self.tile_x == DOOR_X or self.tile_x == DOOR_X + 1):
+                 # Force DOWN if inside house gap (Row 13) to reach target (Row 14)
+                 self.direction = DIR_DOWN
+            else:
+                self.direction = best_dir
+            
+            # Snap to center
+            center_x = self.x + 8
+            center_y = self.y + 8
+            tile_x = int(center_x // 8)
+            tile_y = int(center_y // 8)
+            self.x = tile_x * 8 + 4 - 8
+            self.y = tile_y * 8 + 4 - 8
+
+        # 2. Move
+        if self.direction != DIR_NONE:
+            speed = GHOST_SPEED
+            if self.mode == MODE_FRIGHTENED:
+                speed = GHOST_SPEED * 0.6 # Slower
+            elif self.mode == MODE_EATEN:
+                speed = 2.0 # Fixed fast speed (was GHOST_SPEED * 2.0 = 2.34)
+                
+            if self.can_move(self.direction):
+                if self.direction == DIR_UP:
+                    self.y -= speed
+                elif self.direction == DIR_DOWN:
+                    self.y += speed
+                elif self.direction == DIR_LEFT:
+                    self.x -= speed
+                elif self.direction == DIR_RIGHT:
+                    self.x += speed
+                
+                # Tunnel wrap
+                if self.x < -16:
+                    self.x = GAME_WIDTH
+                elif self.x >= GAME_WIDTH:
+                    self.x = -16
+                
+                # Animate
+                self.anim_timer += 1
+                if self.anim_timer >= 10: # Slower animation for ghosts
+                    self.anim_timer = 0
+                    self.anim_frame = (self.anim_frame + 1) % 2
+                    self.set_frame(self.direction, self.anim_frame)
+            else:
+                # STUCK RECOVERY
+                # If we can't move in the chosen direction, pick a new one immediately.
+                # This handles cases where AI chose a blocked path or alignment issues.
+                # print(f"Ghost {self.ghost_type} STUCK at {self.x:.1f},{self.y:.1f} (Tile {self.tile_x},{self.tile_y}) Dir: {self.direction}")
+                
+                # Try all directions
+                turn_count = 0
+                can_reverse = False
+                
+                reverse_dir = DIR_NONE
+                if self.direction == DIR_UP:
+                    reverse_dir = DIR_DOWN
+                elif self.direction == DIR_DOWN:
+                    reverse_dir = DIR_UP
+                elif self.direction == DIR_LEFT:
+                    reverse_dir = DIR_RIGHT
+                elif self.direction == DIR_RIGHT:
+                    reverse_dir = DIR_LEFT
+
+                for d in DIRECTIONS:
+                    if self.can_move(d):
+                        if d == reverse_dir:
+                            can_reverse = True
+                        else:
+                            possible_turns[turn_count] = d
+                            turn_count += 1
+                
+                # print(f"  Possible Turns: {possible_turns[:turn_count]}, Reverse: {can_reverse}")
+
+                # Prefer turns over reversing to avoid bouncing back and forth
+                if turn_count:
+                    self.direction = possible_turns[random.randrange(turn_count)]
+                    # print(f"  Recovering with TURN to {self.direction}")
+                    # SNAP to center to fix alignment if we are turning late
+                    center_x = self.x + 8
+                    center_y = self.y + 8
+                    tile_x = int(center_x // 8)
+                    tile_y = int(center_y // 8)
+                    self.x = tile_x * 8 + 4 - 8
+                    self.y = tile_y * 8 + 4 - 8
+                elif can_reverse:
+                    self.direction = reverse_dir
+                    # print(f"  Recovering with REVERSE to {self.direction}")
+                else:
+                    pass
+                    # print("  TOTALLY STUCK! No valid moves.")
+        
+        # Update positions
+        self.tile_x = int((self.x + 8) // TILE_SIZE)
+        self.tile_y = int((self.y + 8) // TILE_SIZE)
+        
+        # DEBUG: Check if stuck (position not changing)
+        if self.last_x is None:
+            self.last_x = self.x
+            self.last_y = self.y
+            self.stuck_frames = 0
+        
+        if abs(self.x - self.last_x) < 0.1 and abs(self.y - self.last_y) < 0.1:
+            self.stuck_frames += 1
+            if self.stuck_frames > 60:
+                if DEBUG:
+                    log.write(f"Ghost {self.ghost_type} HOVERING at {self.x:.1f},{self.y:.1f} Dir:{self.direction}")
+                self.stuck_frames = 0
+                # Force a direction change
+                self.direction = random.choice(DIRECTIONS)
+        else:
+            self.stuck_frames = 0
+            self.last_x = self.x
+            self.last_y = self.y
+
+        self.update_sprite_pos()
+
+    def reset(self):
+        """Reset ghost to starting position."""
+        start_tile_x, start_tile_y, x_offset = self.start_params
+        
+        self.tile_x = start_tile_x
+        self.tile_y = start_tile_y
+        self.x = self.tile_x * 8 - 4 + x_offset
+        self.y = self.tile_y * 8 - 4
+        
+        self.direction = DIR_LEFT
+        self.next_direction = DIR_NONE
+        
+        # Ghost House State
+        self.in_house = False
+        self.house_timer = 0
+        if self.ghost_type != Ghost.TYPE_BLINKY:
+            self.in_house = True
+            # Initial bounce direction
+            if self.ghost_type == Ghost.TYPE_PINKY:
+                self.direction = DIR_DOWN # Start moving down to bounce
+            else:
+                self.direction = DIR_UP
+        
+        self.anim_frame = 0
+        self.anim_timer = 0
+        self.mode = MODE_SCATTER
+        self.reverse_pending = False
+        
+        self.set_frame(self.direction, 0)
+        self.update_sprite_pos()
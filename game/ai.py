@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""Ghost targeting: chase targets and the direction choice at intersections.
+
+Called every frame, so nothing here allocates: targets are stored on the
+ghost and open directions go into a caller's buffer.
+"""
+from game.config import (
+    MAZE_COLS, MAZE_ROWS, A_WALL, A_DOOR, A_TUNNEL, MODE_FRIGHTENED, MODE_EATEN,
+    DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT,
+)
+from game.maze import maze_attrs
+
+# Directions in the order ties are broken
+TURN_ORDER = (DIR_UP, DIR_LEFT, DIR_DOWN, DIR_RIGHT)
+
+def chase_target(ghost, pacman, ghosts):
+    """Set ghost.target_x and ghost.target_y to the tile it targets in chase mode."""
+    px, py = pacman.tile_x, pacman.tile_y
+    pd = pacman.direction
+
+    if ghost.ghost_type == ghost.TYPE_BLINKY:
+        ghost.target_x, ghost.target_y = px, py
+        return
+
+    elif ghost.ghost_type == ghost.TYPE_PINKY:
+        # 4 tiles ahead of Pac-Man
+        tx, ty = px, py
+        if pd == DIR_UP:
+            ty -= 4
+            tx -= 4 # Replicate overflow bug (Up+Left)
+        elif pd == DIR_DOWN:
+            ty += 4
+        elif pd == DIR_LEFT:
+            tx -= 4
+        elif pd == DIR_RIGHT:
+            tx += 4
+        ghost.target_x, ghost.target_y = tx, ty
+        return
+
+    elif ghost.ghost_type == ghost.TYPE_INKY:
+        # Vector from Blinky to (Pac-Man + 2) * 2
+        # 1. Get position 2 tiles ahead of Pac-Man
+        tx, ty = px, py
+        if pd == DIR_UP:
+            ty -= 2
+            tx -= 2 # Bug
+        elif pd == DIR_DOWN:
+            ty += 2
+        elif pd == DIR_LEFT:
+            tx -= 2
+        elif pd == DIR_RIGHT:
+            tx += 2
+
+        # 2. Get Blinky's position
+        bx, by = 0, 0
+        for g in ghosts:
+            if g.ghost_type == ghost.TYPE_BLINKY:
+                bx, by = g.tile_x, g.tile_y
+                break
+
+        # 3. Vector
+        vx = tx - bx
+        vy = ty - by
+
+        ghost.target_x, ghost.target_y = bx + vx * 2, by + vy * 2
+        return
+
+    elif ghost.ghost_type == ghost.TYPE_CLYDE:
+        # If dist > 8, target Pac-Man. Else scatter.
+        dist = (ghost.tile_x - px)**2 + (ghost.tile_y - py)**2
+        if dist > 64: # 8^2
+            ghost.target_x, ghost.target_y = px, py
+        else:
+            ghost.target_x, ghost.target_y = ghost.scatter_target
+        return
+
+    ghost.target_x, ghost.target_y = px, py
+
+def best_direction(ghost, tx, ty, valid_dirs):
+    """Direction from a tile center that leads closest to target (tx, ty), without reversing.
+
+    Every open direction is stored in valid_dirs (a bytearray of at least 4),
+    their number in ghost.valid_count. Frightened ghosts have no target, so
+    their current direction is returned.
+    """
+    best_dist = 999999
+    best_dir = ghost.direction # Default continue
+    count = 0
+
+    # Check all 4 directions in priority order: UP, LEFT, DOWN, RIGHT
+    for d in TURN_ORDER:
+        # Don't reverse (unless forced, handled above)
+        if (d == DIR_UP and ghost.direction == DIR_DOWN) or \
+           (d == DIR_DOWN and ghost.direction == DIR_UP) or \
+           (d == DIR_LEFT and ghost.direction == DIR_RIGHT) or \
+           (d == DIR_RIGHT and ghost.direction == DIR_LEFT):
+            continue
+
+        # Check validity (walls)
+        nx, ny = int(ghost.tile_x), int(ghost.tile_y)
+        if d == DIR_UP:
+            ny -= 1
+        elif d == DIR_DOWN:
+            ny += 1
+        elif d == DIR_LEFT:
+            nx -= 1
+        elif d == DIR_RIGHT:
+            nx += 1
+
+        is_valid = False
+        if 0 <= nx < MAZE_COLS and 0 <= ny < MAZE_ROWS:
+            attr = maze_attrs[ny * MAZE_COLS + nx]
+            if not attr & A_WALL:
+                is_valid = True
+
+                # ONE WAY DOOR CHECK FOR AI
+                # Prevent AI from choosing to go back into the house
+                # Block entering Row 12 (Door) from Row 11
+                if d == DIR_DOWN and attr & A_DOOR:
+                    if not ghost.in_house and ghost.mode != MODE_EATEN:
+                        is_valid = False
+
+        elif 0 <= ny < MAZE_ROWS and maze_attrs[ny * MAZE_COLS] & A_TUNNEL: # Tunnel
+            is_valid = True
+
+        if is_valid:
+            valid_dirs[count] = d
+            count += 1
+            # Calculate distance to target from neighbor tile
+            if ghost.mode != MODE_FRIGHTENED:
+                dist = (nx - tx)**2 + (ny - ty)**2
+                if dist < best_dist:
+                    best_dist = dist
+                    best_dir = d
+
+    ghost.valid_count = count
+    return best_dir
@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: MIT
+"""Sound effects, on the Wio Terminal buzzer or the Fruit Jam synth and mixer."""
+import time
+
+from game.config import DEVICE, FRUIT_JAM, LOG_INFO
+from game import log
+
+if DEVICE is FRUIT_JAM:
+    from game.fruitjam import mixer, synth, tone_note, make_sample, VOICE_SIREN, VOICE_FX
+else:
+    from game.wio import buzzer
+
+sound_enabled = True
+
+# Pac-Man waka frequencies (alternating)
+WAKA_FREQ_1 = 261  # C4
+WAKA_FREQ_2 = 392  # G4
+waka_toggle = False
+
+if DEVICE is FRUIT_JAM:
+    # Sound bank, rendered once at startup
+    WAKA_SAMPLE_1 = make_sample([(WAKA_FREQ_1, 0.08)])
+    WAKA_SAMPLE_2 = make_sample([(WAKA_FREQ_2, 0.08)])
+    # Quick ascending tone
+    EAT_GHOST_SAMPLE = make_sample([(freq, 0.02) for freq in range(200, 800, 100)])
+    # One note per death animation frame (8 ticks each), descending from 500Hz
+    DEATH_SAMPLE = make_sample([(500 - i * 35, 0.13) for i in range(1, 11)])
+    # Rising and falling siren, looped during play
+    SIREN_SAMPLE = make_sample(
+        [(freq, 0.012) for freq in range(400, 720, 20)] + [(freq, 0.012) for freq in range(720, 400, -20)],
+        volume=0.15,
+    )
+
+def play_sound(freq:int):
+    if DEVICE is FRUIT_JAM:
+        tone_note.frequency = freq
+        synth.press(tone_note)
+    elif buzzer is not None:
+        buzzer.frequency = freq
+        buzzer.duty_cycle = 32768  # 50% duty cycle
+
+def stop_sound():
+    """Stop any sound."""
+    if DEVICE is FRUIT_JAM:
+        synth.release(tone_note)
+    elif buzzer is not None:
+        buzzer.duty_cycle = 0
+
+def start_siren():
+    """Loop the background siren (Fruit Jam only, the buzzer has one voice)."""
+    if DEVICE is FRUIT_JAM and sound_enabled:
+        mixer.voice[VOICE_SIREN].play(SIREN_SAMPLE, loop=True)
+
+def stop_siren():
+    """Stop the background siren."""
+    if DEVICE is FRUIT_JAM:
+        mixer.voice[VOICE_SIREN].stop()
+
+def play_waka():
+    """Play the waka sound effect."""
+    global waka_toggle
+    if not sound_enabled:
+        return
+
+    waka_toggle = not waka_toggle
+
+    if DEVICE is FRUIT_JAM:
+        mixer.voice[VOICE_FX].play(WAKA_SAMPLE_1 if waka_toggle else WAKA_SAMPLE_2)
+    else:
+        play_sound(WAKA_FREQ_1 if waka_toggle else WAKA_FREQ_2)
+
+def play_death_sound():
+    """Play death sound effect (blocking version - not used during animation)."""
+    if not sound_enabled:
+        return
+    # Descending tone
+    for freq in range(400, 100, -30):
+        play_sound(freq)
+        time.sleep(0.05)
+    stop_sound()
+
+def play_death_note(frame_idx):
+    """Play a single death note based on animation frame."""
+    if not sound_enabled:
+        return
+    if DEVICE is FRUIT_JAM:
+        # The whole descent is one sample, started on the first note
+        if frame_idx == 1:
+            mixer.voice[VOICE_FX].play(DEATH_SAMPLE)
+        return
+    # 11 death frames, descend from 500Hz to 100Hz
+    freq = 500 - (frame_idx * 35)
+    if freq < 100:
+        freq = 100
+    play_sound(freq)
+
+def play_eat_ghost_sound():
+    """Play ghost eating sound."""
+    if not sound_enabled:
+        return
+    if DEVICE is FRUIT_JAM:
+        mixer.voice[VOICE_FX].play(EAT_GHOST_SAMPLE)
+        return
+    # Quick ascending tone
+    for freq in range(200, 800, 100):
+        play_sound(freq)
+        time.sleep(0.02)
+    stop_sound()
+
+def play_startup_jingle():
+    """Play the Pac-Man startup jingle."""
+    if not sound_enabled:
+        return
+
+    # Pac-Man Intro Theme
+    # Tempo control: lower is faster
+    T = 0.11  # Base note duration (16th note)
+    H = T * 2 # Half note / ending
+
+    melody = [
+        # --- Phrase 1: B Major Arpeggio ---
+        (494, T),  # B4
+        (988, T),  # B5 (Octave jump!)
+        (740, T),  # F#5
+        (622, T),  # D#5
+        (988, T),  # B5
+        (740, T),  # F#5
+        (622, H),  # D#5 (End of phrase)
+
+        # --- Phrase 2: C Major Arpeggio ---
+        (523, T),  # C5
+        (1047, T), # C6 (Octave jump!)
+        (784, T),  # G5
+        (659, T),  # E5
+        (1047, T), # C6
+        (784, T),  # G5
+        (659, H),  # E5 (End of phrase)
+
+        # --- Phrase 3: Back to B Major ---
+        (494, T),  # B4
+        (988, T),  # B5
+        (740, T),  # F#5
+        (622, T),  # D#5
+        (988, T),  # B5
+        (740, T),  # F#5
+        (622, H),  # D#5
+
+        # --- Phrase 4: Chromatic Rise to Finish ---
+        # Rising tension...
+        (622, T),  # D#5
+        (659, T),  # E5
+        (698, T),  # F5
+
+        (698, T),  # F5 (Repeat F to bridge the triplet feel)
+        (740, T),  # F#5
+        (784, T),  # G5
+
+        (784, T),  # G5 (Repeat G)
+        (831, T),  # G#5
+        (880, T),  # A5
+
+        (988, H)   # B5 (Final Note - bold finish!)
+    ]
+
+    for freq, duration in melody:
+        play_sound(freq)
+        time.sleep(duration)
+        stop_sound()
+        time.sleep(0.02)  # Brief gap between notes
+
+    stop_sound()
+
+def toggle_sound(playing):
+    """Turn sound on or off, restarting the siren if a level is being played."""
+    global sound_enabled
+    sound_enabled = not sound_enabled
+    if LOG_INFO:
+        log.write(b"Sound: ON" if sound_enabled else b"Sound: OFF")
+    if not sound_enabled:
+        stop_sound()
+        stop_siren()
+        if DEVICE is FRUIT_JAM:
+            mixer.voice[VOICE_FX].stop()
+    elif playing:
+        start_siren()
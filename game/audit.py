@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Allocation audit, enabled with PACMAN_AUDIT = 1 in settings.toml.
+
+Frames spent playing should not allocate, so collecting the heap when the
+state changes and once a second, for the FPS line and the log output, is
+quick. code.py calls start() at the top of every frame and mark() at the end
+of each phase, and the heap allocated by each phase is measured with
+gc.mem_alloc(). Frames that start or end outside STATE_PLAY,
+and the log and FPS output between skip() and the next mark, are not counted.
+
+report() prints the totals at the end of every level or game and raises
+RuntimeError if any phase allocated, which stops the run; combine it with
+PACMAN_AUTOPILOT for an unattended test. Messages written with log.write()
+while playing are copied into the log without allocating, so LOG_INFO can stay
+on; the DEBUG messages are formatted.
+
+On a host Python, with the stubs of tests/host/, memory is traced with
+tracemalloc instead, from the first frame on. CPython frees an object as soon
+as its last reference goes, so the peak of each phase above what was traced
+when it began is counted, which catches the garbage gc.mem_alloc() sees on the
+device as well as what a phase keeps (see SMALL_BYTES); tests/test_audit.py
+runs the game this way.
+"""
+import gc
+
+from game import log
+
+try:
+    mem_alloc = gc.mem_alloc
+except AttributeError:
+    import tracemalloc
+    tracemalloc.start()
+
+    # Peaks this small are not counted: ints above 256, which CPython boxes
+    # and the device keeps as immediate values, a few of them alive at once
+    # in the autopilot's search or the ghost targeting. A smaller str or list
+    # made by the game goes unnoticed here, but not on the device.
+    SMALL_BYTES = 256
+    base = 0 # bytes traced after the last call
+    started = False
+    total = 0
+
+    def traced_peak():
+        """The most bytes traced at once since the last call, above what was
+        traced after it."""
+        global base
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        last = base
+        base = tracemalloc.get_traced_memory()[0]
+        return peak - last
+
+    # Reading the traced memory makes its result, which every peak includes
+    traced_peak()
+    OVERHEAD = min(traced_peak() for _ in range(3))
+
+    def mem_alloc():
+        """Bytes allocated so far, adding the peak between calls so what is
+        freed again in time counts too."""
+        global started, total
+        peak = traced_peak() - OVERHEAD
+        # Only count what is allocated from the first frame on
+        if started and peak > SMALL_BYTES:
+            total += peak
+        started = True
+        return total
+
+# Phases of a frame, in order
+INPUT = 0
+PACMAN = 1
+GHOSTS = 2
+HUD = 3
+REFRESH = 4
+PHASE_NAMES = ("input", "pacman", "ghosts", "hud", "refresh")
+
+# Per phase: bytes allocated in audited frames, and how many of them allocated.
+# A collection during a phase shows as a frame with no bytes.
+allocated = [0] * len(PHASE_NAMES)
+frames_allocating = [0] * len(PHASE_NAMES)
+# The current frame, added to the totals if it ends in STATE_PLAY
+frame_allocated = [0] * len(PHASE_NAMES)
+frame_allocating = [0] * len(PHASE_NAMES)
+
+frames = 0
+counting = False
+last = 0
+
+def start(playing):
+    """Begin a frame, playing is True in STATE_PLAY."""
+    global counting, last
+    counting = playing
+    for i in range(len(PHASE_NAMES)):
+        frame_allocated[i] = 0
+        frame_allocating[i] = 0
+    last = mem_alloc()
+
+def mark(phase):
+    """End a phase of the frame."""
+    global last
+    now = mem_alloc()
+    if counting and now != last:
+        frame_allocating[phase] = 1
+        if now > last:
+            frame_allocated[phase] += now - last
+    last = now
+
+def skip():
+    """Leave out what was allocated since the last mark."""
+    global last
+    last = mem_alloc()
+
+def end(playing):
+    """End a frame, counted if it was spent playing."""
+    global frames
+    if not (counting and playing):
+        return
+    frames += 1
+    for i in range(len(PHASE_NAMES)):
+        allocated[i] += frame_allocated[i]
+        frames_allocating[i] += frame_allocating[i]
+
+def report():
+    """Print the totals since the last report, raising RuntimeError if a phase allocated."""
+    global frames
+    failed = False
+    for i, name in enumerate(PHASE_NAMES):
+        log.write(f"Audit: {name} allocated {allocated[i]}B in {frames_allocating[i]} of {frames} frames")
+        failed = failed or frames_allocating[i] > 0
+        allocated[i] = 0
+        frames_allocating[i] = 0
+    frames = 0
+    if failed:
+        log.flush(log.BUFFER_SIZE)
+        raise RuntimeError("a frame spent playing allocated memory")
@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Autopilot for unattended soak and performance runs, enabled with
+PACMAN_AUTOPILOT = 1 in settings.toml.
+
+Pac-Man is steered down a distance field from every tile to the nearest dot,
+which never passes next to a ghost that can kill him. The field is searched
+breadth-first from all dots at once, a few tiles a frame, and replaces the one
+being followed when the search is done, so steering costs about the same every
+frame instead of a search across the maze on every tile. The tiles near the
+ghosts are marked once a frame and the buffers are preallocated, so it
+allocates nothing.
+Frame statistics are printed at the end of every level.
+"""
+import gc
+from array import array
+
+from supervisor import ticks_ms
+
+from game.config import (
+    MAZE_COLS, MAZE_ROWS, TICKS_PERIOD, A_REACH, A_TUNNEL, MODE_FRIGHTENED, MODE_EATEN,
+    DIR_NONE, DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT,
+)
+from game import log
+from game.maze import maze_attrs, items_grid, maze_cell
+
+# (direction, dx, dy) in the order ties are broken
+STEPS = (
+    (DIR_UP, 0, -1),
+    (DIR_LEFT, -1, 0),
+    (DIR_DOWN, 0, 1),
+    (DIR_RIGHT, 1, 0),
+)
+
+# Tiles this close (in steps) to a dangerous ghost are avoided
+DANGER_DISTANCE = 2
+
+# Tiles near a dangerous ghost are 1, the search does not pass through them
+danger = bytearray(MAZE_COLS * MAZE_ROWS)
+marked = array("H", bytes(2 * 4 * (2 * DANGER_DISTANCE * (DANGER_DISTANCE + 1) + 1)))
+marked_count = 0
+
+# Distance from each tile to the nearest dot avoiding the ghosts, FAR for walls
+# and tiles the search did not reach. Steering follows field while the next one
+# is searched, a few tiles a frame.
+FAR = 255
+field = bytearray(b"\xff" * (MAZE_COLS * MAZE_ROWS))
+next_field = bytearray(field)
+FAR_FIELD = bytearray(field)
+
+# Tiles Pac-Man can walk on, where the search looks for dots
+reach = array("H", (i for i in range(MAZE_COLS * MAZE_ROWS) if maze_attrs[i] & A_REACH))
+
+# Tiles scanned or visited by the search per frame
+SEARCH_BUDGET = 80
+
+queue = array("H", bytes(2 * len(reach)))
+head = 0
+tail = 0
+scanned = 0
+
+last_tile = -1
+
+def mark_danger(ghosts):
+    """Mark the tiles close to a ghost that is neither frightened, eaten nor in
+    the house, clearing the marks of the last frame."""
+    global marked_count
+    for k in range(marked_count):
+        danger[marked[k]] = 0
+    marked_count = 0
+    for g in ghosts:
+        if g.mode == MODE_FRIGHTENED or g.mode == MODE_EATEN or g.in_house:
+            continue
+        for oy in range(-DANGER_DISTANCE, DANGER_DISTANCE + 1):
+            y = g.tile_y + oy
+            if not 0 <= y < MAZE_ROWS:
+                continue
+            reach = DANGER_DISTANCE - abs(oy)
+            for x in range(g.tile_x - reach, g.tile_x + reach + 1):
+                if 0 <= x < MAZE_COLS:
+                    i = y * MAZE_COLS + x
+                    if not danger[i]:
+                        danger[i] = 1
+                        marked[marked_count] = i
+                        marked_count += 1
+
+def flee(x, y, ghosts):
+    """The open direction from tile (x, y) that is furthest from the closest ghost."""
+    best_dir = DIR_NONE
+    best_dist = -1
+    for d, dx, dy in STEPS:
+        nx = (x + dx) % MAZE_COLS
+        ny = y + dy
+        if not 0 <= ny < MAZE_ROWS or not maze_attrs[ny * MAZE_COLS + nx] & A_REACH:
+            continue
+        dist = 999
+        for g in ghosts:
+            if g.mode != MODE_FRIGHTENED and g.mode != MODE_EATEN:
+                dist = min(dist, abs(g.tile_x - nx) + abs(g.tile_y - ny))
+        if dist > best_dist:
+            best_dist = dist
+            best_dir = d
+    return best_dir
+
+def search():
+    """Continue the search for next_field for SEARCH_BUDGET tiles: first the
+    dots are found, then the distances spread out from them. When it is done
+    next_field replaces field and the next search starts."""
+    global field, next_field, head, tail, scanned
+    budget = SEARCH_BUDGET
+    while budget and scanned < len(reach):
+        i = reach[scanned]
+        scanned += 1
+        budget -= 1
+        if items_grid[maze_cell(i)] and not danger[i]:
+            next_field[i] = 0
+            queue[tail] = i
+            tail += 1
+    while budget and head < tail:
+        i = queue[head]
+        head += 1
+        budget -= 1
+        cx = i % MAZE_COLS
+        cy = i // MAZE_COLS
+        dist = next_field[i] + 1
+        for d, dx, dy in STEPS:
+            nx = cx + dx
+            ny = cy + dy
+            if not 0 <= ny < MAZE_ROWS:
+                continue
+            if not 0 <= nx < MAZE_COLS:
+                if not maze_attrs[cy * MAZE_COLS] & A_TUNNEL:
+                    continue
+                nx %= MAZE_COLS
+            j = ny * MAZE_COLS + nx
+            if next_field[j] != FAR or not maze_attrs[j] & A_REACH or danger[j]:
+                continue
+            next_field[j] = dist if dist < FAR else FAR - 1
+            queue[tail] = j
+            tail += 1
+    if budget:
+        field, next_field = next_field, field
+        next_field[:] = FAR_FIELD
+        head = tail = scanned = 0
+
+def steer(pacman, ghosts):
+    """Direction to queue for Pac-Man, or DIR_NONE to keep the queued one.
+    Call every frame, it also continues the search."""
+    global last_tile
+    mark_danger(ghosts)
+    search()
+    x, y = pacman.tile_x, pacman.tile_y
+    if not (0 <= x < MAZE_COLS and 0 <= y < MAZE_ROWS):
+        return DIR_NONE # in the tunnel, keep going
+    tile = y * MAZE_COLS + x
+    # only decide once per tile, unless Pac-Man stopped
+    if tile == last_tile and pacman.direction != DIR_NONE:
+        return DIR_NONE
+    last_tile = tile
+
+    best_dir = DIR_NONE
+    best = FAR - 1 # FAR - 1 is as far as the field counts
+    for d, dx, dy in STEPS:
+        nx = (x + dx) % MAZE_COLS
+        ny = y + dy
+        if not 0 <= ny < MAZE_ROWS:
+            continue
+        j = ny * MAZE_COLS + nx
+        if danger[j]:
+            continue
+        # the dot counted in field may have been eaten since
+        dist = 0 if items_grid[maze_cell(j)] else field[j] or 1
+        if dist < best:
+            best = dist
+            best_dir = d
+    if best_dir != DIR_NONE:
+        return best_dir
+    # every way to a dot is past a ghost, or the field has not reached here yet
+    return flee(x, y, ghosts)
+
+class LevelStats:
+    """Frame statistics of one level, counting only frames spent playing."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.frame_ms = 0
+        self.worst_ms = 0
+        self.refresh_ms = 0
+        self.playing = False
+        self.last = ticks_ms()
+
+    def frame(self, playing, refresh_ms):
+        """Call at the end of every frame, playing is True in STATE_PLAY."""
+        now = ticks_ms()
+        if playing and self.playing:
+            elapsed = (now - self.last) % TICKS_PERIOD
+            self.frames += 1
+            self.frame_ms += elapsed
+            self.worst_ms = max(self.worst_ms, elapsed)
+            self.refresh_ms += refresh_ms
+        self.playing = playing
+        self.last = now
+
+    def report(self, level, result):
+        gc.collect()
+        frames = max(self.frames, 1)
+        log.write(f"Autopilot: level {level} {result}, {self.frames} frames, "
+              f"{1000 * frames / max(self.frame_ms, 1):.1f} fps, "
+              f"worst {self.worst_ms}ms, "
+              f"refresh {self.refresh_ms / frames:.1f}ms, "
+              f"{gc.mem_free()} free")
+        self.reset()
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Display refresh benchmark, enabled with PACMAN_BENCHMARK = 1 in settings.toml.
+
+run() is called once the first frame is shown, and times ROUNDS calls of
+display.refresh() for each kind of frame:
+
+    full     the whole screen redrawn, as when the game starts or a level ends
+    sprites  Pac-Man and the ghosts each moved one pixel, as while playing
+    idle     nothing changed, the cost of the refresh call itself
+
+It prints the average and slowest refresh with the orientation and scale, so
+running it once with PACMAN_NATIVE = 1 and once without compares drawing through
+display.rotation = 270 with drawing pre-rotated images (see game/config.py),
+and on a 2x display once with PACMAN_GROUP_SCALE = 1 and once without compares
+scaling the display group with prescaled images. The screen is left as it was.
+"""
+from supervisor import ticks_ms
+
+from game.config import DISPLAY_SCALE, DISPLAY_VERTICAL, NATIVE, SCALE, TICKS_PERIOD
+from game.display import display, main_group
+
+ROUNDS = 30
+
+def timed_refresh():
+    """Milliseconds one display.refresh() takes, without frame rate limiting."""
+    start = ticks_ms()
+    display.refresh()
+    return (ticks_ms() - start) % TICKS_PERIOD
+
+def report(name, times):
+    print(f"Benchmark: {name} refresh {sum(times) / len(times):.1f}ms, worst {max(times)}ms")
+
+def run(sprites):
+    """Time refreshes of the screen, moving sprites, the actor TileGrids, for the sprites frames."""
+    if not DISPLAY_VERTICAL:
+        orientation = "landscape"
+    elif NATIVE:
+        orientation = "native, pre-rotated images"
+    else:
+        orientation = f"rotation {display.rotation}"
+    if DISPLAY_SCALE > 1:
+        orientation += f", {DISPLAY_SCALE}x " + ("prescaled images" if SCALE > 1 else "group scaling")
+    print(f"Benchmark: {orientation}, {ROUNDS} refreshes each")
+
+    times = []
+    for _ in range(ROUNDS):
+        main_group.hidden = True
+        display.refresh()
+        main_group.hidden = False
+        times.append(timed_refresh())
+    report("full", times)
+
+    times = []
+    for i in range(ROUNDS):
+        step = 1 if i % 2 == 0 else -1
+        for sprite in sprites:
+            sprite.x += step
+        times.append(timed_refresh())
+    report("sprites", times)
+
+    times = []
+    for _ in range(ROUNDS):
+        times.append(timed_refresh())
+    report("idle", times)
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Boot timeline: the time and heap used by each named startup phase.
+
+code.py calls mark() after each phase and report() once the first frame is
+shown. The phases stay in `phases` for benchmarks, as (name, nanoseconds,
+bytes used, bytes free) tuples.
+
+The heap is not collected between phases, so the timeline is that of a normal
+boot and a phase's bytes include the garbage it left. With PACMAN_BOOT_COLLECT
+= 1 in settings.toml mark() collects first (untimed), so each phase is charged
+for what it keeps; report() says so in its first line.
+
+On a host Python (no gc.mem_free) heap use is measured with tracemalloc and
+free memory is reported as None; tests/host/run.py runs code.py there with
+stand-ins for the hardware modules, printing the same phases (timed by its
+simulated clock).
+"""
+import gc
+import os
+import time
+
+try:
+    mem_free = gc.mem_free
+    mem_alloc = gc.mem_alloc
+except AttributeError:
+    import tracemalloc
+    tracemalloc.start()
+    mem_free = lambda: None
+    mem_alloc = lambda: tracemalloc.get_traced_memory()[0]
+
+# Read here rather than in game/config.py, which is the first phase timed
+COLLECT = bool(os.getenv("PACMAN_BOOT_COLLECT"))
+
+phases = []
+
+gc.collect()
+phase_start = time.monotonic_ns()
+phase_used = mem_alloc()
+
+def mark(name):
+    """End the current phase. With COLLECT the heap is collected first, so a phase
+    is charged for what it keeps rather than its garbage; collecting is not timed."""
+    global phase_start, phase_used
+    end = time.monotonic_ns()
+    if COLLECT:
+        gc.collect()
+    used = mem_alloc()
+    phases.append((name, end - phase_start, used - phase_used, mem_free()))
+    phase_used = used
+    phase_start = time.monotonic_ns()
+
+def total_ns():
+    return sum(phase[1] for phase in phases)
+
+def report():
+    """Print one line per phase, then the total."""
+    print("Boot: heap collected at each phase" if COLLECT else "Boot: heap not collected, bytes include garbage")
+    for name, ns, used, free in phases:
+        print(f"Boot: {name} {ns / 1_000_000:.1f}ms {used:+d}B" + ("" if free is None else f" {free} free"))
+    print(f"Boot: total {total_ns() / 1_000_000:.1f}ms")
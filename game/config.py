@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: MIT
+"""Device detection and the constants shared by every module."""
+import os
+from micropython import const
+
+WIO = const(0)
+FRUIT_JAM = const(1)
+
+# build/build.py replaces the detection with the target device and removes
+# the code of every other device
+DEVICE = FRUIT_JAM if os.uname().machine.startswith("Adafruit Fruit Jam") else WIO
+
+# Extra diagnostic output, enabled with PACMAN_DEBUG = 1 in settings.toml.
+# Builds made by build/build.py remove it.
+DEBUG = bool(os.getenv("PACMAN_DEBUG"))
+
+# Game event messages on the serial console (mode switches, deaths, FPS...),
+# turned off with PACMAN_QUIET = 1 in settings.toml. Diagnostics use DEBUG.
+LOG_INFO = not os.getenv("PACMAN_QUIET")
+
+# Steer Pac-Man automatically and restart after game over, for unattended
+# soak runs. Enabled with PACMAN_AUTOPILOT = 1 in settings.toml.
+AUTOPILOT = bool(os.getenv("PACMAN_AUTOPILOT"))
+
+# Two players take turns, each with their own maze, lives and score (see
+# game/players.py). Enabled with PACMAN_TWO_PLAYERS = 1 in settings.toml.
+TWO_PLAYERS = bool(os.getenv("PACMAN_TWO_PLAYERS"))
+
+# Check that frames spent playing allocate no memory (see game/audit.py).
+# Enabled with PACMAN_AUDIT = 1 in settings.toml.
+AUDIT = bool(os.getenv("PACMAN_AUDIT"))
+
+# Measure the time from a direction press to the frame that shows it (see
+# game/latency.py). Enabled with PACMAN_LATENCY = 1 in settings.toml.
+LATENCY = bool(os.getenv("PACMAN_LATENCY"))
+
+# Time display refreshes at startup, to compare orientations (see
+# game/benchmark.py). Enabled with PACMAN_BENCHMARK = 1 in settings.toml.
+BENCHMARK = bool(os.getenv("PACMAN_BENCHMARK"))
+
+# Importing the backend sets up the hardware of the detected device
+if DEVICE is FRUIT_JAM:
+    from game.fruitjam import SCREEN_WIDTH, SCREEN_HEIGHT
+else:
+    from game.wio import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# determine if we need to display in vertical orientation
+# (PACMAN_PORTRAIT in settings.toml forces it, e.g. for a vertical cabinet monitor)
+DISPLAY_VERTICAL = SCREEN_WIDTH <= 360 or bool(os.getenv("PACMAN_PORTRAIT"))
+DISPLAY_WIDTH = SCREEN_HEIGHT if DISPLAY_VERTICAL else SCREEN_WIDTH
+DISPLAY_HEIGHT = SCREEN_WIDTH if DISPLAY_VERTICAL else SCREEN_HEIGHT
+
+# Vertical layouts are drawn with display.rotation = 270, unless PACMAN_NATIVE
+# is set in settings.toml: the display then keeps its native rotation and draws
+# images pre-rotated by build/assets.py (images/native/), so refreshes skip the
+# rotated transform of displayio. The game keeps its portrait coordinates,
+# game/display.py translates them where they are written to TileGrids.
+NATIVE = False
+if DISPLAY_VERTICAL and os.getenv("PACMAN_NATIVE"):
+    try:
+        os.stat("images/native")
+        NATIVE = True
+    except OSError:
+        pass
+
+# Game area dimensions (from sprite sheet)
+GAME_WIDTH = 224
+GAME_HEIGHT = 248
+
+# Screen area needed for the game plus scoreboard (the Wio Terminal layout)
+LAYOUT_WIDTH = 224
+LAYOUT_HEIGHT = 320
+
+# Integer scale factor for the whole layout on large displays.
+# Prescaled assets (images/<n>x/, generated by build/assets.py) render at native
+# TileGrid speed; without them, or with PACMAN_GROUP_SCALE set, the root Group is
+# scaled instead so the two approaches can be compared.
+DISPLAY_SCALE = max(1, min(DISPLAY_WIDTH // LAYOUT_WIDTH, DISPLAY_HEIGHT // LAYOUT_HEIGHT))
+SCALE = 1
+if DISPLAY_SCALE > 1 and not os.getenv("PACMAN_GROUP_SCALE"):
+    try:
+        os.stat(f"images/{DISPLAY_SCALE}x")
+        SCALE = DISPLAY_SCALE
+    except OSError:
+        pass
+GROUP_SCALE = DISPLAY_SCALE // SCALE
+
+# Size of the root group in its own (Group scaled) coordinates
+VIEW_WIDTH = DISPLAY_WIDTH // GROUP_SCALE
+VIEW_HEIGHT = DISPLAY_HEIGHT // GROUP_SCALE
+
+# Offset to center game area in screen
+OFFSET_X = (VIEW_WIDTH - GAME_WIDTH * SCALE) // 2   # 8 pixels
+OFFSET_Y = (VIEW_HEIGHT - GAME_HEIGHT * SCALE) // 2  # 36 pixels
+
+# Tile dimensions
+TILE_SIZE = 8
+
+# Maze dimensions in tiles
+MAZE_COLS = 28
+MAZE_ROWS = 31
+
+# Movement
+PACMAN_SPEED = 1.3    # pixels per frame
+GHOST_SPEED = 1.22    # pixels per frame (approx 94% of Pac-Man speed)
+FRAME_DELAY = 0.005   # Slightly more delay
+
+# supervisor.ticks_ms() wraps around after this many milliseconds
+TICKS_PERIOD = 1 << 29
+
+# Directions
+DIR_NONE = 0
+DIR_UP = 1
+DIR_DOWN = 2
+DIR_LEFT = 3
+DIR_RIGHT = 4
+
+# Maze tile attributes (bit flags, see build/maze_compiler.py)
+A_WALL = 0x01
+A_DOT = 0x02
+A_POWER = 0x04
+A_DOOR = 0x08   # Ghost house door (closed to Pac-Man)
+A_HOUSE = 0x10  # Ghost house area (eyes pass through walls)
+A_TUNNEL = 0x20 # Tunnel (wraps around the screen edge)
+A_REACH = 0x40  # Reachable from Pac-Man's start
+
+# Ghost Modes
+MODE_SCATTER = 0
+MODE_CHASE = 1
+MODE_FRIGHTENED = 2
+MODE_EATEN = 3
+
+# Game States
+STATE_PLAY = 0
+STATE_DYING = 1
+STATE_EATING_GHOST = 2
+STATE_GAME_OVER = 3
+STATE_LEVEL_COMPLETE = 4
+STATE_EATING_FRUIT = 5
+
+# Fruit point values per level
+FRUIT_POINTS = [100, 300, 500, 500, 700, 700, 1000, 1000, 2000, 2000, 3000, 3000, 5000]
+
+# Level 1 Mode Timings (seconds)
+# Scatter, Chase, Scatter, Chase, Scatter, Chase, Scatter, Chase
+MODE_TIMES = [7, 20, 7, 20, 5, 20, 5, 999999]
+
+# Frightened Mode Duration (Frames)
+# Level 1: ~6 seconds (at 100fps = 600 frames)
+# This will decrease in higher levels
+FRIGHTENED_DURATION = 600
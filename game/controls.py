@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: MIT
+"""Player input, from the Wio Terminal switches or the Fruit Jam keyboard."""
+from game.config import DEVICE, FRUIT_JAM, WIO, TICKS_PERIOD, DIR_NONE, DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT
+
+if DEVICE is FRUIT_JAM:
+    import supervisor
+    from game.fruitjam import read_keys, WAKE_ALARM
+else:
+    from supervisor import ticks_ms
+    from game.wio import UP, DOWN, LEFT, RIGHT, PRESS, BUTTON_1, BUTTON_3, WAKE_ALARM
+    last_button_state = True  # True = not pressed
+    last_suspend_state = True
+    # How long release_suspend_button() waits for the button to be let go
+    RELEASE_TIMEOUT_MS = 300
+
+def read_direction(keys=None):
+    """Read joystick and return the requested direction (DIR_NONE if there is none).
+
+    Remapped for 270° screen rotation (USB port on left):
+    Physical UP -> Game RIGHT
+    Physical DOWN -> Game LEFT
+    Physical LEFT -> Game UP
+    Physical RIGHT -> Game DOWN
+    """
+    if (DEVICE is WIO and not UP.value) or (DEVICE is FRUIT_JAM and ("d" in keys or "\x1b[C" in keys)):
+        return DIR_RIGHT
+    elif (DEVICE is WIO and not DOWN.value) or (DEVICE is FRUIT_JAM and ("a" in keys or "\x1b[D" in keys)):
+        return DIR_LEFT
+    elif (DEVICE is WIO and not LEFT.value) or (DEVICE is FRUIT_JAM and ("w" in keys or "\x1b[A" in keys)):
+        return DIR_UP
+    elif (DEVICE is WIO and not RIGHT.value) or (DEVICE is FRUIT_JAM and ("s" in keys or "\x1b[B" in keys)):
+        return DIR_DOWN
+    return DIR_NONE
+
+def sound_toggle_pressed(keys=None):
+    """Button 1 was just pressed (Wio Terminal) or "z" was typed (Fruit Jam)."""
+    if DEVICE is WIO:
+        global last_button_state
+        button_state = BUTTON_1.value
+        pressed = not button_state and last_button_state  # Button just pressed
+        last_button_state = button_state
+        return pressed
+    return "z" in keys
+
+def suspend_pressed(keys=None):
+    """Button 3 was just pressed (Wio Terminal) or "p" was typed (Fruit Jam)."""
+    if DEVICE is WIO:
+        global last_suspend_state
+        button_state = BUTTON_3.value
+        pressed = not button_state and last_suspend_state
+        last_suspend_state = button_state
+        return pressed
+    return "p" in keys
+
+def release_suspend_button():
+    """Wait up to RELEASE_TIMEOUT_MS for the suspend button to be let go, so it
+    does not wake the board as soon as it is asleep, but do not hang on a button
+    that stays down. Returns the alarm that wakes it."""
+    if DEVICE is WIO:
+        start = ticks_ms()
+        while not BUTTON_3.value and (ticks_ms() - start) % TICKS_PERIOD < RELEASE_TIMEOUT_MS:
+            pass
+    return WAKE_ALARM
+
+def any_pressed(keys=None):
+    """Any button is held (Wio Terminal) or any key was typed (Fruit Jam)."""
+    if DEVICE is WIO:
+        return not PRESS.value or not UP.value or not DOWN.value or not LEFT.value or not RIGHT.value
+    return len(keys) > 0
+
+def input_waiting():
+    """Any button is held (Wio Terminal) or a key is waiting to be read (Fruit Jam),
+    without reading it."""
+    if DEVICE is WIO:
+        return any_pressed() or not BUTTON_1.value or not BUTTON_3.value
+    return supervisor.runtime.serial_bytes_available > 0
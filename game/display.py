@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: MIT
+"""Display setup, the root group with its layers, TileGrid placement and BMP loading."""
+import bitmaptools
+import displayio
+import gc
+import os
+import struct
+
+from game.config import DEVICE, FRUIT_JAM, DISPLAY_VERTICAL, NATIVE, DISPLAY_SCALE, SCALE, GROUP_SCALE, VIEW_WIDTH
+
+if DEVICE is FRUIT_JAM:
+    from game.fruitjam import display
+else:
+    from game.wio import display
+display.auto_refresh = False
+
+if DISPLAY_VERTICAL and not NATIVE:
+    # vertical orientation, flipped 180 from before
+    display.rotation = 270
+if NATIVE:
+    print("Display: native orientation, pre-rotated images")
+
+# Main display group
+main_group = displayio.Group(scale=GROUP_SCALE)
+display.root_group = main_group
+
+# Two layers: the static layer holds what stays the same while playing (the
+# maze and titles), the dynamic layer everything that moves or changes, drawn
+# above it. Modules add their objects in display order within a layer.
+static_layer = displayio.Group()
+dynamic_layer = displayio.Group()
+main_group.append(static_layer)
+main_group.append(dynamic_layer)
+if DISPLAY_SCALE > 1:
+    print(f"Display scale: {DISPLAY_SCALE}x ({'prescaled assets' if SCALE > 1 else 'group scaling'})")
+
+# Backlight level while the game over screen is idle (see game/pacing.py)
+IDLE_BRIGHTNESS = 0.1
+dimmed = False
+
+def dim_display(dim):
+    """Turn the backlight down, or back up. Displays without a backlight (DVI)
+    are blanked instead."""
+    global dimmed
+    if dim == dimmed:
+        return
+    dimmed = dim
+    try:
+        display.brightness = IDLE_BRIGHTNESS if dim else 1.0
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        main_group.hidden = dim
+
+# With NATIVE the display is not rotated, and the game's portrait view is
+# turned a quarter counterclockwise onto it: view (x, y) is drawn at display
+# (y, VIEW_WIDTH - 1 - x). TileGrids are created, filled and moved in view
+# coordinates through the functions below, on images whose tiles are rotated
+# the same way by build/assets.py, and nothing is transformed while refreshing.
+
+def new_tile_grid(bitmap, pixel_shader, width, height, tile_width, tile_height, default_tile=0):
+    """A TileGrid of width x height tiles of tile_width x tile_height view pixels."""
+    if NATIVE:
+        width, height, tile_width, tile_height = height, width, tile_height, tile_width
+    return displayio.TileGrid(
+        bitmap, pixel_shader=pixel_shader, width=width, height=height,
+        tile_width=tile_width, tile_height=tile_height, default_tile=default_tile,
+    )
+
+def tile_index(grid, column, row):
+    """Index of the tile at (column, row) of the view in a TileGrid made by new_tile_grid()."""
+    if NATIVE:
+        return (grid.height - 1 - column) * grid.width + row
+    return row * grid.width + column
+
+def place(item, x, y, width):
+    """Move a TileGrid or Group to (x, y) of the view, width is its width in the view."""
+    if NATIVE:
+        item.x = y
+        item.y = VIEW_WIDTH - x - width
+    else:
+        item.x = x
+        item.y = y
+
+def scaled_image(path):
+    """Path of the variant of an image for the current SCALE and orientation."""
+    if SCALE == 1 and not NATIVE:
+        return path
+    return path.replace("images/", "images/" + ("native/" if NATIVE else "") + (f"{SCALE}x/" if SCALE > 1 else ""), 1)
+
+def read_bmp_header(f):
+    """(data start, info header size, width, height, bits per pixel, colors) of an open BMP."""
+    header = f.read(54)
+    data_start, info_size, width, height = struct.unpack_from("<IIii", header, 10)
+    bits = struct.unpack_from("<H", header, 28)[0]
+    colors = struct.unpack_from("<I", header, 46)[0] or 1 << bits
+    return data_start, info_size, width, height, bits, colors
+
+def load_bmp(path):
+    """Load an uncompressed indexed BMP into RAM, returns (bitmap, palette)."""
+    with open(path, "rb") as f:
+        data_start, info_size, width, height, bits, colors = read_bmp_header(f)
+
+        palette = displayio.Palette(colors)
+        f.seek(14 + info_size)
+        for i in range(colors):
+            b, g, r, _ = f.read(4)
+            palette[i] = (r << 16) | (g << 8) | b
+
+        bitmap = displayio.Bitmap(width, abs(height), max(colors, 2))
+        f.seek(data_start)
+        # Same parameters adafruit_imageload uses for indexed BMPs
+        bitmaptools.readinto(
+            bitmap, f,
+            bits_per_pixel=bits,
+            element_size=4,
+            reverse_pixels_in_element=True,
+            reverse_rows=height > 0,
+        )
+    return bitmap, palette
+
+# Images are loaded into RAM when that leaves ASSET_HEADROOM bytes free for the
+# rest of the game (PACMAN_ASSET_HEADROOM in settings.toml), and streamed from
+# flash with OnDiskBitmap otherwise, which is slower to draw. The images of
+# ASSET_PRIORITY get RAM first, whatever order they are loaded in: room for
+# those still to come is set aside when loading any other image. build/assets.py
+# checks that they are images the game ships.
+ASSET_HEADROOM = int(os.getenv("PACMAN_ASSET_HEADROOM") or 16384)
+ASSET_PRIORITY = (
+    "images/sprites_atlas.bmp", # redrawn every frame
+)
+
+# (path, bytes of RAM, in RAM) of each image loaded, for reports and benchmarks
+assets = []
+
+def bitmap_size(path):
+    """Bytes of RAM the pixels of a BMP take as a displayio.Bitmap."""
+    with open(path, "rb") as f:
+        _, _, width, height, _, colors = read_bmp_header(f)
+    bits = 1 # bits per pixel of the Bitmap, a power of two
+    while 1 << bits < colors:
+        bits *= 2
+    return (width * bits + 31) // 32 * 4 * abs(height)
+
+def load_asset(path):
+    """Load an image of images/ at the current SCALE into RAM if it fits, or
+    stream it from flash. Returns (bitmap, palette)."""
+    loaded = [asset[0] for asset in assets]
+    rank = ASSET_PRIORITY.index(path) if path in ASSET_PRIORITY else len(ASSET_PRIORITY)
+    reserved = 0
+    for other in ASSET_PRIORITY[:rank]:
+        if other not in loaded:
+            reserved += bitmap_size(scaled_image(other))
+    file = scaled_image(path)
+    size = bitmap_size(file)
+    gc.collect()
+    free = gc.mem_free()
+    resident = free - reserved - size >= ASSET_HEADROOM
+    if resident:
+        bitmap, palette = load_bmp(file)
+        print(f"Asset {file}: {size} bytes RAM")
+    else:
+        bitmap = displayio.OnDiskBitmap(file)
+        palette = bitmap.pixel_shader
+        print(f"Asset {file}: streamed from flash, {size} bytes with {free - reserved} free")
+    assets.append((path, size, resident))
+    return bitmap, palette
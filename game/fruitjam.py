@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: MIT
+"""Fruit Jam backend: DVI display, keyboard over the serial console and I2S audio."""
+import os
+import board
+import adafruit_fruitjam
+import audiocore
+import audiomixer
+import supervisor
+import synthio
+import sys
+from array import array
+
+from game.wake import wake_alarm
+
+try:
+    import launcher_config
+    config = launcher_config.LauncherConfig()
+except ImportError:
+    config = None
+
+# get user display width
+if (SCREEN_WIDTH := os.getenv("CIRCUITPY_DISPLAY_WIDTH")) is not None:
+    SCREEN_HEIGHT = next((h for w, h in adafruit_fruitjam.peripherals.VALID_DISPLAY_SIZES if SCREEN_WIDTH == w))
+else:
+    SCREEN_WIDTH = 720
+    SCREEN_HEIGHT = 400
+
+# =============================================================================
+# AUDIO
+# =============================================================================
+
+# Button 1 wakes the board from a suspended game ("p" on the keyboard
+# suspends). The alarm is made before Peripherals claims the buttons.
+WAKE_ALARM = wake_alarm(board.BUTTON1)
+
+peripherals = adafruit_fruitjam.peripherals.Peripherals(
+    safe_volume_limit=(config.audio_volume_override_danger if config is not None else 0.75),
+)
+SAMPLE_RATE = peripherals.dac.sample_rate
+
+# Mixer voices: the synth plays tones and the jingle, sample effects play on top
+VOICE_SYNTH = 0
+VOICE_SIREN = 1
+VOICE_FX = 2
+mixer = audiomixer.Mixer(
+    voice_count=3,
+    sample_rate=SAMPLE_RATE,
+    channel_count=1,
+    bits_per_sample=16,
+    samples_signed=True,
+    buffer_size=2048,
+)
+peripherals.audio.play(mixer)
+
+synth = synthio.Synthesizer(
+    sample_rate=SAMPLE_RATE,
+    channel_count=1,
+)
+mixer.voice[VOICE_SYNTH].play(synth)
+mixer.voice[VOICE_SIREN].level = 0.4
+
+# Single preallocated note, retuned for every tone instead of allocating a new Note
+tone_note = synthio.Note(
+    frequency=440,
+    envelope=synthio.Envelope(attack_time=0.002, release_time=0.02, sustain_level=1.0),
+)
+
+def make_sample(steps, volume=0.25):
+    """Render (frequency, seconds) square wave steps into a RawSample."""
+    amplitude = int(32767 * volume)
+    longest = SAMPLE_RATE // (2 * min(freq for freq, _ in steps)) + 1
+    high = memoryview(array("h", [amplitude] * longest))
+    low = memoryview(array("h", [-amplitude] * longest))
+
+    length = 0
+    for _, duration in steps:
+        length += int(SAMPLE_RATE * duration)
+    # arrays are raw-initialised from bytes: 2 bytes per zeroed sample
+    buffer = array("h", bytes(2 * length))
+    out = memoryview(buffer)
+
+    pos = 0
+    for freq, duration in steps:
+        end = pos + int(SAMPLE_RATE * duration)
+        half = SAMPLE_RATE // (2 * freq)
+        level = high
+        while pos < end:
+            n = min(half, end - pos)
+            out[pos:pos + n] = level[:n]
+            pos += n
+            level = low if level is high else high
+    return audiocore.RawSample(buffer, sample_rate=SAMPLE_RATE)
+
+# =============================================================================
+# DISPLAY
+# =============================================================================
+
+adafruit_fruitjam.peripherals.request_display_config(SCREEN_WIDTH, SCREEN_HEIGHT)
+display = supervisor.runtime.display
+
+# =============================================================================
+# INPUT
+# =============================================================================
+
+
+# Reused by every call, so frames without typing allocate nothing
+keys = []
+
+def read_keys():
+    """Keys typed on the serial console since the last call, arrow key escape sequences kept whole.
+
+    The list is reused, it is only valid until the next call.
+    """
+    keys.clear()
+    if (available := supervisor.runtime.serial_bytes_available) > 0:
+        buffer = sys.stdin.read(available)
+        i = 0
+        while i < len(buffer):
+            if buffer[i] == "\x1b" and len(buffer) - i >= 3 and buffer[i + 1] == "[":
+                keys.append(buffer[i:i + 3])
+                i += 3
+            else:
+                keys.append(buffer[i])
+                i += 1
+    return keys
@@ -0,0 +1,259 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""Scoreboard, lives, level fruit and the bonus fruit shown in the maze."""
+import displayio
+
+from game.config import SCALE, NATIVE, OFFSET_X, OFFSET_Y, GAME_WIDTH, GAME_HEIGHT, VIEW_WIDTH, VIEW_HEIGHT
+from game.display import static_layer, dynamic_layer, new_tile_grid, tile_index, place
+from game.maze import FRUIT_TILE_X, FRUIT_TILE_Y
+from game.sprites import (
+    SPRITE_LIFE, SPRITE_BLANK, FRUIT_LEVELS, new_sprite_grid, set_sprite_frame, new_cell_grid, set_cell_frame,
+)
+
+try:
+    from adafruit_display_text import label
+except ImportError:
+    label = None
+
+# =============================================================================
+# SCOREBOARD SETUP
+# =============================================================================
+
+FONT = None
+one_up_label = None
+high_score_title_label = None
+game_over_label = None
+
+# The scores are TileGrids of digits cut from the font at startup, so showing
+# a new score formats no string and lays out no glyphs
+SCORE_DIGITS = 8
+BLANK = 10 # tile index of the empty cell after the digits 0-9
+score_grid = None
+high_score_grid = None
+digit_width = 0
+
+def font_ascent(font):
+    """The ascent adafruit_display_text places the baseline of a label with."""
+    if hasattr(font, "ascent"):
+        return font.ascent
+    glyphs = [font.get_glyph(ord(c)) for c in "M j'"]
+    return max(glyph.height + glyph.dy for glyph in glyphs if glyph)
+
+def font_descent(font):
+    """How far the glyphs of a font reach below the baseline."""
+    if hasattr(font, "descent"):
+        return font.descent
+    glyphs = [font.get_glyph(ord(c)) for c in "M j'"]
+    return max(max(-glyph.dy for glyph in glyphs if glyph), 0)
+
+def draw_pixel(bitmap, x, y):
+    """Set unscaled pixel (x, y) of the view of a bitmap, as a SCALE x SCALE block.
+    For NATIVE the bitmap holds its view turned like the pre-rotated images."""
+    if NATIVE:
+        x, y = y, bitmap.height // SCALE - 1 - x
+    for i in range(SCALE * SCALE):
+        bitmap[x * SCALE + i % SCALE, y * SCALE + i // SCALE] = 1
+
+def draw_glyph(bitmap, glyph, left, top):
+    for y in range(glyph.height):
+        for x in range(glyph.width):
+            if glyph.bitmap[glyph.tile_index * glyph.width + x, y]:
+                draw_pixel(bitmap, left + x, top + y)
+
+def load_digits(font):
+    """The glyphs 0-9 in cells one advance wide with the baseline at the bottom,
+    scaled by SCALE. Returns (bitmap, cell width, cell height) in unscaled pixels."""
+    glyphs = [font.get_glyph(ord("0") + digit) for digit in range(10)]
+    width = max(glyph.shift_x for glyph in glyphs)
+    height = max(glyph.height + glyph.dy for glyph in glyphs)
+    if NATIVE:
+        # Stacked, so the turned bitmap has the cells side by side in digit order
+        tiles = displayio.Bitmap((BLANK + 1) * height * SCALE, width * SCALE, 2)
+    else:
+        tiles = displayio.Bitmap((BLANK + 1) * width * SCALE, height * SCALE, 2)
+    for digit, glyph in enumerate(glyphs):
+        if NATIVE:
+            draw_glyph(tiles, glyph, glyph.dx, (digit + 1) * height - glyph.height - glyph.dy)
+        else:
+            draw_glyph(tiles, glyph, digit * width + glyph.dx, height - glyph.height - glyph.dy)
+    return tiles, width, height
+
+def new_number_grid(tiles, width, height):
+    palette = displayio.Palette(2)
+    palette[1] = 0xFFFFFF
+    palette.make_transparent(0)
+    return new_tile_grid(tiles, palette, SCORE_DIGITS, 1, width * SCALE, height * SCALE, default_tile=BLANK)
+
+def show_number(grid, value):
+    """Show value left aligned, with at least two digits. Returns the number of digits."""
+    count = 2
+    rest = value // 100
+    while rest and count < SCORE_DIGITS:
+        count += 1
+        rest //= 10
+    for i in range(SCORE_DIGITS - 1, count - 1, -1):
+        grid[tile_index(grid, i, 0)] = BLANK
+    for i in range(count - 1, -1, -1):
+        grid[tile_index(grid, i, 0)] = value % 10
+        value //= 10
+    return count
+
+# The labels are adafruit_display_text Labels, or for NATIVE a TileGrid with the
+# text drawn turned at startup, which the library cannot do without a rotated
+# TileGrid
+
+def draw_text(bitmap, text):
+    """Draw text in FONT on a label bitmap, with the baseline at the font ascent."""
+    bitmap.fill(0)
+    left = 0
+    ascent = font_ascent(FONT)
+    for c in text:
+        glyph = FONT.get_glyph(ord(c))
+        if glyph:
+            draw_glyph(bitmap, glyph, left + glyph.dx, ascent - glyph.height - glyph.dy)
+            left += glyph.shift_x
+
+def new_label(text, color, x, y, anchor=None):
+    """A label of text in FONT at SCALE, placed like a Label at (x, y) of the view,
+    or with the anchor point of its bounding box there."""
+    if not NATIVE:
+        text_label = label.Label(FONT, text=text, color=color, scale=SCALE)
+        if anchor is None:
+            text_label.x = x
+            text_label.y = y
+        else:
+            text_label.anchor_point = anchor
+            text_label.anchored_position = (x, y)
+        return text_label
+    width = 0
+    for c in text:
+        glyph = FONT.get_glyph(ord(c))
+        width += glyph.shift_x if glyph else 0
+    ascent = font_ascent(FONT)
+    height = ascent + font_descent(FONT)
+    bitmap = displayio.Bitmap(height * SCALE, width * SCALE, 2)
+    draw_text(bitmap, text)
+    palette = displayio.Palette(2)
+    palette[1] = color
+    palette.make_transparent(0)
+    text_label = new_tile_grid(bitmap, palette, 1, 1, width * SCALE, height * SCALE)
+    if anchor is None:
+        # A Label's y is half the ascent above the baseline
+        place(text_label, x, y + (ascent // 2 - ascent) * SCALE, width * SCALE)
+    else:
+        place(text_label, x - int(anchor[0] * width * SCALE), y - int(anchor[1] * height * SCALE), width * SCALE)
+    return text_label
+
+def set_label_text(text_label, text):
+    """Change the text of a label made by new_label(), to one no wider."""
+    if NATIVE:
+        draw_text(text_label.bitmap, text)
+    else:
+        text_label.text = text
+
+if label is not None or NATIVE:
+    try:
+        try:
+            from adafruit_bitmap_font import bitmap_font
+            FONT = bitmap_font.load_font("fonts/press_start_2p.bdf")
+        except ImportError:
+            # The built-in font is only loaded when the bitmap font library is missing
+            import terminalio
+            FONT = terminalio.FONT
+
+        # 1UP Label (Top Left)
+        one_up_label = new_label("1UP", 0xFFFFFF, 8 * SCALE, 8 * SCALE)
+        dynamic_layer.append(one_up_label)
+
+        digit_tiles, digit_width, digit_height = load_digits(FONT)
+
+        # Score (Below 1UP), on the baseline a label at y = 24 would have
+        score_grid = new_number_grid(digit_tiles, digit_width, digit_height)
+        place(score_grid, 8 * SCALE, (24 + font_ascent(FONT) // 2 - digit_height) * SCALE,
+              SCORE_DIGITS * digit_width * SCALE)
+        show_number(score_grid, 0)
+        dynamic_layer.append(score_grid)
+
+        # High Score Title (Top Center)
+        high_score_title_label = new_label("HIGH SCORE", 0xFFFFFF, VIEW_WIDTH // 2, 8 * SCALE, (0.5, 0.0))
+        static_layer.append(high_score_title_label)
+
+        # High Score Value (Below Title), centered by show_high_score()
+        high_score_grid = new_number_grid(digit_tiles, digit_width, digit_height)
+        dynamic_layer.append(high_score_grid)
+
+    except Exception as e:
+        print(f"Scoreboard error: {e}")
+
+def show_score(score):
+    if score_grid is not None:
+        # Arcade style: just the number, "00" before the first points
+        show_number(score_grid, score)
+
+def show_high_score(high_score):
+    if high_score_grid is not None:
+        count = show_number(high_score_grid, high_score)
+        place(high_score_grid, VIEW_WIDTH // 2 - count * digit_width * SCALE // 2, 24 * SCALE,
+              SCORE_DIGITS * digit_width * SCALE)
+
+def show_1up(visible):
+    """Show or hide 1UP, which blinks during the game."""
+    if one_up_label:
+        one_up_label.hidden = not visible
+
+def show_player(number):
+    """Label the score with the player whose turn it is, 1UP or 2UP."""
+    if one_up_label:
+        set_label_text(one_up_label, f"{number}UP")
+
+def show_game_over(visible):
+    """Show or hide GAME OVER, the label is created the first time it is shown."""
+    global game_over_label
+    if game_over_label is None:
+        if not visible or high_score_grid is None:
+            return
+        # GAME OVER Label (centered), drawn under the lives and fruit like the other labels
+        game_over_label = new_label("GAME  OVER", 0xFF0000, VIEW_WIDTH // 2, VIEW_HEIGHT // 2, (0.5, 0.5))
+        dynamic_layer.insert(dynamic_layer.index(high_score_grid) + 1, game_over_label)
+    game_over_label.hidden = not visible
+
+# =============================================================================
+# LIVES AND FRUIT DISPLAY
+# =============================================================================
+
+# The lives (bottom left) and the level fruit (bottom right) are one TileGrid
+# of 8x8 cells below the game area, starting at the first life
+MAX_LIVES_SHOWN = 5
+STATUS_X = 24
+FRUIT_COLUMN = (GAME_WIDTH - 32 - STATUS_X) // 8
+status_row = new_cell_grid(FRUIT_COLUMN + 2, 2)
+place(status_row, OFFSET_X + STATUS_X * SCALE, OFFSET_Y + (GAME_HEIGHT + 4) * SCALE, (FRUIT_COLUMN + 2) * 8 * SCALE)
+dynamic_layer.append(status_row)
+
+# Bonus fruit that appears in the maze
+bonus_fruit = new_sprite_grid()
+# Fruit appears below ghost house (tile 13-14, row 17 in arcade = pixel coords)
+# Center of maze, below ghost house, moved up 4 pixels
+place(bonus_fruit, OFFSET_X + FRUIT_TILE_X * 8 * SCALE, OFFSET_Y + (FRUIT_TILE_Y * 8 - 4) * SCALE, 16 * SCALE)
+bonus_fruit.hidden = True
+dynamic_layer.append(bonus_fruit)
+
+def update_fruit_sprite(level):
+    """Update fruit sprite based on current level."""
+    fruit_idx = min(level - 1, len(FRUIT_LEVELS) - 1)
+    fx, fy = FRUIT_LEVELS[fruit_idx]
+    set_cell_frame(status_row, FRUIT_COLUMN, 0, fx, fy)
+
+def update_bonus_fruit(level):
+    """Update bonus fruit sprite based on current level."""
+    fruit_idx = min(level - 1, len(FRUIT_LEVELS) - 1)
+    fx, fy = FRUIT_LEVELS[fruit_idx]
+    set_sprite_frame(bonus_fruit, fx, fy)
+
+def update_life_display(lives):
+    """Update the life icons based on current lives."""
+    for i in range(MAX_LIVES_SHOWN):
+        # Show lives - 1 (don't show current life), spaced 16 pixels apart
+        fx, fy = SPRITE_LIFE if i < lives - 1 else SPRITE_BLANK
+        set_cell_frame(status_row, i * 2, 0, fx, fy)
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Input to display latency, enabled with PACMAN_LATENCY = 1 in settings.toml.
+
+Every press of a new direction is followed from the input to the screen, with
+supervisor.ticks_ms() taken at four points of the main loop:
+
+    polled()    the switches are read (Wio Terminal) or the serial console is
+                drained (Fruit Jam), the raw edge happened since the poll before
+    consumed()  the direction is handed to Pac-Man as next_direction
+    moved()     after pacman.update(), the direction Pac-Man actually took
+    shown()     after display.refresh(), the frame that showed it
+
+The time between them is split into four components:
+
+    polling     previous poll to the poll that saw the edge. The edge itself is
+                not timestamped, so this is the most it could have waited.
+                A button held through a pause counts from the first poll after it
+    queueing    poll to consumed, the rest of the frame before the input phase
+    game        consumed to moved, mostly waiting for the next tile center
+    display     moved to shown, the rest of the frame, the frame pacing sleep
+                and the refresh
+
+and kept as a histogram in powers of two of milliseconds, along with the
+total. A press that is replaced by another direction before Pac-Man takes it,
+or that a new life or level throws away, is counted as dropped. report()
+prints the histograms at the end of every level or game. Nothing is allocated
+while playing, so it can be combined with PACMAN_AUDIT; with PACMAN_AUTOPILOT
+the decisions of the autopilot are measured as presses.
+"""
+from supervisor import ticks_ms
+
+from game import log
+from game.config import DIR_NONE, TICKS_PERIOD
+
+POLLING = 0
+QUEUEING = 1
+GAME = 2
+DISPLAY = 3
+TOTAL = 4
+COMPONENT_NAMES = ("polling", "queueing", "game", "display", "total")
+
+# Bucket i counts latencies under 2**i ms, the last one everything longer
+BUCKETS = 10
+BUCKET_LABELS = tuple(f"<{1 << i}" for i in range(BUCKETS - 1)) + (f">={1 << (BUCKETS - 2)}",)
+
+histogram = [[0] * BUCKETS for _ in COMPONENT_NAMES]
+total_ms = [0] * len(COMPONENT_NAMES)
+max_ms = [0] * len(COMPONENT_NAMES)
+presses = 0
+dropped = 0
+
+# The last two polls and the raw direction they read. The input is only read
+# while playing, so the first poll after a pause has no poll before it.
+poll_time = 0
+previous_poll_time = 0
+paused = True
+last_direction = DIR_NONE
+
+# The press being followed, DIR_NONE for none
+target = DIR_NONE
+edge_time = 0
+press_poll_time = 0
+consumed_time = 0
+moved_time = 0
+applied = False
+
+def elapsed(start, end):
+    return (end - start) % TICKS_PERIOD
+
+def add(component, ms):
+    bucket = 0
+    while bucket < BUCKETS - 1 and ms >> bucket:
+        bucket += 1
+    histogram[component][bucket] += 1
+    total_ms[component] += ms
+    if ms > max_ms[component]:
+        max_ms[component] = ms
+
+def polled():
+    """The input was just read."""
+    global poll_time, previous_poll_time, paused
+    now = ticks_ms()
+    previous_poll_time = now if paused else poll_time
+    poll_time = now
+    paused = False
+
+def consumed(direction, current_direction):
+    """direction was read and handed to Pac-Man, who is going current_direction."""
+    global last_direction, target, edge_time, press_poll_time, consumed_time, applied, dropped
+    if direction == last_direction:
+        return
+    last_direction = direction
+    if direction == DIR_NONE or direction == target:
+        # A release, or the same direction pressed again before it was taken
+        return
+    if target != DIR_NONE and not applied:
+        dropped += 1
+    if direction == current_direction:
+        target = DIR_NONE
+        return
+    target = direction
+    edge_time = previous_poll_time
+    press_poll_time = poll_time
+    consumed_time = ticks_ms()
+    applied = False
+
+def moved(direction, next_direction):
+    """Pac-Man was updated and is now going direction, with next_direction queued."""
+    global moved_time, applied, target, dropped
+    if target == DIR_NONE or applied:
+        return
+    if direction == target:
+        moved_time = ticks_ms()
+        applied = True
+    elif next_direction != target:
+        # Reset for a new life or level
+        target = DIR_NONE
+        dropped += 1
+
+def shown(playing):
+    """The display was refreshed, the press ends here if Pac-Man has taken it.
+    playing is True in STATE_PLAY."""
+    global target, presses, paused
+    if not playing:
+        paused = True
+    if target == DIR_NONE or not applied:
+        return
+    now = ticks_ms()
+    add(POLLING, elapsed(edge_time, press_poll_time))
+    add(QUEUEING, elapsed(press_poll_time, consumed_time))
+    add(GAME, elapsed(consumed_time, moved_time))
+    add(DISPLAY, elapsed(moved_time, now))
+    add(TOTAL, elapsed(edge_time, now))
+    presses += 1
+    target = DIR_NONE
+
+def report():
+    """Print the histograms since the last report."""
+    global presses, dropped
+    log.write(f"Latency: {presses} presses, {dropped} dropped")
+    for i, name in enumerate(COMPONENT_NAMES):
+        if presses:
+            buckets = " ".join(f"{BUCKET_LABELS[b]}:{histogram[i][b]}" for b in range(BUCKETS) if histogram[i][b])
+            log.write(f"Latency: {name} mean {total_ms[i] / presses:.1f} max {max_ms[i]} ms, {buckets}")
+        for b in range(BUCKETS):
+            histogram[i][b] = 0
+        total_ms[i] = 0
+        max_ms[i] = 0
+    presses = 0
+    dropped = 0
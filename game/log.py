@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Buffered serial console log for messages printed while the game is running.
+
+print() writes to USB CDC synchronously, which stalls the frame while a host
+has the port open but is not reading. write() copies the message into a
+preallocated ring buffer instead, and code.py calls flush() in the idle time
+at the end of a frame. A message that does not fit is dropped and counted.
+
+Gate every call on a level flag from game.config, so disabled messages are
+never formatted. Messages written while playing must not allocate: the text is
+a bytes literal and a number that goes with it is passed as an int, which
+write() copies and renders straight into the buffer:
+
+    if LOG_INFO:
+        log.write(b"ATE GHOST ", ghost_type)
+
+Messages between states, where the heap is collected anyway, can be f-strings:
+
+    if LOG_INFO:
+        log.write(f"LEVEL {level} COMPLETE!")
+
+Messages are expected to be ASCII. flush() allocates the slice of the buffer
+it writes out (and on a host Python, the str of it), which is why code.py
+only calls it outside the phases of a frame that game/audit.py checks.
+"""
+import sys
+
+BUFFER_SIZE = 1024
+
+# Bytes written by one flush() in the slack time of a frame
+FLUSH_BYTES = 64
+
+buffer = bytearray(BUFFER_SIZE)
+view = memoryview(buffer)
+head = 0 # first byte not written out yet
+size = 0 # bytes waiting in the buffer
+dropped = 0
+
+try:
+    from supervisor import runtime
+except ImportError:
+    runtime = None # host Python, always write
+
+# The console of CircuitPython writes any buffer, a host Python's needs a str
+TEXT_CONSOLE = sys.implementation.name not in ("circuitpython", "micropython")
+
+def put(data):
+    """Copy bytes to the end of the buffer, which must have room for them."""
+    global size
+    tail = (head + size) % BUFFER_SIZE
+    for i in range(len(data)):
+        buffer[tail] = data[i]
+        tail = tail + 1 if tail < BUFFER_SIZE - 1 else 0
+    size += len(data)
+
+def digit_count(number):
+    count = 1 if number >= 0 else 2
+    number = abs(number)
+    while number >= 10:
+        number //= 10
+        count += 1
+    return count
+
+def put_number(number):
+    """Write the decimal digits of an int to the end of the buffer, which must
+    have room for them, without making a str of it."""
+    global size
+    if number < 0:
+        put(b"-")
+        number = -number
+    scale = 1
+    while scale * 10 <= number:
+        scale *= 10
+    tail = (head + size) % BUFFER_SIZE
+    while scale:
+        buffer[tail] = 48 + number // scale % 10 # ASCII "0" + the digit
+        tail = tail + 1 if tail < BUFFER_SIZE - 1 else 0
+        size += 1
+        scale //= 10
+
+def write(text, number=None):
+    """Queue one line of text (bytes or str), followed by number if it is
+    given, or drop it if the buffer is full."""
+    global dropped
+    if isinstance(text, str):
+        text = text.encode()
+    length = len(text) + 1
+    if number is not None:
+        length += digit_count(number)
+    if size + length > BUFFER_SIZE:
+        dropped += 1
+        return
+    put(text)
+    if number is not None:
+        put_number(number)
+    put(b"\n")
+
+def flush(limit=FLUSH_BYTES):
+    """Write up to limit queued bytes to the console."""
+    global head, size, dropped
+    if dropped and size + 40 <= BUFFER_SIZE:
+        count = dropped
+        dropped = 0
+        write(b"Log: messages dropped: ", count)
+    if runtime is not None and not runtime.serial_connected:
+        # nobody is listening, CircuitPython would discard the output anyway
+        head = size = 0
+        return
+    while size and limit > 0:
+        count = min(size, limit, BUFFER_SIZE - head)
+        chunk = view[head:head + count]
+        sys.stdout.write(str(chunk, "ascii") if TEXT_CONSOLE else chunk)
+        head = (head + count) % BUFFER_SIZE
+        size -= count
+        limit -= count
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Maze data compiled from build/mazes/*.txt by build/maze_compiler.py, and the
+maze layers of the display: background, level complete flash, and the items
+grid of dots and power pellets. The pellets blink by switching their items tile
+between 2 and the blank tile 3 (blink_pellets()).
+"""
+import displayio
+import gc
+import os
+import struct
+
+from game.config import (
+    SCALE, NATIVE, OFFSET_X, OFFSET_Y, GAME_WIDTH, MAZE_COLS, MAZE_ROWS, A_DOT, A_POWER,
+)
+from game.display import static_layer, dynamic_layer, load_asset, new_tile_grid, place
+
+# =============================================================================
+# MAZE DATA
+# =============================================================================
+
+# Alternate mazes can be selected with PACMAN_MAZE in settings.toml
+MAZE_FILE = os.getenv("PACMAN_MAZE") or "mazes/pacman.bin"
+
+MAZE_HEADER = "<4sBBHBBhh12b8bBBB4BBBB32s"
+
+with open(MAZE_FILE, "rb") as f:
+    (magic, cols, rows, TOTAL_DOTS,
+     PACMAN_START_TILE_X, PACMAN_START_TILE_Y, PACMAN_START_X, PACMAN_START_Y,
+     *spawns, DOOR_X, DOOR_Y, HOME_Y,
+     HOUSE_LEFT, HOUSE_TOP, HOUSE_RIGHT, HOUSE_BOTTOM,
+     FRUIT_TILE_X, FRUIT_TILE_Y, MAZE_WALL_COLOR, MAZE_IMAGE) = struct.unpack(MAZE_HEADER, f.read(struct.calcsize(MAZE_HEADER)))
+    if magic != b"PMZ2" or cols != MAZE_COLS or rows != MAZE_ROWS:
+        raise ValueError(f"{MAZE_FILE} is not a {MAZE_COLS}x{MAZE_ROWS} maze")
+
+    # One attribute byte per tile, row-major: maze_attrs[ty * MAZE_COLS + tx]
+    maze_attrs = bytearray(MAZE_COLS * MAZE_ROWS)
+    f.readinto(maze_attrs)
+
+    # Background tile index for each tile (only needed while building the display)
+    maze_tiles = bytearray(MAZE_COLS * MAZE_ROWS)
+    f.readinto(maze_tiles)
+
+MAZE_IMAGE = MAZE_IMAGE.rstrip(b"\x00").decode("utf-8")
+
+# Ghost spawn points (Tile X, Tile Y, X Offset Px) and scatter targets (Tile X, Tile Y)
+# in Blinky, Pinky, Inky, Clyde order
+GHOST_SPAWNS = [tuple(spawns[i:i + 3]) for i in range(0, 12, 3)]
+SCATTER_TARGETS = [tuple(spawns[i:i + 2]) for i in range(12, 20, 2)]
+del spawns
+
+POWER_PELLETS = [(i % MAZE_COLS, i // MAZE_COLS) for i in range(len(maze_attrs)) if maze_attrs[i] & A_POWER]
+
+def maze_cell(i):
+    """Index in the maze TileGrids of maze tile i (ty * MAZE_COLS + tx), see tile_index()."""
+    if NATIVE:
+        return (MAZE_COLS - 1 - i % MAZE_COLS) * MAZE_ROWS + i // MAZE_COLS
+    return i
+
+# =============================================================================
+# MAZE BACKGROUND
+# =============================================================================
+
+# The empty maze (no dots) is drawn from its unique 8x8 tiles, generated by
+# build/maze_compiler.py, so the whole background fits in RAM when the sprites
+# leave room for it (see load_asset())
+maze_tile_bmp, maze_palette = load_asset(MAZE_IMAGE)
+
+def new_maze_grid(palette, tiles, maze_order=False):
+    """Create a TileGrid of the maze background tiles, copied from another grid,
+    or from a tile map in maze order."""
+    grid = new_tile_grid(maze_tile_bmp, palette, MAZE_COLS, MAZE_ROWS, 8 * SCALE, 8 * SCALE)
+    place(grid, OFFSET_X, OFFSET_Y, GAME_WIDTH * SCALE)
+    for i in range(MAZE_COLS * MAZE_ROWS):
+        grid[maze_cell(i)] = tiles[i if maze_order else maze_cell(i)]
+    return grid
+
+# Create maze background as TileGrid
+maze_bg = new_maze_grid(maze_palette, maze_tiles, maze_order=True)
+static_layer.append(maze_bg)
+
+print(f"Maze tiles: {max(maze_tiles) + 1} unique, {len(maze_tiles)} bytes tile map")
+del maze_tiles
+
+# Level complete flash: the same tiles with only the walls drawn, in white.
+# Showing or hiding it redraws the maze area once per blink, without
+# changing the maze palette. Most boots never finish a level, so it is only
+# created the first time it is shown.
+maze_flash = None
+
+def show_maze_flash(visible):
+    """Show or hide the white walls of the level complete flash."""
+    global maze_flash
+    if maze_flash is None:
+        if not visible:
+            return
+        flash_palette = displayio.Palette(len(maze_palette))
+        flash_palette[MAZE_WALL_COLOR] = 0xFFFFFF
+        maze_flash = new_maze_grid(flash_palette, maze_bg)
+        static_layer.insert(static_layer.index(maze_bg) + 1, maze_flash)
+    maze_flash.hidden = not visible
+
+# =============================================================================
+# ITEMS GRID (DOTS & POWER PELLETS)
+# =============================================================================
+
+# Create a bitmap for items:
+# Tile 0: Empty
+# Tile 1: Small Dot
+# Tile 2: Power Pellet
+# Tile 3: Power Pellet blinked off (empty, but still eaten as a pellet)
+# The tiles look the same turned a quarter, so they are not rotated for NATIVE
+items_bitmap = displayio.Bitmap(8 * SCALE, 32 * SCALE, 3) # 8 wide, 32 tall (4 tiles), 3 colors (though we only use 1 index)
+
+def draw_item_pixel(x, y, value):
+    """Set one item pixel, drawn as a SCALE x SCALE block."""
+    for dy in range(SCALE):
+        for dx in range(SCALE):
+            items_bitmap[x * SCALE + dx, y * SCALE + dy] = value
+
+# Draw Small Dot (Tile 1, y=8..15)
+# 2x2 pixel dot in center
+draw_item_pixel(3, 11, 1)
+draw_item_pixel(4, 11, 1)
+draw_item_pixel(3, 12, 1)
+draw_item_pixel(4, 12, 1)
+
+# Draw Power Pellet (Tile 2, y=16..23)
+# 6x6 circle-ish (rounded corners)
+for x in range(1, 7):
+    for y in range(17, 23):
+        # Skip corners to make it round
+        if (x == 1 or x == 6) and (y == 17 or y == 22):
+            continue
+        draw_item_pixel(x, y, 2)
+
+# Palette for items
+items_palette = displayio.Palette(3)
+items_palette[0] = 0x000000 # Transparent
+items_palette[1] = 0xFFB8AE # Salmon/White (Dot)
+items_palette[2] = 0xFFB8AE # Salmon/White (Power Pellet)
+items_palette.make_transparent(0)
+
+# Indexed by maze_cell(), code that does not draw can read it by maze tile
+# with items_grid[maze_cell(i)]
+items_grid = new_tile_grid(items_bitmap, items_palette, MAZE_COLS, MAZE_ROWS, 8 * SCALE, 8 * SCALE)
+place(items_grid, OFFSET_X, OFFSET_Y, GAME_WIDTH * SCALE)
+
+def reset_dots():
+    """Reset all dots and power pellets to their initial state."""
+    for i in range(MAZE_COLS * MAZE_ROWS):
+        attr = maze_attrs[i]
+        if attr & A_POWER:
+            items_grid[maze_cell(i)] = 2 # Power Pellet
+        elif attr & A_DOT:
+            items_grid[maze_cell(i)] = 1 # Small Dot
+        else:
+            items_grid[maze_cell(i)] = 0 # Empty
+
+# Populate items_grid from the maze attributes
+# (unreachable islands, ghost house and tunnels are excluded by the maze compiler)
+reset_dots()
+dynamic_layer.append(items_grid)
+print(f"Total dots in maze: {TOTAL_DOTS}")
+
+# =============================================================================
+# POWER PELLET BLINKING
+# =============================================================================
+
+# Blinking swaps the power pellet cells of items_grid between tiles 2 and 3,
+# so only those four cells are redrawn and eaten pellets stay empty.
+POWER_PELLET_CELLS = [maze_cell(ty * MAZE_COLS + tx) for tx, ty in POWER_PELLETS]
+
+def blink_pellets(visible):
+    """Show or hide the power pellets that have not been eaten."""
+    tile = 2 if visible else 3
+    for i in POWER_PELLET_CELLS:
+        if items_grid[i]:
+            items_grid[i] = tile
+
+gc.collect()
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Frame pacing for the states where almost nothing changes on screen.
+
+While a ghost or the fruit is being eaten and on the game over screen, each
+pass of the main loop counts as STATIC_STEP frames: the timers of those states
+advance by STATIC_STEP, so the logic and display.refresh() run at 15 Hz
+instead of 60 and the freezes last as long as before. The rest of a frame is
+spent in time.sleep(), which idles the CPU until the next interrupt on
+CircuitPython. On the game over screen that sleep is cut into 60 Hz slices
+that check for input, so a key press still restarts the game at once, and the
+display is dimmed after IDLE_DIM_TIME seconds without one.
+"""
+import time
+
+from game.config import FRAME_DELAY, STATE_EATING_GHOST, STATE_EATING_FRUIT, STATE_GAME_OVER
+from game.controls import input_waiting
+
+# Frames counted by one pass of the loop in a static state
+STATIC_STEP = 4
+STATIC_FRAME_TIME = STATIC_STEP / 60
+
+# Seconds on the game over screen before the display is dimmed
+IDLE_DIM_TIME = 30
+
+def frame_step(state):
+    """Frames one pass of the loop counts as in this state."""
+    if state == STATE_EATING_GHOST or state == STATE_EATING_FRUIT or state == STATE_GAME_OVER:
+        return STATIC_STEP
+    return 1
+
+def frame_time(step):
+    """Seconds a pass of the loop takes, for frame_step() frames."""
+    return FRAME_DELAY if step == 1 else STATIC_FRAME_TIME
+
+def idle(seconds, wake_on_input=False):
+    """Sleep for the rest of a frame, with wake_on_input until there is input."""
+    if not wake_on_input:
+        time.sleep(seconds)
+        return
+    for _ in range(max(1, round(seconds * 60))):
+        if input_waiting():
+            return
+        time.sleep(1 / 60)
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Two-player alternating mode, enabled with PACMAN_TWO_PLAYERS = 1 in settings.toml.
+
+code.py plays with its own score, lives, level and dots_eaten, and the player
+waiting for their turn keeps theirs in a Player. The dots left in a player's
+maze are kept as one bit per maze cell (DOT_BYTES, 109 bytes for 28x31) rather
+than a copy of items_grid, and a turn change only redraws the cells where the
+two players' mazes differ.
+"""
+from game.config import MAZE_COLS, MAZE_ROWS, A_DOT, A_POWER
+from game.maze import maze_attrs, items_grid, maze_cell
+
+CELLS = MAZE_COLS * MAZE_ROWS
+DOT_BYTES = (CELLS + 7) // 8
+
+def fill_dots(dots):
+    """Set the bits of every dot and power pellet of a new maze."""
+    for b in range(DOT_BYTES):
+        dots[b] = 0
+    for i in range(CELLS):
+        if maze_attrs[i] & (A_DOT | A_POWER):
+            dots[i >> 3] |= 1 << (i & 7)
+
+def save_dots(dots):
+    """Set the bits of the dots left in items_grid."""
+    for b in range(DOT_BYTES):
+        dots[b] = 0
+    for i in range(CELLS):
+        if items_grid[maze_cell(i)]:
+            dots[i >> 3] |= 1 << (i & 7)
+
+def restore_dots(shown, dots):
+    """Redraw items_grid, which shows the bits in shown, with the bits in dots.
+    Only the cells that differ are written."""
+    for b in range(DOT_BYTES):
+        diff = shown[b] ^ dots[b]
+        if not diff:
+            continue
+        for bit in range(8):
+            if diff & (1 << bit):
+                i = b * 8 + bit
+                if not dots[b] & (1 << bit):
+                    items_grid[maze_cell(i)] = 0
+                elif maze_attrs[i] & A_POWER:
+                    items_grid[maze_cell(i)] = 2
+                else:
+                    items_grid[maze_cell(i)] = 1
+
+class Player:
+    """The game of a player while the other one plays."""
+
+    def __init__(self, number):
+        self.number = number
+        self.dots = bytearray(DOT_BYTES)
+        self.reset()
+
+    def reset(self):
+        """Start a new game."""
+        self.score = 0
+        self.lives = 3
+        self.level = 1
+        self.dots_eaten = 0
+        fill_dots(self.dots)
+
+def change_turn(outgoing, incoming):
+    """Save the maze of the outgoing player and show the incoming player's."""
+    save_dots(outgoing.dots)
+    restore_dots(outgoing.dots, incoming.dots)
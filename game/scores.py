@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Persistent high score table.
+
+The table is stored in microcontroller.nvm, or in a file where there is no
+nvm, as two alternating slots so every save rewrites only the older copy.
+Each slot holds one record:
+
+    magic    4 bytes, b"PMHS"
+    sequence uint16, incremented by every save (the newest valid slot wins)
+    count    uint8, number of scores in the table
+    scores   TABLE_SIZE uint32, highest first
+    checksum uint16, Fletcher-16 of everything before it
+
+The table is read once at boot and only written at game over.
+"""
+import os
+import struct
+
+from game import log
+
+TABLE_SIZE = 5
+
+RECORD = f"<4sHB{TABLE_SIZE}IH"
+RECORD_SIZE = struct.calcsize(RECORD)
+SLOT_SIZE = 32
+MAGIC = b"PMHS"
+
+# Offset of the two slots in microcontroller.nvm (shared with other programs)
+NVM_OFFSET = int(os.getenv("PACMAN_NVM_OFFSET") or 0)
+
+# Used when the board has no nvm, needs a writable filesystem to save
+SCORES_FILE = "highscores.dat"
+
+try:
+    from microcontroller import nvm
+    if nvm is not None and len(nvm) < NVM_OFFSET + 2 * SLOT_SIZE:
+        nvm = None
+except ImportError:
+    nvm = None
+
+sequence = 0
+next_slot = 0
+
+def checksum(data):
+    a = b = 0
+    for byte in data:
+        a = (a + byte) % 255
+        b = (b + a) % 255
+    return (b << 8) | a
+
+def read_slots():
+    """Both raw slots, or None where there is nothing stored yet."""
+    if nvm is not None:
+        return [nvm[NVM_OFFSET + slot * SLOT_SIZE:NVM_OFFSET + slot * SLOT_SIZE + RECORD_SIZE] for slot in range(2)]
+    try:
+        with open(SCORES_FILE, "rb") as f:
+            data = f.read()
+    except OSError:
+        return [None, None]
+    return [data[slot * SLOT_SIZE:slot * SLOT_SIZE + RECORD_SIZE] for slot in range(2)]
+
+def write_slot(slot, record):
+    if nvm is not None:
+        nvm[NVM_OFFSET + slot * SLOT_SIZE:NVM_OFFSET + slot * SLOT_SIZE + RECORD_SIZE] = record
+        return
+    try:
+        with open(SCORES_FILE, "r+b") as f:
+            f.seek(slot * SLOT_SIZE)
+            f.write(record)
+    except OSError:
+        # first save, create the file with both slots
+        with open(SCORES_FILE, "wb") as f:
+            f.write(bytes(slot * SLOT_SIZE) + record)
+
+def load_scores():
+    """Read the high score table, highest first. Call once at boot."""
+    global sequence, next_slot
+    newest = None
+    for slot, data in enumerate(read_slots()):
+        if data is None or len(data) != RECORD_SIZE:
+            continue
+        magic, seq, count, *scores, check = struct.unpack(RECORD, data)
+        if magic != MAGIC or count > TABLE_SIZE or check != checksum(data[:-2]):
+            continue
+        # sequence numbers wrap around, the newer one is less than half the range ahead
+        if newest is None or (seq - newest[0]) & 0xFFFF < 0x8000:
+            newest = (seq, slot, scores[:count])
+    if newest is None:
+        return []
+    sequence, slot, scores = newest
+    next_slot = 1 - slot
+    return scores
+
+def add_score(scores, score):
+    """Insert a score into the table if it makes it, returns True if the table changed."""
+    if score <= 0 or (len(scores) == TABLE_SIZE and score <= scores[-1]):
+        return False
+    i = 0
+    while i < len(scores) and scores[i] >= score:
+        i += 1
+    scores.insert(i, score)
+    del scores[TABLE_SIZE:]
+    return True
+
+def save_scores(scores):
+    """Write the table over the older slot. Only call at game over, never in the frame loop."""
+    global sequence, next_slot
+    sequence = (sequence + 1) & 0xFFFF
+    data = struct.pack(RECORD[:-1], MAGIC, sequence, len(scores), *(scores + [0] * (TABLE_SIZE - len(scores))))
+    try:
+        write_slot(next_slot, data + struct.pack("<H", checksum(data)))
+    except OSError as e:
+        # the filesystem is read-only while the drive is mounted over USB
+        log.write(f"High scores not saved: {e}")
+        return
+    next_slot = 1 - next_slot
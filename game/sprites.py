@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""The sprite atlas and 16x16 sprite TileGrids."""
+import gc
+from micropython import const
+
+from game.config import SCALE, NATIVE
+from game.display import load_asset, new_tile_grid, tile_index
+
+# Sprite Sheet Coordinates (x, y)
+SPRITE_LIFE = (128, 16) # 8, 1
+SPRITE_BLANK = (144, 16) # 9, 1
+SPRITE_FRUIT_CHERRY = (32, 48) # 3, 2
+SPRITE_FRUIT_STRAWBERRY = (48, 48)
+SPRITE_FRUIT_ORANGE = (64, 48)
+SPRITE_FRUIT_APPLE = (80, 48)
+SPRITE_FRUIT_MELON = (96, 48)
+SPRITE_FRUIT_GALAXIAN = (112, 48)
+SPRITE_FRUIT_BELL = (128, 48)
+SPRITE_FRUIT_KEY = (144, 48)
+
+FRUIT_LEVELS = [
+    SPRITE_FRUIT_CHERRY,     # Level 1
+    SPRITE_FRUIT_STRAWBERRY, # Level 2
+    SPRITE_FRUIT_ORANGE,     # Level 3
+    SPRITE_FRUIT_ORANGE,     # Level 4
+    SPRITE_FRUIT_APPLE,      # Level 5
+    SPRITE_FRUIT_APPLE,      # Level 6
+    SPRITE_FRUIT_MELON,      # Level 7
+    SPRITE_FRUIT_MELON,      # Level 8
+    SPRITE_FRUIT_GALAXIAN,   # Level 9
+    SPRITE_FRUIT_GALAXIAN,   # Level 10
+    SPRITE_FRUIT_BELL,       # Level 11
+    SPRITE_FRUIT_BELL,       # Level 12
+    SPRITE_FRUIT_KEY         # Level 13+
+]
+
+# Regions of sprites.bmp used by the game, as (x, y, columns, rows) of 16x16 frames.
+# build/assets.py packs only these frames, in this order, into images/sprites_atlas.bmp
+# (one frame per 16 pixel row). Add a region here when using a new frame.
+SPRITE_REGIONS = [
+    (0, 0, 14, 1),    # Pac-Man right, closed and death animation
+    (0, 16, 2, 1),    # Pac-Man left
+    (128, 16, 2, 1),  # Life and a blank frame
+    (0, 32, 2, 1),    # Pac-Man up
+    (0, 48, 10, 1),   # Pac-Man down and fruit
+    (0, 64, 8, 4),    # Blinky, Pinky, Inky and Clyde
+    (128, 64, 4, 2),  # Frightened and eyes
+    (0, 128, 4, 1),   # Scores
+]
+SPRITE_SHEET_COLUMNS = const(14) # 16x16 frames per row of sprites.bmp
+
+# The atlas only holds the frames listed in SPRITE_REGIONS, so it fits in RAM
+# on every device and sprite redraws never read from flash. It is the first
+# image given RAM (see ASSET_PRIORITY in game/display.py).
+sprite_sheet, sprite_palette = load_asset("images/sprites_atlas.bmp")
+
+# Atlas frame of each 16x16 frame of sprites.bmp (255 = not in the atlas)
+sprite_frame_map = bytearray(b"\xff" * (SPRITE_SHEET_COLUMNS * 16))
+frame_count = 0
+for region_x, region_y, region_columns, region_rows in SPRITE_REGIONS:
+    for row in range(region_rows):
+        for column in range(region_columns):
+            sprite_frame_map[(region_y // 16 + row) * SPRITE_SHEET_COLUMNS + region_x // 16 + column] = frame_count
+            frame_count += 1
+
+print(f"Sprite atlas: {frame_count} frames")
+
+# Make black transparent for sprites
+sprite_palette.make_transparent(0)
+
+# Sprite atlas is addressed as 16x8 tiles (two per 16x16 sprite)
+SPRITE_TILES_PER_ROW = sprite_sheet.width // (16 * SCALE)
+
+def get_tile_index(px, py):
+    """Convert unscaled sprites.bmp pixel (x, y) to the atlas tile index for 16x8 tile addressing."""
+    return sprite_frame_map[(py // 16) * SPRITE_SHEET_COLUMNS + px // 16] * 2 * SPRITE_TILES_PER_ROW
+
+def new_sprite_grid():
+    """Create a 16x16 sprite TileGrid (1x2 tiles of 16x8) on the sprite atlas."""
+    return new_tile_grid(sprite_sheet, sprite_palette, 1, 2, 16 * SCALE, 8 * SCALE)
+
+def set_sprite_frame(sprite, px, py):
+    """Show the 16x16 sprites.bmp frame at pixel (x, y) in a sprite TileGrid."""
+    base_tile = get_tile_index(px, py)
+    # The halves of a pre-rotated frame are its left and right 8x16 tiles,
+    # at the same indices as the top and bottom ones
+    sprite[0] = base_tile
+    sprite[1] = base_tile + SPRITE_TILES_PER_ROW
+
+# Cell grids address the atlas as 8x8 tiles, so several frames can share one
+# TileGrid at 8 pixel spacing; a frame covers 2x2 cells
+
+# Atlas tile of the top left, top right, bottom left and bottom right cells of
+# a frame, from its first tile. A pre-rotated frame has the top left cell at
+# the bottom left, and so on.
+if NATIVE:
+    CELL_OFFSETS = (2 * SPRITE_TILES_PER_ROW, 0, 2 * SPRITE_TILES_PER_ROW + 1, 1)
+else:
+    CELL_OFFSETS = (0, 1, 2 * SPRITE_TILES_PER_ROW, 2 * SPRITE_TILES_PER_ROW + 1)
+
+def get_cell_index(px, py):
+    """Convert unscaled sprites.bmp pixel (x, y) to the atlas tile index for 8x8 tile addressing."""
+    return sprite_frame_map[(py // 16) * SPRITE_SHEET_COLUMNS + px // 16] * 4 * SPRITE_TILES_PER_ROW
+
+def new_cell_grid(columns, rows):
+    """Create a TileGrid of 8x8 cells on the sprite atlas, all blank."""
+    return new_tile_grid(sprite_sheet, sprite_palette, columns, rows, 8 * SCALE, 8 * SCALE,
+                         default_tile=get_cell_index(*SPRITE_BLANK))
+
+def set_cell_frame(grid, column, row, px, py):
+    """Show the 16x16 sprites.bmp frame at pixel (x, y) in the 2x2 cells from (column, row) of a cell grid."""
+    tile = get_cell_index(px, py)
+    grid[tile_index(grid, column, row)] = tile + CELL_OFFSETS[0]
+    grid[tile_index(grid, column + 1, row)] = tile + CELL_OFFSETS[1]
+    grid[tile_index(grid, column, row + 1)] = tile + CELL_OFFSETS[2]
+    grid[tile_index(grid, column + 1, row + 1)] = tile + CELL_OFFSETS[3]
+
+gc.collect()
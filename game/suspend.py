@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Suspend a game in progress to alarm.sleep_memory and deep sleep.
+
+suspend_game() stores the game in one record and deep sleeps until the
+wake button is pressed (see game/wake.py); boards that cannot wake on it do
+not suspend. Waking is a cold boot: code.py starts over, loads the images and
+the maze as at power on, and resume_game() then puts the game back where it
+was; only the startup jingle and its pause are skipped. The record is:
+
+    magic    4 bytes, b"PMSG"
+    game     GAME: score, lives, level, mode and bonus fruit timers...
+    pacman   PACMAN: position and direction
+    ghosts   4 x GHOST: position, direction, mode and timers
+    dots     DOT_BYTES, one bit per maze cell (see game/players.py)
+    waiting  WAITING and DOT_BYTES, the other player of a two player game
+    checksum uint16, Fletcher-16 of everything before it
+
+Resuming clears the magic, so a reset afterwards starts a new game.
+"""
+import struct
+
+try:
+    import alarm
+except ImportError:
+    alarm = None
+
+from game import log
+from game.controls import WAKE_ALARM
+from game.players import DOT_BYTES, fill_dots, save_dots, restore_dots
+from game.scores import checksum
+
+MAGIC = b"PMSG"
+
+# score, lives, level, dots eaten, mode index, current mode, seconds into the mode,
+# bonus fruit active, bonus fruit timer, ghosts eaten, number of the player playing
+GAME = "<IBBHBBfBHBB"
+# x, y, tile x, tile y, direction, next direction
+PACMAN = "<ffbbBB"
+# x, y, tile x, tile y, direction, mode, in house, house timer, frightened timer, reverse pending
+GHOST = "<ffbbBBBHHB"
+# score, lives, level, dots eaten
+WAITING = "<IBBH"
+
+GAME_AT = len(MAGIC)
+PACMAN_AT = GAME_AT + struct.calcsize(GAME)
+GHOSTS_AT = PACMAN_AT + struct.calcsize(PACMAN)
+DOTS_AT = GHOSTS_AT + 4 * struct.calcsize(GHOST)
+WAITING_AT = DOTS_AT + DOT_BYTES
+WAITING_DOTS_AT = WAITING_AT + struct.calcsize(WAITING)
+RECORD_SIZE = WAITING_DOTS_AT + DOT_BYTES + 2
+
+def available():
+    """The board has sleep memory for a suspended game and a button to wake it."""
+    return alarm is not None and len(alarm.sleep_memory) >= RECORD_SIZE and WAKE_ALARM is not None
+
+def suspend_game(pacman, ghosts, game, wake_alarm, waiting=None):
+    """Store the game and deep sleep until wake_alarm goes off.
+
+    game holds the values listed in GAME, waiting is the Player waiting for
+    their turn in a two player game. Check available() first, this only
+    returns if there is no wake_alarm, without suspending.
+    """
+    if wake_alarm is None:
+        log.write(b"Suspend failed: no wake alarm")
+        return
+    record = bytearray(RECORD_SIZE)
+    record[:GAME_AT] = MAGIC
+    struct.pack_into(GAME, record, GAME_AT, *game)
+    struct.pack_into(PACMAN, record, PACMAN_AT, pacman.x, pacman.y, pacman.tile_x, pacman.tile_y,
+                     pacman.direction, pacman.next_direction)
+    for i, g in enumerate(ghosts):
+        struct.pack_into(GHOST, record, GHOSTS_AT + i * struct.calcsize(GHOST), g.x, g.y, g.tile_x, g.tile_y,
+                         g.direction, g.mode, g.in_house, min(g.house_timer, 0xFFFF), g.frightened_timer,
+                         g.reverse_pending)
+    dots = bytearray(DOT_BYTES)
+    save_dots(dots)
+    record[DOTS_AT:WAITING_AT] = dots
+    if waiting is not None:
+        struct.pack_into(WAITING, record, WAITING_AT, waiting.score, waiting.lives, waiting.level, waiting.dots_eaten)
+        record[WAITING_DOTS_AT:RECORD_SIZE - 2] = waiting.dots
+    struct.pack_into("<H", record, RECORD_SIZE - 2, checksum(record[:-2]))
+    alarm.sleep_memory[0:RECORD_SIZE] = record
+
+    log.write(b"Suspended")
+    log.flush(log.BUFFER_SIZE)
+    alarm.exit_and_deep_sleep_until_alarms(wake_alarm)
+
+def resume_game(pacman, ghosts, players=None):
+    """Restore a suspended game, returns the values passed to suspend_game() as
+    game, or None when there is no suspended game.
+
+    players are the two Players of a two player game, the one waiting for their
+    turn is restored. Call after the game objects are created.
+    """
+    if not available():
+        return None
+    record = bytes(alarm.sleep_memory[0:RECORD_SIZE])
+    if record[:GAME_AT] != MAGIC or checksum(record[:-2]) != struct.unpack_from("<H", record, RECORD_SIZE - 2)[0]:
+        return None
+    alarm.sleep_memory[0:GAME_AT] = bytes(GAME_AT)
+
+    game = struct.unpack_from(GAME, record, GAME_AT)
+    (pacman.x, pacman.y, pacman.tile_x, pacman.tile_y,
+     pacman.direction, pacman.next_direction) = struct.unpack_from(PACMAN, record, PACMAN_AT)
+    pacman.update_sprite_pos()
+    pacman.set_frame(pacman.direction, 0)
+    for i, g in enumerate(ghosts):
+        (g.x, g.y, g.tile_x, g.tile_y, g.direction, g.mode, in_house, g.house_timer, g.frightened_timer,
+         reverse_pending) = struct.unpack_from(GHOST, record, GHOSTS_AT + i * struct.calcsize(GHOST))
+        g.in_house = bool(in_house)
+        g.reverse_pending = bool(reverse_pending)
+        g.update_sprite_pos()
+        g.set_frame(g.direction, 0)
+
+    # items_grid holds a new maze
+    dots = bytearray(DOT_BYTES)
+    fill_dots(dots)
+    restore_dots(dots, record[DOTS_AT:WAITING_AT])
+    if players is not None:
+        waiting = players[game[-1] % 2]
+        waiting.score, waiting.lives, waiting.level, waiting.dots_eaten = struct.unpack_from(WAITING, record, WAITING_AT)
+        waiting.dots[:] = record[WAITING_DOTS_AT:RECORD_SIZE - 2]
+    return game
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+The alarm that wakes the board from a suspended game (see game/suspend.py).
+
+alarm.pin.PinAlarm() refuses a pin that is in use, so the backends make the
+alarm at startup, before they claim their buttons as inputs; by the time the
+board goes into deep sleep code.py has stopped and the pin is free again.
+"""
+try:
+    import alarm
+except ImportError:
+    alarm = None
+
+def wake_alarm(pin):
+    """An alarm for pin pulled low, as a pressed button is, or None if the
+    board cannot wake from deep sleep on it. Call before the pin is claimed."""
+    if alarm is None:
+        return None
+    try:
+        return alarm.pin.PinAlarm(pin, value=False, pull=True)
+    except ValueError as e:
+        print(f"Suspend unavailable, no wake alarm on {pin}: {e}")
+        return None
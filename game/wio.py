@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""Wio Terminal backend: built-in display, 5-way switch, Buttons 1 and 3 and buzzer."""
+import board
+from digitalio import DigitalInOut, Pull
+import pwmio
+
+from game.wake import wake_alarm
+
+# Screen dimensions
+SCREEN_WIDTH = 320
+SCREEN_HEIGHT = 240
+
+display = board.DISPLAY
+
+def switch(pin):
+    """A button input, which reads False while pressed."""
+    button = DigitalInOut(pin)
+    button.switch_to_input(pull=Pull.UP)
+    return button
+
+UP = switch(board.SWITCH_UP)
+DOWN = switch(board.SWITCH_DOWN)
+LEFT = switch(board.SWITCH_LEFT)
+RIGHT = switch(board.SWITCH_RIGHT)
+PRESS = switch(board.SWITCH_PRESS)
+
+# Sound toggle button (Button 1 on top of device)
+BUTTON_1 = switch(board.BUTTON_1)
+
+# Suspend button (Button 3), which also wakes the board from deep sleep if
+# the board can wake on it. The alarm is made before the pin is claimed.
+WAKE_ALARM = wake_alarm(board.BUTTON_3)
+BUTTON_3 = switch(board.BUTTON_3)
+
+# Wio Terminal buzzer is on pin BUZZER (or D0 on some builds)
+try:
+    buzzer = pwmio.PWMOut(board.BUZZER, variable_frequency=True)
+except AttributeError:
+    # Fallback if BUZZER pin not defined
+    try:
+        buzzer = pwmio.PWMOut(board.D0, variable_frequency=True)
+    except:
+        buzzer = None
+        print("No buzzer available")
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""The game's modules import from the repository root, tests/host/ runs code.py with stubbed hardware."""
+import os
+import pickle
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST_RUN = os.path.join(ROOT_DIR, "tests", "host", "run.py")
+
+# The game's code.py would shadow the standard library module of that name,
+# which pdb imports, while the repository root is the working directory
+path = sys.path[:]
+sys.path[:] = [entry for entry in path if os.path.abspath(entry) != ROOT_DIR]
+import code
+sys.path[:] = path
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+def run_host(frames, *args, **settings):
+    """Run code.py on the host in a new process, with settings as in settings.toml."""
+    env = dict(os.environ, **{key: str(value) for key, value in settings.items()})
+    return subprocess.run(
+        [sys.executable, HOST_RUN, "--frames", str(frames), *args],
+        env=env, capture_output=True, text=True, cwd=ROOT_DIR,
+    )
+
+def host_pictures(output, frames, shots, *args, **settings):
+    """The pictures on the display at the frames of shots in a run_host() run,
+    {frame: rows of colors}, saved through the file output."""
+    shot_args = [arg for frame in shots for arg in ("--shot", str(frame))]
+    result = run_host(frames, *args, *shot_args, "--output", str(output), **settings)
+    assert result.returncode == 0, result.stdout[-2000:] + result.stderr
+    with open(output, "rb") as f:
+        return pickle.load(f)
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+The picture on the display, composited from the displayio objects of the stubs
+the way displayio draws them: Groups in order, hidden objects skipped, Group
+scale and position applied to everything in them, and transparent palette
+entries letting what is below show through.
+
+The picture is in the coordinates the game draws in, so for display.rotation
+= 270 it is the portrait view, not the panel. flip_x, flip_y and transpose_xy
+are not used by the game and not supported.
+"""
+import displayio
+
+def composite(display, skip=None):
+    """Rows of 0xRRGGBB colors, None where nothing is drawn. TileGrids for
+    which skip(tile_grid) is true are left out."""
+    if display.rotation in (90, 270):
+        width, height = display.height, display.width
+    else:
+        width, height = display.width, display.height
+    rows = [[None] * width for _ in range(height)]
+    if display.root_group is not None:
+        draw(rows, display.root_group, 0, 0, 1, skip, {})
+    return rows
+
+def tile_runs(bitmap, palette, tile_x, tile_y, tile_width, tile_height, scale):
+    """The opaque runs of each pixel row of a tile, scaled: [(offset, colors)] per row."""
+    tile = []
+    for v in range(tile_height):
+        start = (tile_y + v) * bitmap.width + tile_x
+        runs = []
+        run = None
+        for u, value in enumerate(bitmap.pixels[start:start + tile_width]):
+            if palette.is_transparent(value):
+                run = None
+                continue
+            if run is None:
+                run = (u * scale, [])
+                runs.append(run)
+            run[1].extend([palette[value]] * scale)
+        tile.append(runs)
+    return tile
+
+def draw(rows, item, x, y, scale, skip, tiles):
+    """Draw item with its parent's origin at (x, y) of the picture, scaled by
+    scale. tiles caches tile_runs() for this picture."""
+    if item.hidden:
+        return
+    if isinstance(item, displayio.Group):
+        for child in item:
+            draw(rows, child, x + item.x * scale, y + item.y * scale, scale * item.scale, skip, tiles)
+        return
+    if skip is not None and skip(item):
+        return
+    assert not (item.flip_x or item.flip_y or item.transpose_xy), "not supported"
+    bitmap = item.bitmap
+    palette = item.pixel_shader
+    tile_width = item.tile_width
+    tile_height = item.tile_height
+    tiles_per_row = bitmap.width // tile_width
+    height = len(rows)
+    width = len(rows[0])
+    for cell_y in range(item.height):
+        for cell_x in range(item.width):
+            tile = item[cell_x, cell_y]
+            key = (id(bitmap), id(palette), tile, tile_width, tile_height, scale)
+            if key not in tiles:
+                tiles[key] = tile_runs(bitmap, palette, tile % tiles_per_row * tile_width,
+                                       tile // tiles_per_row * tile_height, tile_width, tile_height, scale)
+            left = x + (item.x + cell_x * tile_width) * scale
+            top = y + (item.y + cell_y * tile_height) * scale
+            for v, runs in enumerate(tiles[key]):
+                if not runs:
+                    continue
+                for py in range(max(top + v * scale, 0), min(top + (v + 1) * scale, height)):
+                    row = rows[py]
+                    for offset, colors in runs:
+                        start = left + offset
+                        low = max(start, 0)
+                        high = min(start + len(colors), width)
+                        if low < high:
+                            row[low:high] = colors[low - start:high - start]
+
+def count_objects(group):
+    """(Groups, TileGrids) in a tree, the objects a refresh walks, hidden ones included."""
+    groups = 1
+    tile_grids = 0
+    for item in group:
+        if isinstance(item, displayio.Group):
+            inner_groups, inner_tile_grids = count_objects(item)
+            groups += inner_groups
+            tile_grids += inner_tile_grids
+        else:
+            tile_grids += 1
+    return groups, tile_grids
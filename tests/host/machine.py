@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+The simulated board behind the stubs: the frame counter, the clock and the
+buttons.
+
+Time only moves when the display refreshes, by one 60 Hz frame, so a run does
+the same thing on every host however fast it is. Each reading of the clock
+adds a tenth of a microsecond, so the time spent in a frame is never zero.
+The 5-way switch is held in a random direction that changes every 37 frames,
+and is pressed in for a few frames every 200, which starts a new game after
+game over. Buttons 1 and 3 are never pressed.
+"""
+import random
+
+FPS = 60
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+class Stop(Exception):
+    """Raised by display.refresh() once the frames asked for have been shown."""
+
+frames = 0
+frame_limit = 3000
+readings = 0
+on_refresh = [] # called with the frame number before each refresh
+
+rng = random.Random(1)
+held = "UP"
+
+def monotonic():
+    global readings
+    readings += 1
+    return frames / FPS + readings * 1e-7
+
+def refresh():
+    """Show a frame, raising Stop after the last one."""
+    global frames, held
+    for callback in on_refresh:
+        callback(frames)
+    frames += 1
+    if frames % 37 == 0:
+        held = rng.choice(DIRECTIONS)
+    if frames >= frame_limit:
+        raise Stop()
+    return True
+
+def pin_value(pin):
+    """The level of a button input, False while it is pressed."""
+    if pin in DIRECTIONS:
+        return pin != held
+    if pin == "PRESS":
+        return frames % 200 > 5
+    return True
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""
+Run code.py on a host Python for a number of frames, with the CircuitPython
+modules it uses replaced by the stubs in stubs/ and the board simulated by
+machine.py.
+
+    python tests/host/run.py --frames 3000
+    PACMAN_AUTOPILOT=1 PACMAN_AUDIT=1 python tests/host/run.py --fruit-jam
+    python tests/host/run.py --frames 600 --shot 100 --shot 500 -o shots.pickle
+
+Settings are read from the environment as from settings.toml, numbers as
+ints. The random numbers are seeded, and time is simulated, so sleeping returns at once and the frame rate and
+refresh times printed are those of an ideal 60 Hz display. code.py runs in
+this process and can be inspected once run() returns, through sys.modules;
+with PACMAN_AUDIT the audit reports once more after the last frame. --shot
+saves the picture on the display before the refresh of a frame (see
+compose.py), pickled as {frame: rows}; actors placed with different sub-pixel
+precision can be left out with --no-actors.
+"""
+import argparse
+import collections
+import gc
+import os
+import pickle
+import random
+import runpy
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(os.path.dirname(HOST_DIR))
+
+sys.path[:0] = [os.path.join(HOST_DIR, "stubs"), HOST_DIR]
+import board
+import machine
+from compose import composite, count_objects
+
+Uname = collections.namedtuple("Uname", "sysname nodename release version machine")
+
+class SerialConsole:
+    """sys.stdin of the Fruit Jam, nothing is typed."""
+    def read(self, count):
+        return ""
+
+def getenv(key, default=None):
+    """os.getenv() of CircuitPython, which returns settings.toml numbers as ints."""
+    value = os.environ.get(key, default)
+    if isinstance(value, str) and value.lstrip("-").isdigit():
+        return int(value)
+    return value
+
+def setup(fruit_jam=False):
+    """Replace what differs between CPython and CircuitPython."""
+    time.monotonic = machine.monotonic
+    time.monotonic_ns = lambda: int(machine.monotonic() * 1e9)
+    time.sleep = lambda seconds: None
+    random.seed(0)
+    os.getenv = getenv
+    # Enough for every image to be loaded into RAM
+    gc.mem_free = lambda: 1 << 20
+    if fruit_jam:
+        os.uname = lambda: Uname("rp2350", "rp2350", "10.0.0", "10.0.0", "Adafruit Fruit Jam with rp2350b")
+        sys.stdin = SerialConsole()
+
+def run(frames, fruit_jam=False, root=ROOT_DIR):
+    """Run code.py until it has shown frames frames."""
+    setup(fruit_jam)
+    machine.frame_limit = frames
+    os.chdir(root)
+    sys.path.insert(0, root)
+    try:
+        runpy.run_path("code.py", run_name="__main__")
+    except machine.Stop:
+        pass
+
+def actor_sprite(tile_grid):
+    """A TileGrid showing one 16x16 frame of the sprite atlas, as the actors do."""
+    from game.config import SCALE
+    from game.sprites import sprite_sheet
+    return tile_grid.bitmap is sprite_sheet and \
+        tile_grid.width * tile_grid.tile_width * tile_grid.height * tile_grid.tile_height == (16 * SCALE) ** 2
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game on the host with stubbed hardware")
+    parser.add_argument("-f", "--frames", type=int, default=3000, help="frames to run")
+    parser.add_argument("--fruit-jam", action="store_true", help="run as the Fruit Jam instead of the Wio Terminal")
+    parser.add_argument("-r", "--root", default=ROOT_DIR, help="directory of code.py")
+    parser.add_argument("--shot", type=int, action="append", default=[], metavar="FRAME",
+                        help="save the picture on the display at this frame")
+    parser.add_argument("-o", "--output", default="shots.pickle", help="file for the saved pictures")
+    parser.add_argument("--no-actors", action="store_true",
+                        help="leave Pac-Man, the ghosts and the bonus fruit out of the pictures")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output)
+    shots = {}
+    if args.shot:
+        def shoot(frame):
+            if frame in args.shot:
+                shots[frame] = composite(board.DISPLAY, actor_sprite if args.no_actors else None)
+        machine.on_refresh.append(shoot)
+    run(args.frames, args.fruit_jam, os.path.abspath(args.root))
+    print(f"Host: ran {machine.frames} frames")
+    groups, tile_grids = count_objects(board.DISPLAY.root_group)
+    print(f"Host: displaying {groups} groups and {tile_grids} tile grids")
+    if args.shot:
+        with open(output, "wb") as f:
+            pickle.dump(shots, f)
+        print(f"Host: saved {len(shots)} pictures to {args.output}")
+    # PACMAN_AUDIT reports at the end of a level or game, and on the last frame
+    if "game.audit" in sys.modules:
+        from game import audit, log
+        try:
+            audit.report()
+        finally:
+            log.flush(log.BUFFER_SIZE)
+
+if __name__ == "__main__":
+    main()
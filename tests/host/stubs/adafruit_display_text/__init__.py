@@ -0,0 +1 @@
+"""adafruit_display_text for the host."""
@@ -0,0 +1,56 @@
+"""adafruit_display_text.label for the host: the text is drawn into one bitmap,
+laid out like the library with the baseline half the font ascent below y."""
+import displayio
+
+def ascent_descent(font):
+    glyphs = [font.get_glyph(ord(c)) for c in "M j'"]
+    glyphs = [glyph for glyph in glyphs if glyph]
+    ascent = max(glyph.height + glyph.dy for glyph in glyphs)
+    descent = max(max(-glyph.dy for glyph in glyphs), 0)
+    return ascent, descent
+
+class Label(displayio.Group):
+    def __init__(self, font, *, text="", color=0xFFFFFF, scale=1):
+        super().__init__(scale=scale)
+        self.font = font
+        self.ascent, self.descent = ascent_descent(font)
+        self.width = sum(font.get_glyph(ord(c)).shift_x for c in text)
+        self.height = self.ascent + self.descent
+        palette = displayio.Palette(2)
+        palette[1] = color
+        palette.make_transparent(0)
+        bitmap = displayio.Bitmap(max(self.width, 1), self.height, 2)
+        self.append(displayio.TileGrid(bitmap, pixel_shader=palette, y=self.ascent // 2 - self.ascent))
+        self.anchor_point = None
+        self._anchored_position = None
+        self.text = text
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        self._text = text
+        bitmap = self[0].bitmap
+        bitmap.fill(0)
+        left = 0
+        for c in text:
+            glyph = self.font.get_glyph(ord(c))
+            top = self.ascent - glyph.height - glyph.dy
+            for y in range(glyph.height):
+                for x in range(glyph.width):
+                    if glyph.bitmap[glyph.tile_index * glyph.width + x, y] and left + glyph.dx + x < bitmap.width:
+                        bitmap[left + glyph.dx + x, top + y] = 1
+            left += glyph.shift_x
+
+    @property
+    def anchored_position(self):
+        return self._anchored_position
+
+    @anchored_position.setter
+    def anchored_position(self, position):
+        self._anchored_position = position
+        self.x = position[0] - int(self.anchor_point[0] * self.width * self.scale)
+        self.y = position[1] - int(self.anchor_point[1] * self.height * self.scale) \
+            - (self.ascent // 2 - self.ascent) * self.scale
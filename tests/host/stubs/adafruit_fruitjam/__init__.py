@@ -0,0 +1,2 @@
+"""adafruit_fruitjam for the host."""
+from adafruit_fruitjam import peripherals
@@ -0,0 +1,25 @@
+"""adafruit_fruitjam.peripherals for the host: the display modes, the DAC and the audio output."""
+import board
+import supervisor
+
+VALID_DISPLAY_SIZES = {(360, 200), (720, 400), (320, 240), (640, 480)}
+
+class DAC:
+    sample_rate = 22050
+
+class AudioOut:
+    def play(self, sample, *, loop=False):
+        self.sample = sample
+
+    def stop(self):
+        pass
+
+class Peripherals:
+    def __init__(self, *, safe_volume_limit=0.75, **settings):
+        self.dac = DAC()
+        self.audio = AudioOut()
+
+def request_display_config(width, height):
+    board.DISPLAY.width = width
+    board.DISPLAY.height = height
+    supervisor.runtime.display = board.DISPLAY
@@ -0,0 +1,6 @@
+"""audiocore for the host."""
+
+class RawSample:
+    def __init__(self, buffer, *, channel_count=1, sample_rate=8000):
+        self.buffer = buffer
+        self.sample_rate = sample_rate
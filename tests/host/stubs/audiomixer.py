@@ -0,0 +1,18 @@
+"""audiomixer for the host, the voices remember what they play."""
+
+class MixerVoice:
+    def __init__(self):
+        self.level = 1.0
+        self.playing = False
+        self.sample = None
+
+    def play(self, sample, *, loop=False):
+        self.sample = sample
+        self.playing = True
+
+    def stop(self):
+        self.playing = False
+
+class Mixer:
+    def __init__(self, *, voice_count=2, **settings):
+        self.voice = tuple(MixerVoice() for _ in range(voice_count))
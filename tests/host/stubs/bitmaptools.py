@@ -0,0 +1,14 @@
+"""bitmaptools for the host."""
+
+def readinto(bitmap, file, bits_per_pixel, element_size=1, reverse_pixels_in_element=False,
+             swap_bytes_in_element=False, reverse_rows=False):
+    """Read rows of packed pixels, most significant bits first, padded to element_size bytes."""
+    row_bytes = (bitmap.width * bits_per_pixel + element_size * 8 - 1) // (element_size * 8) * element_size
+    per_byte = 8 // bits_per_pixel
+    mask = (1 << bits_per_pixel) - 1
+    for row in range(bitmap.height):
+        data = file.read(row_bytes)
+        y = bitmap.height - 1 - row if reverse_rows else row
+        for x in range(bitmap.width):
+            shift = 8 - bits_per_pixel * (x % per_byte + 1)
+            bitmap[x, y] = data[x // per_byte] >> shift & mask
@@ -0,0 +1,28 @@
+"""board for the host: pin names and the built-in display of the Wio Terminal."""
+import machine
+
+SWITCH_UP = "UP"
+SWITCH_DOWN = "DOWN"
+SWITCH_LEFT = "LEFT"
+SWITCH_RIGHT = "RIGHT"
+SWITCH_PRESS = "PRESS"
+BUTTON_1 = "BUTTON_1"
+BUTTON_2 = "BUTTON_2"
+BUTTON_3 = "BUTTON_3"
+BUTTON1 = "BUTTON1"
+BUZZER = "BUZZER"
+D0 = "D0"
+
+class Display:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.rotation = 0
+        self.auto_refresh = True
+        self.brightness = 1.0
+        self.root_group = None
+
+    def refresh(self, target_frames_per_second=None, minimum_frames_per_second=0):
+        return machine.refresh()
+
+DISPLAY = Display(320, 240)
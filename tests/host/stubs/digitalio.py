@@ -0,0 +1,20 @@
+"""digitalio for the host, inputs read the buttons of the simulated board."""
+import machine
+
+class Pull:
+    UP = 1
+    DOWN = 2
+
+class DigitalInOut:
+    def __init__(self, pin):
+        self.pin = pin
+
+    def switch_to_input(self, pull=None):
+        pass
+
+    @property
+    def value(self):
+        return machine.pin_value(self.pin)
+
+    def deinit(self):
+        pass
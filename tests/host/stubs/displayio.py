@@ -0,0 +1,105 @@
+"""displayio for the host: the objects hold their contents so they can be checked, nothing is drawn."""
+import struct
+
+class Palette:
+    def __init__(self, color_count):
+        self.colors = [0] * color_count
+        self.transparent = set()
+
+    def __setitem__(self, index, color):
+        self.colors[index] = color
+
+    def __getitem__(self, index):
+        return self.colors[index]
+
+    def __len__(self):
+        return len(self.colors)
+
+    def make_transparent(self, index):
+        self.transparent.add(index)
+
+    def make_opaque(self, index):
+        self.transparent.discard(index)
+
+    def is_transparent(self, index):
+        return index in self.transparent
+
+class Bitmap:
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        self.pixels[index] = value
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        return self.pixels[index]
+
+    def fill(self, value):
+        self.pixels[:] = bytes([value]) * len(self.pixels)
+
+class OnDiskBitmap(Bitmap):
+    """An indexed BMP, read whole instead of streamed."""
+    def __init__(self, file):
+        import bitmaptools
+        if isinstance(file, str):
+            file = open(file, "rb")
+        header = file.read(54)
+        data_start, info_size, width, height = struct.unpack_from("<IIii", header, 10)
+        bits = struct.unpack_from("<H", header, 28)[0]
+        colors = struct.unpack_from("<I", header, 46)[0] or 1 << bits
+        super().__init__(width, abs(height), colors)
+        file.seek(14 + info_size)
+        self.pixel_shader = Palette(colors)
+        for i in range(colors):
+            blue, green, red, _ = file.read(4)
+            self.pixel_shader[i] = red << 16 | green << 8 | blue
+        file.seek(data_start)
+        bitmaptools.readinto(self, file, bits, element_size=4, reverse_pixels_in_element=True,
+                             reverse_rows=height > 0)
+
+class TileGrid:
+    def __init__(self, bitmap, *, pixel_shader, width=1, height=1, tile_width=None, tile_height=None,
+                 default_tile=0, x=0, y=0):
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.width = width
+        self.height = height
+        self.tile_width = tile_width or bitmap.width
+        self.tile_height = tile_height or bitmap.height
+        self.tile_count = bitmap.width // self.tile_width * (bitmap.height // self.tile_height)
+        self.tiles = [default_tile] * (width * height)
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self.flip_x = False
+        self.flip_y = False
+        self.transpose_xy = False
+
+    def __setitem__(self, index, tile):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        if not 0 <= tile < self.tile_count:
+            raise ValueError(f"tile {tile} out of range")
+        self.tiles[index] = tile
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        return self.tiles[index]
+
+class Group(list):
+    def __init__(self, *, scale=1, x=0, y=0):
+        super().__init__()
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+
+def release_displays():
+    pass
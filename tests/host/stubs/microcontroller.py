@@ -0,0 +1,2 @@
+"""microcontroller for the host: nvm is a bytearray of the size the Wio Terminal has."""
+nvm = bytearray(256)
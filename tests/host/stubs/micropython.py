@@ -0,0 +1,4 @@
+"""micropython for the host."""
+
+def const(value):
+    return value
@@ -0,0 +1,6 @@
+"""pwmio for the host, the buzzer is silent."""
+
+class PWMOut:
+    def __init__(self, pin, *, duty_cycle=0, frequency=500, variable_frequency=False):
+        self.duty_cycle = duty_cycle
+        self.frequency = frequency
@@ -0,0 +1,15 @@
+"""supervisor for the host, ticks_ms() follows the clock of the simulated board."""
+import machine
+
+class Runtime:
+    serial_connected = True
+    serial_bytes_available = 0
+    display = None
+
+runtime = Runtime()
+
+def ticks_ms():
+    return int(machine.monotonic() * 1000) & ((1 << 29) - 1)
+
+def reload():
+    pass
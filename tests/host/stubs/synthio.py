@@ -0,0 +1,27 @@
+"""synthio for the host, the synthesizer only tracks the notes pressed."""
+
+class Envelope:
+    def __init__(self, **settings):
+        self.__dict__.update(settings)
+
+class Note:
+    def __init__(self, *, frequency, **settings):
+        self.frequency = frequency
+        self.__dict__.update(settings)
+
+class Synthesizer:
+    def __init__(self, **settings):
+        self.pressed = []
+
+    def press(self, note):
+        self.pressed.append(note)
+
+    def release(self, note):
+        if note in self.pressed:
+            self.pressed.remove(note)
+
+    def release_all(self):
+        self.pressed.clear()
+
+    def release_all_then_press(self, note):
+        self.pressed[:] = [note]
@@ -0,0 +1,38 @@
+"""terminalio for the host: FONT is a fixed width font of blocky glyphs 6 pixels
+wide, made up from the character codes."""
+import displayio
+
+class Glyph:
+    def __init__(self, bitmap, tile_index, width, height, dx, dy, shift_x, shift_y):
+        self.bitmap = bitmap
+        self.tile_index = tile_index
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        self.shift_y = shift_y
+
+class BuiltinFont:
+    """Glyphs 5x7 on a baseline 2 pixels above the bottom of a 6x12 cell, each
+    pixel set from a bit of the character code so every glyph differs."""
+    FIRST = 32
+    LAST = 126
+
+    def __init__(self):
+        count = self.LAST - self.FIRST + 1
+        self.bitmap = displayio.Bitmap(5 * count, 7, 2)
+        for code in range(self.FIRST, self.LAST + 1):
+            for i in range(35):
+                if code * (i + 7) >> i % 7 & 1:
+                    self.bitmap[(code - self.FIRST) * 5 + i % 5, i // 5] = 1
+
+    def get_bounding_box(self):
+        return 6, 12
+
+    def get_glyph(self, code):
+        if not self.FIRST <= code <= self.LAST:
+            return None
+        return Glyph(self.bitmap, code - self.FIRST, 5, 7, 0, 0, 6, 0)
+
+FONT = BuiltinFont()
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""Frames spent playing allocate nothing, audited on the host with logging on (see game/audit.py)."""
+import importlib
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+from conftest import ROOT_DIR, run_host
+
+@pytest.mark.parametrize("device", ["wio", "fruit-jam"])
+def test_frames_spent_playing_allocate_nothing(device):
+    args = ["--fruit-jam"] if device == "fruit-jam" else []
+    result = run_host(1500, *args, PACMAN_AUTOPILOT=1, PACMAN_AUDIT=1)
+    assert result.returncode == 0, result.stdout[-2000:] + result.stderr
+    lines = [line for line in result.stdout.splitlines() if line.startswith("Audit:")]
+    assert len(lines) >= 5
+    for line in lines:
+        assert " allocated 0B in 0 of " in line, line
+    assert " of 0 frames" not in lines[-1]
+
+@pytest.fixture
+def audit_module(monkeypatch):
+    """Import game.audit afresh on the host, stopping tracemalloc afterwards."""
+    monkeypatch.syspath_prepend(os.path.join(ROOT_DIR, "tests", "host", "stubs"))
+    monkeypatch.delitem(sys.modules, "game.audit", raising=False)
+    yield importlib.import_module("game.audit")
+    sys.modules.pop("game.audit", None)
+    tracemalloc.stop()
+
+def test_memory_freed_within_a_phase_counts(audit_module):
+    audit = audit_module
+    audit.start(True)
+    audit.mark(audit.INPUT)
+    garbage = bytes(1000)
+    del garbage
+    audit.mark(audit.PACMAN)
+    audit.end(True)
+    assert audit.allocated[audit.INPUT] == 0
+    assert audit.allocated[audit.PACMAN] >= 900
+    with pytest.raises(RuntimeError):
+        audit.report()
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""The ring buffer of game/log.py."""
+import pytest
+
+from game import log
+
+@pytest.fixture
+def empty_log():
+    log.head = log.size = log.dropped = 0
+    yield log
+    log.head = log.size = log.dropped = 0
+
+def queued():
+    return bytes(log.buffer[(log.head + i) % log.BUFFER_SIZE] for i in range(log.size))
+
+def test_text_and_number(empty_log):
+    log.write(b"ATE GHOST ", 1600)
+    log.write(b"Score: ", 0)
+    log.write(b"Sound: OFF")
+    log.write("Level 2")
+    log.write(b"Offset ", -7)
+    assert queued() == b"ATE GHOST 1600\nScore: 0\nSound: OFF\nLevel 2\nOffset -7\n"
+
+def test_wraps_around(empty_log):
+    log.head = log.BUFFER_SIZE - 5
+    log.write(b"Mode: ", 123456789)
+    assert queued() == b"Mode: 123456789\n"
+
+def test_drops_what_does_not_fit(empty_log, capsys):
+    message = b"x" * 100
+    for _ in range(log.BUFFER_SIZE // 101 + 1):
+        log.write(message)
+    assert log.dropped == 1
+    # The count is queued once there is room for it
+    log.flush(log.BUFFER_SIZE)
+    log.flush(log.BUFFER_SIZE)
+    out = capsys.readouterr().out
+    assert out.count("x" * 100) == log.BUFFER_SIZE // 101
+    assert out.endswith("\nLog: messages dropped: 1\n")
+    assert log.size == 0
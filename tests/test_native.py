@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""PACMAN_NATIVE draws the same picture as display.rotation = 270, turned onto
+the panel (see game/display.py)."""
+import pytest
+
+from conftest import host_pictures
+
+# On the Wio Terminal the autopilot loses a life at frames 1487, 2571 and
+# 3312, and the game is over at 3400
+FRAMES = 3450
+SHOTS = (60, 700, 1520, 2600, 3400)
+
+def turned_back(rows):
+    """The portrait view of a picture drawn at the native rotation: view (x, y)
+    is drawn at display (y, view width - 1 - x)."""
+    view_width = len(rows)
+    return [[rows[view_width - 1 - x][y] for x in range(view_width)] for y in range(len(rows[0]))]
+
+@pytest.mark.parametrize("device", ["wio", "fruit-jam-2x"])
+def test_native_matches_rotated(device, tmp_path):
+    if device == "wio":
+        args = []
+        settings = dict(PACMAN_AUTOPILOT=1)
+    else:
+        # A portrait 640x480 display draws at 2x
+        args = ["--fruit-jam"]
+        settings = dict(CIRCUITPY_DISPLAY_WIDTH=640, PACMAN_PORTRAIT=1, PACMAN_AUTOPILOT=1)
+    rotated = host_pictures(tmp_path / "rotated.pickle", FRAMES, SHOTS, *args, **settings)
+    native = host_pictures(tmp_path / "native.pickle", FRAMES, SHOTS, *args, PACMAN_NATIVE=1, **settings)
+    assert sorted(native) == list(SHOTS)
+    for frame in SHOTS:
+        assert len(native[frame]) < len(native[frame][0]), "not drawn at the native rotation"
+        assert turned_back(native[frame]) == rotated[frame], f"frame {frame}"
@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""Prescaled 2x images draw the same picture as scaling the display group (see
+game/config.py). The actors are left out: prescaled, they are placed to the half
+pixel, with group scaling to the whole pixel."""
+from conftest import host_pictures
+
+FRAMES = 1300
+SHOTS = (60, 400, 1200)
+
+def test_prescaled_matches_group_scale(tmp_path):
+    # A portrait 640x480 display is twice the layout in both directions
+    settings = dict(CIRCUITPY_DISPLAY_WIDTH=640, PACMAN_PORTRAIT=1, PACMAN_AUTOPILOT=1)
+    prescaled = host_pictures(tmp_path / "prescaled.pickle", FRAMES, SHOTS, "--fruit-jam", "--no-actors", **settings)
+    grouped = host_pictures(tmp_path / "grouped.pickle", FRAMES, SHOTS, "--fruit-jam", "--no-actors",
+                             PACMAN_GROUP_SCALE=1, **settings)
+    assert sorted(prescaled) == list(SHOTS)
+    for frame in SHOTS:
+        assert prescaled[frame] == grouped[frame], f"frame {frame}"
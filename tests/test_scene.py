@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""The scene stays a few display objects for display.refresh() to walk (see game/display.py)."""
+import re
+
+import pytest
+
+from conftest import run_host
+
+# The root group, the static and dynamic layers, and the HIGH SCORE and 1UP
+# Labels. Before the HUD and pellets were consolidated the root group held 22
+# TileGrids.
+MAX_GROUPS = 5
+MAX_TILE_GRIDS = 13
+
+@pytest.mark.parametrize("device", ["wio", "fruit-jam"])
+def test_few_display_objects(device):
+    args = ["--fruit-jam"] if device == "fruit-jam" else []
+    result = run_host(600, *args, PACMAN_AUTOPILOT=1)
+    assert result.returncode == 0, result.stdout[-2000:] + result.stderr
+    groups, tile_grids = map(int, re.search(r"displaying (\d+) groups and (\d+) tile grids", result.stdout).groups())
+    assert groups <= MAX_GROUPS
+    assert tile_grids <= MAX_TILE_GRIDS
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""The high score table of game/scores.py in microcontroller.nvm."""
+import importlib
+import os
+import sys
+
+import pytest
+
+from conftest import ROOT_DIR
+
+STUBS_DIR = os.path.join(ROOT_DIR, "tests", "host", "stubs")
+
+@pytest.fixture
+def scores_module(monkeypatch):
+    """Import game.scores afresh with the settings given, over the stub nvm."""
+    def load(**settings):
+        monkeypatch.syspath_prepend(STUBS_DIR)
+        monkeypatch.setattr(os, "getenv", lambda key, default=None: settings.get(key, default))
+        for name in ("microcontroller", "game.scores"):
+            monkeypatch.delitem(sys.modules, name, raising=False)
+        return importlib.import_module("game.scores")
+    yield load
+    sys.modules.pop("game.scores", None)
+    sys.modules.pop("microcontroller", None)
+
+# settings.toml numbers come back as ints, quoted values as strings
+@pytest.mark.parametrize("offset", [64, "64"])
+def test_nvm_offset(scores_module, offset):
+    scores = scores_module(PACMAN_NVM_OFFSET=offset)
+    assert scores.nvm is not None
+    assert scores.NVM_OFFSET == 64
+    scores.save_scores([3000, 1200])
+    assert scores.nvm[:64] == bytes(64)
+    assert scores.nvm[64:68] == scores.MAGIC
+    assert scores.load_scores() == [3000, 1200]
+
+def test_offset_past_the_end_falls_back_to_the_file(scores_module):
+    scores = scores_module(PACMAN_NVM_OFFSET="250")
+    assert scores.nvm is None
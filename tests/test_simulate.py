@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2025 Sean Carolan (@scarolan)
+#
+# SPDX-License-Identifier: MIT
+"""The many-worlds simulator follows the game's own rules (see build/simulate.py --check)."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT_DIR
+
+SIMULATE = os.path.join(ROOT_DIR, "build", "simulate.py")
+
+@pytest.mark.parametrize("policy", ["autopilot", "random"])
+def test_simulator_matches_the_game(policy):
+    pytest.importorskip("numpy")
+    # One seed for 360 frames, six seconds of game time
+    result = subprocess.run(
+        [sys.executable, SIMULATE, "--check", "1", "--minutes", "0.1", "--policy", policy],
+        capture_output=True, text=True, cwd=ROOT_DIR,
+    )
+    assert result.returncode == 0, result.stdout[-2000:] + result.stderr
+    assert "Consistent with game/actors.py over 360 frames" in result.stdout